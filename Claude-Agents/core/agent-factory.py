@@ -4,12 +4,20 @@ Dynamically create and deploy specialized agents for any project
 Part of Claude-Agents Framework
 """
 
-import yaml
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from string import Template
 
 
+# cli.py loads this file by path, so core/ may not be on sys.path yet
+if str(Path(__file__).parent) not in sys.path:
+    sys.path.insert(0, str(Path(__file__).parent))
+from core_modules import load_core_module
+
+yaml_io = load_core_module("yaml_io", "yaml-io.py")
+
+
 class AgentFactory:
     """
     Factory for dynamically creating specialized agents based on project needs.
@@ -72,8 +80,7 @@ class AgentFactory:
         }
 
         config_path = output_dir / "config.yaml"
-        with open(config_path, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        yaml_io.dump_file(config, config_path, default_flow_style=False, sort_keys=False)
 
         # Create prompt.md from template
         prompt_path = output_dir / "prompt.md"
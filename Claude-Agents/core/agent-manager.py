@@ -4,10 +4,251 @@ Handles agent lifecycle, configuration loading, and orchestration
 Part of Claude-Agents Framework
 """
 
-import yaml
+import mmap
 import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+
+# cli.py loads this file by path, so core/ may not be on sys.path yet
+if str(Path(__file__).parent) not in sys.path:
+    sys.path.insert(0, str(Path(__file__).parent))
+from core_modules import load_core_module
+
+yaml_io = load_core_module("yaml_io", "yaml-io.py")
+file_watcher = load_core_module("file_watcher", "file-watcher.py")
+
+
+# Compiled registry file, kept next to the agents directory (not inside it:
+# writing it would change the directory mtime the registry uses to notice
+# added and removed agents). "{dir}" is the agents directory's name.
+REGISTRY_FILE = ".{dir}-registry.pickle"
+
+# Bump when the registry layout changes so old files are rebuilt
+REGISTRY_VERSION = 2
+
+# Passed to Agent when the prompt template should be read from disk on first use
+# (and held by Agent._prompt while it is unloaded)
+_READ_PROMPT = object()
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def registry_path(agents_dir: Path) -> Path:
+    """Default compiled registry file for an agents directory."""
+    agents_dir = Path(agents_dir).absolute()
+    return agents_dir.parent / REGISTRY_FILE.format(dir=agents_dir.name)
+
+
+class AgentRegistry:
+    """
+    Compiled index of every agent's config.
+
+    The index is a single pickle file next to the agents directory holding
+    each agent's parsed config.yaml together with the file's mtime and size. Prompt text isn't
+    kept - agents read prompt.md on first use (see Agent), so a process
+    holding the registry doesn't hold every prompt. An entry is only
+    recompiled when its config.yaml changes, and the agent list is only
+    rescanned when the agents directory itself changes (an agent added,
+    removed or renamed), so listing and loading agents costs one file read
+    instead of a YAML parse per agent.
+
+    Deleting only an agent's config.yaml (keeping its folder) isn't seen
+    by agent_names() until the directory changes or rebuild() is called;
+    loading that agent still fails as it should.
+    """
+
+    def __init__(self, agents_dir: Path, registry_file: Optional[Path] = None):
+        """
+        Args:
+            agents_dir: Directory holding one folder per agent
+            registry_file: Compiled registry (defaults to .<agents dir name>-registry.pickle
+                next to agents_dir)
+        """
+        self.agents_dir = Path(agents_dir)
+        self.registry_file = Path(registry_file) if registry_file else registry_path(self.agents_dir)
+        self._data: Optional[Dict] = None
+        # Shared by load_agents() and the hot-reload watcher thread
+        self._lock = threading.RLock()
+
+    def _load(self) -> Dict:
+        """Registry contents, read from disk on first use."""
+        if self._data is None:
+            data = None
+            try:
+                with open(self.registry_file, 'rb') as f:
+                    data = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+                pass
+
+            if not isinstance(data, dict) or data.get("version") != REGISTRY_VERSION:
+                data = self._empty()
+            self._data = data
+        return self._data
+
+    @staticmethod
+    def _empty() -> Dict:
+        """Registry with no agents compiled yet."""
+        return {"version": REGISTRY_VERSION, "dir_stamp": None, "agents": {}, "other_dirs": []}
+
+    def save(self) -> None:
+        """Write the registry atomically (skipped if the directory is gone)."""
+        if self._data is None or not self.agents_dir.exists():
+            return
+
+        temp_file = self.registry_file.with_name(f"{self.registry_file.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_file, 'wb') as f:
+                pickle.dump(self._data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.registry_file)
+        except OSError:
+            # A read-only agents directory just means no compiled registry
+            temp_file.unlink(missing_ok=True)
+
+    def _compile(self, agent_name: str, config_stamp: Tuple) -> Dict:
+        """Parse an agent's config.yaml into a registry entry."""
+        with open(self.agents_dir / agent_name / "config.yaml", 'r') as f:
+            config = yaml_io.load(f)
+
+        return {"config_stamp": config_stamp, "config": config}
+
+    def _entry(self, agent_name: str) -> Optional[Dict]:
+        """
+        Up-to-date entry for an agent, recompiled if its files changed.
+
+        Returns:
+            The entry, or None if the agent has no config.yaml
+        """
+        agents = self._load()["agents"]
+        agent_path = self.agents_dir / agent_name
+
+        config_stamp = _file_stamp(agent_path / "config.yaml")
+        if config_stamp is None:
+            agents.pop(agent_name, None)
+            return None
+
+        entry = agents.get(agent_name)
+        if not self._is_current(entry, config_stamp):
+            entry = self._compile(agent_name, config_stamp)
+            agents[agent_name] = entry
+        return entry
+
+    @staticmethod
+    def _is_current(entry: Optional[Dict], config_stamp: Tuple) -> bool:
+        """Whether an entry was compiled from config.yaml as it is now."""
+        return entry is not None and entry["config_stamp"] == config_stamp
+
+    def agent_names(self) -> List[str]:
+        """Names of all agents, rescanning the directory only if it changed."""
+        with self._lock:
+            data = self._load()
+            dir_stamp = _file_stamp(self.agents_dir)
+            if dir_stamp is None:
+                return []
+
+            if data["dir_stamp"] != dir_stamp:
+                names = [item.name for item in self.agents_dir.iterdir() if item.is_dir()]
+            elif any((self.agents_dir / name / "config.yaml").exists() for name in data["other_dirs"]):
+                # A folder without a config.yaml has since become an agent
+                names = list(data["agents"]) + data["other_dirs"]
+            else:
+                return list(data["agents"])
+
+            agents = data["agents"]
+            data["agents"] = {name: agents.get(name) for name in names}
+            for name in names:
+                try:
+                    self._entry(name)
+                except (OSError, yaml_io.YAMLError, UnicodeDecodeError):
+                    # Listed anyway; load_agent() reports the error
+                    data["agents"][name] = None
+            data["other_dirs"] = [name for name in names if name not in data["agents"]]
+            data["dir_stamp"] = dir_stamp
+            self.save()
+
+            return list(data["agents"])
+
+    def get(self, agent_name: str) -> Optional[Dict]:
+        """
+        Config of an agent.
+
+        Returns:
+            The parsed config.yaml, or None if the agent has none
+        """
+        with self._lock:
+            agents = self._load()["agents"]
+            before = agents.get(agent_name)
+            entry = self._entry(agent_name)
+            if entry is not before:
+                self.save()
+            return entry["config"] if entry is not None else None
+
+    def get_many(self, agent_names: List[str], max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Configs of several agents, compiling stale entries concurrently
+        and saving the registry once.
+
+        Args:
+            agent_names: Agents to look up
+            max_workers: Threads compiling stale entries (ThreadPoolExecutor default if None)
+
+        Returns:
+            Dict of agent name to its config, None if the agent has no
+            config.yaml, or the exception compiling it raised
+        """
+        with self._lock:
+            agents = self._load()["agents"]
+            results: Dict[str, Any] = {}
+            stale: Dict[str, Tuple] = {}
+
+            for name in agent_names:
+                config_stamp = _file_stamp(self.agents_dir / name / "config.yaml")
+                if config_stamp is None:
+                    agents.pop(name, None)
+                    results[name] = None
+                    continue
+
+                entry = agents.get(name)
+                if self._is_current(entry, config_stamp):
+                    results[name] = entry["config"]
+                else:
+                    stale[name] = config_stamp
+
+            if stale:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        name: executor.submit(self._compile, name, stamp) for name, stamp in stale.items()
+                    }
+
+                for name, future in futures.items():
+                    try:
+                        entry = future.result()
+                    except Exception as e:
+                        results[name] = e
+                        continue
+                    agents[name] = entry
+                    results[name] = entry["config"]
+                self.save()
+
+            return results
+
+    def rebuild(self) -> None:
+        """Drop the compiled registry and recompile every agent."""
+        with self._lock:
+            self._data = self._empty()
+            self.agent_names()
 
 
 class AgentManager:
@@ -16,10 +257,41 @@ class AgentManager:
     initializing agents, and coordinating agent interactions.
     """
 
-    def __init__(self, agents_dir: str = "agents"):
+    def __init__(
+        self,
+        agents_dir: str = "agents",
+        use_registry: bool = True,
+        max_resident_prompts: Optional[int] = None,
+        use_mmap: bool = False
+    ):
+        """
+        Args:
+            agents_dir: Directory holding one folder per agent
+            use_registry: Read agents through the compiled registry
+                (see AgentRegistry) instead of parsing each agent's files
+            max_resident_prompts: Keep at most this many loaded agents'
+                prompts in memory, dropping the least recently used ones
+                (they are re-read on next use); unlimited if None
+            use_mmap: Serve prompts from memory-mapped prompt.md files
+                instead of Python strings (see Agent)
+        """
+        if max_resident_prompts is not None and max_resident_prompts < 1:
+            raise ValueError("max_resident_prompts must be at least 1")
+
         self.agents_dir = Path(agents_dir)
         self.loaded_agents: Dict[str, 'Agent'] = {}
         self.agent_configs: Dict[str, Dict] = {}
+        # Guards loaded_agents/agent_configs, which the watcher thread
+        # changes while callers read them (see loaded_snapshot)
+        self._lock = threading.RLock()
+        self.registry = AgentRegistry(self.agents_dir) if use_registry else None
+        self.watcher = None
+
+        self.max_resident_prompts = max_resident_prompts
+        self.use_mmap = use_mmap
+        # Agents whose prompt is in memory, least recently used first
+        self._resident_prompts: "OrderedDict[str, Agent]" = OrderedDict()
+        self._resident_lock = threading.Lock()
 
     def load_agent(self, agent_name: str) -> Optional['Agent']:
         """
@@ -31,26 +303,131 @@ class AgentManager:
         Returns:
             Agent instance or None if not found
         """
-        agent_path = self.agents_dir / agent_name
-        config_file = agent_path / "config.yaml"
+        if self.registry is not None:
+            config = self.registry.get(agent_name)
+            if config is None:
+                raise FileNotFoundError(f"Agent config not found: {self._config_file(agent_name)}")
+        else:
+            config = self._read_config(agent_name)
+
+        return self._add_agent(agent_name, config)
+
+    def load_agents(
+        self,
+        agent_names: Union[List[str], str] = "all",
+        max_workers: Optional[int] = None
+    ) -> Tuple[Dict[str, 'Agent'], Dict[str, str]]:
+        """
+        Load several agents at once, reading their configs concurrently in
+        a thread pool (prompts are read on first use).
+
+        Args:
+            agent_names: Names of the agents to load, or "all" for every
+                agent in the agents directory
+            max_workers: Threads reading agents (ThreadPoolExecutor default if None)
+
+        Returns:
+            Tuple of (loaded agents by name, error message by name for
+            agents that couldn't be loaded)
+        """
+        if agent_names == "all":
+            agent_names = self.list_agents()
+
+        if self.registry is not None:
+            compiled = self.registry.get_many(agent_names, max_workers=max_workers)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {name: executor.submit(self._read_config, name) for name in agent_names}
+
+            compiled = {}
+            for name, future in futures.items():
+                try:
+                    compiled[name] = future.result()
+                except Exception as e:
+                    compiled[name] = e
+
+        agents, errors = {}, {}
+        for name in agent_names:
+            result = compiled[name]
+            if result is None:
+                errors[name] = f"Agent config not found: {self._config_file(name)}"
+            elif isinstance(result, Exception):
+                errors[name] = str(result)
+            else:
+                agents[name] = self._add_agent(name, result)
+
+        return agents, errors
+
+    def _config_file(self, agent_name: str) -> Path:
+        """Path of an agent's config.yaml."""
+        return self.agents_dir / agent_name / "config.yaml"
+
+    def _read_config(self, agent_name: str) -> Dict:
+        """
+        Read an agent's config straight from its config.yaml.
 
+        Raises:
+            FileNotFoundError: If the agent has no config.yaml
+        """
+        config_file = self._config_file(agent_name)
         if not config_file.exists():
             raise FileNotFoundError(f"Agent config not found: {config_file}")
 
         with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+            return yaml_io.load(f)
+
+    def _add_agent(self, agent_name: str, config: Dict) -> 'Agent':
+        """Create an Agent (prompt not read yet) and register it as loaded."""
+        agent = Agent(
+            agent_name, config, self.agents_dir / agent_name,
+            use_mmap=self.use_mmap, on_prompt_loaded=self._prompt_used
+        )
 
-        self.agent_configs[agent_name] = config
-        agent = Agent(agent_name, config, agent_path)
-        self.loaded_agents[agent_name] = agent
+        with self._lock:
+            self._forget_prompt(agent_name)
+            self.agent_configs[agent_name] = config
+            self.loaded_agents[agent_name] = agent
 
         return agent
 
+    def loaded_snapshot(self) -> Dict[str, 'Agent']:
+        """
+        Copy of the loaded agents by name, safe to iterate while the
+        watcher thread reloads agents.
+        """
+        with self._lock:
+            return dict(self.loaded_agents)
+
+    def _prompt_used(self, agent: 'Agent') -> None:
+        """Mark an agent's prompt as recently used, evicting the oldest over the cap."""
+        with self._resident_lock:
+            self._resident_prompts[agent.name] = agent
+            self._resident_prompts.move_to_end(agent.name)
+            cap = self.max_resident_prompts
+            while cap is not None and len(self._resident_prompts) > cap:
+                _, oldest = self._resident_prompts.popitem(last=False)
+                oldest.unload_prompt()
+
+    def _forget_prompt(self, agent_name: str) -> None:
+        """Drop a replaced or removed agent from the resident prompt list."""
+        with self._resident_lock:
+            previous = self._resident_prompts.pop(agent_name, None)
+        if previous is not None:
+            previous.unload_prompt()
+
+    def resident_prompts(self) -> List[str]:
+        """Names of loaded agents whose prompt is in memory, least recently used first."""
+        with self._resident_lock:
+            return [name for name, agent in self._resident_prompts.items() if agent.prompt_loaded]
+
     def list_agents(self) -> List[str]:
         """List all available agents in the agents directory."""
         if not self.agents_dir.exists():
             return []
 
+        if self.registry is not None:
+            return self.registry.agent_names()
+
         agents = []
         for item in self.agents_dir.iterdir():
             if item.is_dir() and (item / "config.yaml").exists():
@@ -68,8 +445,10 @@ class AgentManager:
         Returns:
             Agent instance or None
         """
-        if agent_name in self.loaded_agents:
-            return self.loaded_agents[agent_name]
+        with self._lock:
+            agent = self.loaded_agents.get(agent_name)
+        if agent is not None:
+            return agent
 
         return self.load_agent(agent_name)
 
@@ -83,11 +462,64 @@ class AgentManager:
         Returns:
             Reloaded Agent instance
         """
-        if agent_name in self.loaded_agents:
-            del self.loaded_agents[agent_name]
+        with self._lock:
+            self.loaded_agents.pop(agent_name, None)
 
         return self.load_agent(agent_name)
 
+    def watch(self, poll_interval: float = 1.0, use_inotify: bool = True) -> None:
+        """
+        Start reloading loaded agents in the background whenever their
+        files change (opt-in, for long-running processes).
+
+        Args:
+            poll_interval: Seconds between scans if inotify is unavailable
+            use_inotify: Use inotify when available (polling otherwise)
+        """
+        if self.watcher is None:
+            self.watcher = file_watcher.FileWatcher(
+                [self.agents_dir], self._on_agents_changed,
+                poll_interval=poll_interval, use_inotify=use_inotify
+            ).start()
+
+    def stop_watching(self) -> None:
+        """Stop the agent watcher."""
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+
+    def _on_agents_changed(self, changed: Set[Path]) -> None:
+        """
+        Watcher callback: reload the loaded agents whose files changed.
+
+        An agent whose new files fail to load keeps its previous version.
+        Runs on the watcher thread, so loaded_agents/agent_configs are
+        only changed under the manager's lock.
+        """
+        names = set()
+        for path in changed:
+            try:
+                names.add(path.relative_to(self.agents_dir).parts[0])
+            except (ValueError, IndexError):
+                continue
+
+        with self._lock:
+            loaded = names & set(self.loaded_agents)
+
+        for name in sorted(loaded):
+            if not self._config_file(name).exists():
+                with self._lock:
+                    self.loaded_agents.pop(name, None)
+                    self.agent_configs.pop(name, None)
+                    self._forget_prompt(name)
+                print(f"↻ Unloaded removed agent: {name}")
+                continue
+            try:
+                self.load_agent(name)
+                print(f"↻ Reloaded agent: {name}")
+            except Exception as e:
+                print(f"⚠ Keeping previous version of {name}: {e}")
+
     def validate_agent_config(self, config: Dict) -> tuple[bool, List[str]]:
         """
         Validate agent configuration against framework requirements.
@@ -136,24 +568,124 @@ class Agent:
     prompt template, and tools.
     """
 
-    def __init__(self, name: str, config: Dict, agent_path: Path):
+    # Registry processes can hold thousands of agents, so no per-instance dict.
+    # _prompt is the prompt text, a map of prompt.md, None (no prompt.md) or
+    # _READ_PROMPT (not read yet) - one attribute, so a thread using the
+    # prompt while another unloads it sees either the old or the new state.
+    __slots__ = (
+        "name", "config", "agent_path", "use_mmap",
+        "_prompt", "_prompt_pinned", "_on_prompt_loaded"
+    )
+
+    def __init__(
+        self,
+        name: str,
+        config: Dict,
+        agent_path: Path,
+        prompt_template=_READ_PROMPT,
+        use_mmap: bool = False,
+        on_prompt_loaded: Optional[Callable[['Agent'], None]] = None
+    ):
+        """
+        Args:
+            name: Agent name
+            config: Parsed config.yaml
+            agent_path: The agent's folder
+            prompt_template: Prompt text to use instead of prompt.md (kept
+                in memory); read from prompt.md on first use if not given
+            use_mmap: Memory-map prompt.md and decode it on each use instead
+                of keeping the text as a string (the pages stay in the OS
+                page cache rather than the process heap). If prompt.md's
+                size changes while mapped, it is mapped again.
+            on_prompt_loaded: Called with the agent each time its prompt is
+                used (AgentManager uses it to cap resident prompts)
+        """
         self.name = name
         self.config = config
         self.agent_path = agent_path
+        self.use_mmap = use_mmap
+        self._on_prompt_loaded = on_prompt_loaded
+
+        self._prompt: Union[str, mmap.mmap, None, object] = _READ_PROMPT
+        self._prompt_pinned = False
+        if prompt_template is not _READ_PROMPT:
+            self.prompt_template = prompt_template
+
+    @property
+    def context(self) -> Dict:
+        """Context section of the config (role, expertise, scope, constraints)."""
+        return self.config.get('context', {})
+
+    @property
+    def model(self) -> Dict:
+        """Model section of the config."""
+        return self.config.get('model', {})
+
+    @property
+    def tools(self) -> Dict:
+        """Tools section of the config (skills, slash_commands, mcp_servers)."""
+        return self.config.get('tools', {})
+
+    @property
+    def prompt_template(self) -> Optional[str]:
+        """The agent's prompt.md (None if it has none), read on first use."""
+        if self._prompt_pinned:
+            return self._prompt
+
+        # Read once: the manager may unload it from another thread meanwhile,
+        # which only drops the agent's reference (this one keeps a map open)
+        loaded = self._prompt
+
+        if isinstance(loaded, mmap.mmap):
+            stamp = _file_stamp(self.agent_path / "prompt.md")
+            if stamp is None or stamp[1] != len(loaded):
+                # Rewritten since it was mapped; reading the old map could fault
+                loaded = _READ_PROMPT
+
+        if loaded is _READ_PROMPT:
+            loaded = self._load_prompt_template()
+            self._prompt = loaded
+
+        if isinstance(loaded, mmap.mmap):
+            prompt = loaded[:].decode('utf-8')
+        else:
+            prompt = loaded
+
+        if self._on_prompt_loaded is not None:
+            self._on_prompt_loaded(self)
+        return prompt
 
-        # Extract configuration components
-        self.context = config.get('context', {})
-        self.model = config.get('model', {})
-        self.tools = config.get('tools', {})
-        self.prompt_template = self._load_prompt_template()
+    @prompt_template.setter
+    def prompt_template(self, value: Optional[str]) -> None:
+        """Use this text instead of prompt.md (kept in memory, never unloaded)."""
+        self._prompt_pinned = False
+        self._prompt = value
+        self._prompt_pinned = True
 
-    def _load_prompt_template(self) -> Optional[str]:
-        """Load the agent's prompt template if it exists."""
+    @property
+    def prompt_loaded(self) -> bool:
+        """Whether the prompt is currently held in memory."""
+        return self._prompt is not _READ_PROMPT
+
+    def _load_prompt_template(self) -> Union[str, mmap.mmap, None]:
+        """The agent's prompt template (memory-mapped with use_mmap), None if it has none."""
         prompt_file = self.agent_path / "prompt.md"
-        if prompt_file.exists():
-            with open(prompt_file, 'r') as f:
-                return f.read()
-        return None
+        if not prompt_file.exists():
+            return None
+        with open(prompt_file, 'rb') as f:
+            if self.use_mmap and os.fstat(f.fileno()).st_size > 0:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return f.read().decode('utf-8')
+
+    def unload_prompt(self) -> None:
+        """
+        Drop the prompt from memory; it is read again on next use (no-op for
+        given prompts). A map is not closed here, since another thread may
+        still be decoding it - it is unmapped once no longer referenced.
+        """
+        if self._prompt_pinned:
+            return
+        self._prompt = _READ_PROMPT
 
     def get_context(self) -> Dict:
         """Get agent context configuration."""
@@ -200,7 +732,7 @@ Expertise: {', '.join(self.context.get('expertise', []))}
 Scope: {self.context.get('scope', '')}
 
 ## MODEL
-{yaml.dump(self.model, default_flow_style=False)}
+{yaml_io.dump(self.model, default_flow_style=False)}
 
 ## TOOLS
 Skills: {', '.join(self.get_skills())}
@@ -0,0 +1,32 @@
+"""
+Core Modules
+Loads the framework's core modules by path, since their hyphenated
+filenames (yaml-io.py, file-watcher.py, ...) can't be imported by name
+Part of Claude-Agents Framework
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+CORE_DIR = Path(__file__).parent
+
+
+def load_core_module(name: str, filename: str):
+    """
+    Load a core module once per process.
+
+    Args:
+        name: Module name to register it under (e.g. "yaml_io")
+        filename: File in the core directory (e.g. "yaml-io.py")
+
+    Returns:
+        The loaded module (the same one on every call)
+    """
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, CORE_DIR / filename)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules[name] = module
+    return module
@@ -0,0 +1,257 @@
+"""
+File Watcher Module
+Watches agent and template directories in a background thread and reports
+changed files, so long-running processes can reload just what was edited
+Part of Claude-Agents Framework
+
+Uses Linux inotify (through libc, no extra packages) and falls back to
+polling file mtimes where inotify isn't available.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+# inotify event flags (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0x00000800
+IN_CLOEXEC = 0x00080000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+)
+
+# struct inotify_event header: wd, mask, cookie, len (name follows)
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Events arriving within this window are reported together (editors
+# often write, rename and chmod a file in quick succession)
+DEBOUNCE_SECONDS = 0.1
+
+# Default seconds between scans for the polling fallback
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+def _is_hidden(path: Path) -> bool:
+    """Hidden files (editor swap files, the agent registry) are never reported."""
+    return path.name.startswith(".")
+
+
+def _load_libc():
+    """libc with the inotify functions, or None if unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    return libc if hasattr(libc, "inotify_init1") and hasattr(libc, "inotify_add_watch") else None
+
+
+class FileWatcher:
+    """
+    Calls back with the set of changed files under one or more directories
+    (recursively) whenever files are created, modified, moved or deleted.
+    """
+
+    def __init__(
+        self,
+        paths: List[Path],
+        callback: Callable[[Set[Path]], None],
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        use_inotify: bool = True
+    ):
+        """
+        Args:
+            paths: Directories to watch
+            callback: Called from the watcher thread with the changed file paths
+            poll_interval: Seconds between scans when polling
+            use_inotify: Use inotify if available (polling otherwise)
+        """
+        self.paths = [Path(path) for path in paths]
+        self.callback = callback
+        self.poll_interval = poll_interval
+        self.backend = "inotify" if use_inotify and _load_libc() is not None else "polling"
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._fd: Optional[int] = None
+        self._watches: Dict[int, Path] = {}
+        self._snapshot: Dict[Path, Tuple[int, int]] = {}
+
+    def start(self) -> 'FileWatcher':
+        """Start watching in a daemon thread."""
+        if self._thread is not None:
+            return self
+
+        if self.backend == "inotify":
+            try:
+                self._setup_inotify()
+            except OSError:
+                # Watch limit reached or similar - polling still works
+                self._close_inotify()
+                self.backend = "polling"
+
+        self._stop.clear()
+        if self.backend == "inotify":
+            target = self._run_inotify
+        else:
+            self._snapshot = self._scan()
+            target = self._run_polling
+        self._thread = threading.Thread(target=target, name="file-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop watching and wait for the thread to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._close_inotify()
+
+    def __enter__(self) -> 'FileWatcher':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _notify(self, changed: Set[Path]) -> None:
+        """Report changes, never letting a callback error kill the thread."""
+        changed = {path for path in changed if not _is_hidden(path)}
+        if not changed:
+            return
+        try:
+            self.callback(changed)
+        except Exception as e:
+            print(f"⚠ File watcher callback failed: {e}")
+
+    # inotify backend
+
+    def _setup_inotify(self) -> None:
+        """Create the inotify instance and watch every directory."""
+        libc = _load_libc()
+        self._libc = libc
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+
+        for root in self.paths:
+            if root.is_dir():
+                self._add_tree(root)
+
+    def _add_tree(self, root: Path) -> None:
+        """Watch a directory and all its subdirectories."""
+        for folder, dirnames, _ in os.walk(root):
+            dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(folder), WATCH_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {folder}")
+            self._watches[wd] = Path(folder)
+
+    def _close_inotify(self) -> None:
+        """Close the inotify instance (drops all watches)."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._watches.clear()
+
+    def _read_events(self) -> Set[Path]:
+        """Changed paths from the pending inotify events."""
+        changed = set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped; report everything under the roots
+                changed.update(self._scan())
+                continue
+
+            folder = self._watches.get(wd)
+            if folder is None:
+                continue
+            if mask & (IN_IGNORED | IN_DELETE_SELF):
+                self._watches.pop(wd, None)
+                continue
+
+            path = folder / os.fsdecode(name) if name else folder
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and not _is_hidden(path):
+                    # New agent folder: watch it and report the files it came with
+                    try:
+                        self._add_tree(path)
+                    except OSError:
+                        pass
+                    changed.update(p for p in path.rglob("*") if p.is_file())
+                changed.add(path)
+            else:
+                changed.add(path)
+        return changed
+
+    def _run_inotify(self) -> None:
+        """Watcher thread: wait for inotify events and report each burst."""
+        while not self._stop.is_set():
+            readable, _, _ = select.select([self._fd], [], [], 0.5)
+            if not readable:
+                continue
+
+            changed = self._read_events()
+            # Collect the rest of a burst before reporting
+            while select.select([self._fd], [], [], DEBOUNCE_SECONDS)[0]:
+                changed |= self._read_events()
+            self._notify(changed)
+
+    # Polling backend
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        """(mtime_ns, size) of every file under the watched directories."""
+        snapshot = {}
+        for root in self.paths:
+            if not root.is_dir():
+                continue
+            for path in root.rglob("*"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                if path.is_file():
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _run_polling(self) -> None:
+        """Watcher thread: rescan every poll_interval and report differences."""
+        while not self._stop.wait(self.poll_interval):
+            snapshot = self._scan()
+            changed = {
+                path for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            self._notify(changed)
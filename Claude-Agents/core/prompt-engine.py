@@ -4,12 +4,20 @@ Handles dynamic prompt generation using the Four Core Keys structure
 Part of Claude-Agents Framework
 """
 
-import yaml
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from string import Template
 
 
+# cli.py loads this file by path, so core/ may not be on sys.path yet
+if str(Path(__file__).parent) not in sys.path:
+    sys.path.insert(0, str(Path(__file__).parent))
+from core_modules import load_core_module
+
+file_watcher = load_core_module("file_watcher", "file-watcher.py")
+
+
 class PromptEngine:
     """
     Generates and manages prompts using the Four Core Keys structure:
@@ -23,17 +31,25 @@ class PromptEngine:
         self.prompts_dir = Path(prompts_dir)
         self.templates_dir = self.prompts_dir / "templates"
         self.loaded_templates: Dict[str, str] = {}
+        self.watcher = None
 
     def load_template(self, template_name: str) -> str:
         """
         Load a prompt template from the templates directory.
 
+        While watching (see watch()), loaded templates are served from
+        memory and refreshed by the watcher when their file changes;
+        otherwise the file is read on every call.
+
         Args:
             template_name: Name of the template file (without .md extension)
 
         Returns:
             Template content as string
         """
+        if self.watcher is not None and template_name in self.loaded_templates:
+            return self.loaded_templates[template_name]
+
         template_path = self.templates_dir / f"{template_name}.md"
 
         if not template_path.exists():
@@ -45,6 +61,39 @@ class PromptEngine:
         self.loaded_templates[template_name] = content
         return content
 
+    def watch(self, poll_interval: float = 1.0, use_inotify: bool = True) -> None:
+        """
+        Start reloading changed templates in the background (opt-in, for
+        long-running processes).
+
+        Args:
+            poll_interval: Seconds between scans if inotify is unavailable
+            use_inotify: Use inotify when available (polling otherwise)
+        """
+        if self.watcher is None:
+            self.watcher = file_watcher.FileWatcher(
+                [self.templates_dir], self._on_templates_changed,
+                poll_interval=poll_interval, use_inotify=use_inotify
+            ).start()
+
+    def stop_watching(self) -> None:
+        """Stop the template watcher."""
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+
+    def _on_templates_changed(self, changed: Set[Path]) -> None:
+        """Watcher callback: re-read changed templates that were loaded."""
+        for path in changed:
+            if path.parent != self.templates_dir or path.suffix != ".md" or path.stem not in self.loaded_templates:
+                continue
+            if path.exists():
+                with open(path, 'r') as f:
+                    self.loaded_templates[path.stem] = f.read()
+                print(f"↻ Reloaded template: {path.stem}")
+            else:
+                self.loaded_templates.pop(path.stem, None)
+
     def generate_prompt(
         self,
         context: Dict,
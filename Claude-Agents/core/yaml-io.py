@@ -0,0 +1,119 @@
+"""
+YAML I/O Module
+Safe YAML loading and dumping for the whole framework, using the libyaml
+C bindings (CSafeLoader/CSafeDumper) when PyYAML was built with them and
+the pure-Python SafeLoader/SafeDumper otherwise
+Part of Claude-Agents Framework
+
+Usage:
+    python core/yaml-io.py --agents 300     # benchmark both implementations
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    LIBYAML = False
+
+YAMLError = yaml.YAMLError
+
+
+def load(stream) -> Any:
+    """
+    Parse a YAML document (string or open file) with the safe loader.
+
+    Raises:
+        YAMLError: If the document is invalid
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump(data: Any, stream=None, **kwargs) -> Optional[str]:
+    """
+    Serialize data to YAML with the safe dumper.
+
+    Args:
+        data: Plain data (dicts, lists, scalars)
+        stream: Open file to write to (returns the YAML string if None)
+        **kwargs: Options for yaml.dump (default_flow_style, sort_keys, ...)
+    """
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+
+
+def load_file(path: Path) -> Any:
+    """Parse a YAML file."""
+    with open(path, 'r') as f:
+        return load(f)
+
+
+def dump_file(data: Any, path: Path, **kwargs) -> None:
+    """Write data to a YAML file (kwargs as for dump())."""
+    with open(path, 'w') as f:
+        dump(data, f, **kwargs)
+
+
+def benchmark(config: Dict, count: int) -> Dict[str, Dict[str, float]]:
+    """
+    Time loading and dumping `count` agent configs with each available
+    implementation.
+
+    Args:
+        config: Agent configuration used as the template for every config
+        count: Number of configs to load and dump
+
+    Returns:
+        Seconds per operation by implementation, e.g.
+        {"pure-python": {"load": 0.9, "dump": 1.1}, "libyaml": {...}}
+    """
+    configs = [dict(config, agent_name=f"{config.get('agent_name', 'agent')}-{i}") for i in range(count)]
+    implementations = {"pure-python": (yaml.SafeLoader, yaml.SafeDumper)}
+    if LIBYAML:
+        implementations["libyaml"] = (SafeLoader, SafeDumper)
+
+    def timed(operation: Callable[[], Any]) -> float:
+        started = time.perf_counter()
+        operation()
+        return time.perf_counter() - started
+
+    results = {}
+    for name, (loader, dumper) in implementations.items():
+        documents = [yaml.dump(c, Dumper=dumper, default_flow_style=False, sort_keys=False) for c in configs]
+        results[name] = {
+            "load": timed(lambda: [yaml.load(d, Loader=loader) for d in documents]),
+            "dump": timed(lambda: [
+                yaml.dump(c, Dumper=dumper, default_flow_style=False, sort_keys=False) for c in configs
+            ])
+        }
+    return results
+
+
+# Benchmark
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark YAML loading and dumping of agent configs")
+    parser.add_argument("--agents", type=int, default=300, help="Number of agent configs (default: 300)")
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=Path(__file__).parent.parent / "agents" / "business-analyst" / "config.yaml",
+        help="Agent config used as the template"
+    )
+    args = parser.parse_args()
+
+    results = benchmark(load_file(args.config), args.agents)
+
+    print(f"\nYAML benchmark: {args.agents} agent configs (libyaml {'available' if LIBYAML else 'NOT available'})")
+    print(f"{'Implementation':<16}{'Load':>12}{'Dump':>12}")
+    for name, times in results.items():
+        print(f"{name:<16}{times['load'] * 1000:>10.1f}ms{times['dump'] * 1000:>10.1f}ms")
+
+    if "libyaml" in results:
+        base, fast = results["pure-python"], results["libyaml"]
+        print(f"\nlibyaml speedup: load {base['load'] / fast['load']:.1f}x, dump {base['dump'] / fast['dump']:.1f}x")
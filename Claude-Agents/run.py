@@ -51,13 +51,16 @@ def quick_start_project(project_path: str):
         return 1
 
     print(f"\nFound {len(agents)} agent(s):")
+    loaded, errors = manager.load_agents(agents)
     for agent_name in agents:
-        agent = manager.load_agent(agent_name)
+        agent = loaded.get(agent_name)
         if agent:
             print(f"  ✓ {agent_name}")
             print(f"    Role: {agent.context.get('role', 'N/A')}")
             print(f"    Tools: {len(agent.tools.get('skills', []))} skills, "
                   f"{len(agent.tools.get('slash_commands', []))} commands")
+        else:
+            print(f"  ✗ {agent_name}: {errors[agent_name]}")
 
     print(f"\n{'='*60}")
     print("USAGE EXAMPLES")
@@ -65,7 +68,7 @@ def quick_start_project(project_path: str):
 
     # Show example usage with first agent
     first_agent_name = agents[0]
-    first_agent = manager.load_agent(first_agent_name)
+    first_agent = manager.get_agent(first_agent_name)
 
     print(f"1. Generate a prompt for '{first_agent_name}':")
     print(f"""
@@ -4,7 +4,13 @@ Test Suite for Claude-Agents Framework
 Validates all core components and agent configurations
 """
 
+import os
+import shutil
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add core directory to path
@@ -23,6 +29,7 @@ def load_module(name, path):
 agent_manager = load_module("agent_manager", core_dir / "agent-manager.py")
 prompt_engine = load_module("prompt_engine", core_dir / "prompt-engine.py")
 mcp_connector = load_module("mcp_connector", core_dir / "mcp-connector.py")
+yaml_io = load_module("yaml_io", core_dir / "yaml-io.py")
 
 AgentManager = agent_manager.AgentManager
 PromptEngine = prompt_engine.PromptEngine
@@ -193,10 +200,295 @@ def test_mcp_connector():
     return True
 
 
+def test_agent_registry():
+    """Test the compiled agent registry"""
+    print("\n" + "="*80)
+    print("TEST 4: Agent Registry")
+    print("="*80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        agents_dir = Path(tmp) / "agents"
+        shutil.copytree("agents", agents_dir)
+
+        manager = AgentManager(agents_dir=str(agents_dir))
+        assert manager.list_agents() == ["business-analyst"]
+        registry_file = Path(tmp) / ".agents-registry.pickle"
+        assert registry_file.exists(), "Registry not written"
+        print(f"✓ Compiled registry: {registry_file.name}")
+
+        # Listing again neither rescans the directory nor rewrites the registry
+        def fail(message):
+            def raise_error(*args):
+                raise AssertionError(message)
+            return raise_error
+
+        written = registry_file.stat().st_mtime_ns
+        for _ in range(2):
+            listing = AgentManager(agents_dir=str(agents_dir))
+            listing.registry.save = fail("Registry rewritten")
+            original_iterdir = Path.iterdir
+            Path.iterdir = fail("Directory rescanned")
+            try:
+                assert listing.list_agents() == ["business-analyst"]
+                assert listing.list_agents() == ["business-analyst"]
+            finally:
+                Path.iterdir = original_iterdir
+        assert registry_file.stat().st_mtime_ns == written
+        print("✓ Unchanged agents listed without a rescan or registry write")
+
+        # A fresh manager loads from the registry without parsing YAML
+        original_load = agent_manager.yaml_io.load
+        agent_manager.yaml_io.load = None
+        try:
+            cached = AgentManager(agents_dir=str(agents_dir))
+            assert cached.list_agents() == ["business-analyst"]
+            agent = cached.load_agent("business-analyst")
+        finally:
+            agent_manager.yaml_io.load = original_load
+        assert agent.prompt_template == (agents_dir / "business-analyst" / "prompt.md").read_text()
+        print("✓ Loaded agent from registry without parsing config.yaml")
+
+        # Editing a source file recompiles only that agent
+        config_file = agents_dir / "business-analyst" / "config.yaml"
+        config_file.write_text(config_file.read_text().replace("claude-sonnet", "claude-opus", 1))
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        agent = AgentManager(agents_dir=str(agents_dir)).load_agent("business-analyst")
+        assert agent.model['name'].startswith("claude-opus"), "Stale config served"
+        print("✓ Changed config.yaml recompiled")
+
+        # New and removed agents show up in the list
+        shutil.copytree(agents_dir / "business-analyst", agents_dir / "second-agent")
+        assert sorted(AgentManager(agents_dir=str(agents_dir)).list_agents()) == ["business-analyst", "second-agent"]
+        shutil.rmtree(agents_dir / "second-agent")
+        assert AgentManager(agents_dir=str(agents_dir)).list_agents() == ["business-analyst"]
+        print("✓ Added and removed agents picked up")
+
+        try:
+            AgentManager(agents_dir=str(agents_dir)).load_agent("missing-agent")
+            assert False, "Missing agent loaded"
+        except FileNotFoundError:
+            print("✓ Missing agent raises FileNotFoundError")
+
+    return True
+
+
+def test_load_agents():
+    """Test bulk agent loading"""
+    print("\n" + "="*80)
+    print("TEST 5: Bulk Agent Loading")
+    print("="*80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        agents_dir = Path(tmp) / "agents"
+        for i in range(8):
+            shutil.copytree("agents/business-analyst", agents_dir / f"agent-{i}")
+        (agents_dir / "agent-7" / "config.yaml").write_text("context: [unclosed")
+        names = [f"agent-{i}" for i in range(8)] + ["missing-agent"]
+
+        for use_registry in (True, False):
+            manager = AgentManager(agents_dir=str(agents_dir), use_registry=use_registry)
+            agents, errors = manager.load_agents(names, max_workers=4)
+
+            assert list(agents) == [f"agent-{i}" for i in range(7)], "Wrong agents loaded"
+            assert set(errors) == {"agent-7", "missing-agent"}, f"Unexpected errors: {errors}"
+            assert "Agent config not found" in errors["missing-agent"]
+            assert all(manager.loaded_agents[name] is agent for name, agent in agents.items())
+            assert agents["agent-0"].prompt_template, "Prompt not loaded"
+            print(f"✓ {'Registry' if use_registry else 'Direct'}: {len(agents)} loaded, "
+                  f"{len(errors)} error(s) reported without raising")
+
+        agents, errors = AgentManager(agents_dir=str(agents_dir)).load_agents("all")
+        assert len(agents) == 7 and list(errors) == ["agent-7"]
+        print("✓ load_agents('all') covers every agent")
+
+    return True
+
+
+def test_yaml_io():
+    """Test the YAML I/O layer"""
+    print("\n" + "="*80)
+    print("TEST 6: YAML I/O")
+    print("="*80)
+
+    import yaml
+
+    config = yaml_io.load_file(Path("agents/business-analyst/config.yaml"))
+    assert config == yaml.safe_load(Path("agents/business-analyst/config.yaml").read_text())
+    assert yaml_io.load(yaml_io.dump(config, sort_keys=False)) == config
+    print(f"✓ Round trip matches PyYAML safe_load (libyaml: {yaml_io.LIBYAML})")
+
+    if yaml.__with_libyaml__:
+        assert yaml_io.SafeLoader is yaml.CSafeLoader and yaml_io.SafeDumper is yaml.CSafeDumper
+        print("✓ Using CSafeLoader/CSafeDumper")
+
+    # Without the C bindings the layer falls back to the pure-Python classes
+    saved = {name: getattr(yaml, name) for name in ("CSafeLoader", "CSafeDumper") if hasattr(yaml, name)}
+    for name in saved:
+        delattr(yaml, name)
+    try:
+        fallback = load_module("yaml_io_fallback", core_dir / "yaml-io.py")
+    finally:
+        for name, value in saved.items():
+            setattr(yaml, name, value)
+    assert not fallback.LIBYAML and fallback.SafeLoader is yaml.SafeLoader
+    assert fallback.load(fallback.dump(config)) == config
+    print("✓ Falls back to SafeLoader/SafeDumper")
+
+    results = yaml_io.benchmark(config, 20)
+    assert "pure-python" in results and all(t["load"] > 0 for t in results.values())
+    print(f"✓ Benchmark ran: {', '.join(results)}")
+
+    return True
+
+
+def _wait_for(condition, timeout=5.0):
+    """Poll until condition() is true or the timeout passes."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return condition()
+
+
+def test_hot_reload():
+    """Test hot-reloading of agents and templates"""
+    print("\n" + "="*80)
+    print("TEST 7: Hot Reload")
+    print("="*80)
+
+    for use_inotify in (True, False):
+        with tempfile.TemporaryDirectory() as tmp:
+            agents_dir = Path(tmp) / "agents"
+            shutil.copytree("agents", agents_dir)
+            templates_dir = Path(tmp) / "prompts" / "templates"
+            templates_dir.mkdir(parents=True)
+            (templates_dir / "greeting.md").write_text("Hello $role")
+
+            manager = AgentManager(agents_dir=str(agents_dir))
+            engine = PromptEngine(prompts_dir=str(Path(tmp) / "prompts"))
+            manager.load_agent("business-analyst")
+            assert engine.load_template("greeting") == "Hello $role"
+
+            manager.watch(poll_interval=0.1, use_inotify=use_inotify)
+            engine.watch(poll_interval=0.1, use_inotify=use_inotify)
+            backend = manager.watcher.backend
+            try:
+                prompt_file = agents_dir / "business-analyst" / "prompt.md"
+                prompt_file.write_text("# Edited prompt")
+                assert _wait_for(
+                    lambda: manager.get_agent("business-analyst").prompt_template == "# Edited prompt"
+                ), f"Agent not reloaded ({backend})"
+
+                # A broken edit keeps the previous version
+                config_file = agents_dir / "business-analyst" / "config.yaml"
+                original_config = config_file.read_text()
+                config_file.write_text("context: [unclosed")
+                time.sleep(0.5)
+                assert manager.get_agent("business-analyst").model, "Broken edit replaced the agent"
+                config_file.write_text(original_config)
+
+                (templates_dir / "greeting.md").write_text("Welcome $role")
+                assert _wait_for(
+                    lambda: engine.load_template("greeting") == "Welcome $role"
+                ), f"Template not reloaded ({backend})"
+            finally:
+                manager.stop_watching()
+                engine.stop_watching()
+
+            print(f"✓ {backend}: changed agent and template reloaded")
+
+    # The watcher thread only changes loaded agents under the manager's lock
+    with tempfile.TemporaryDirectory() as tmp:
+        agents_dir = Path(tmp) / "agents"
+        shutil.copytree("agents", agents_dir)
+        shutil.copytree(agents_dir / "business-analyst", agents_dir / "content-creator")
+        manager = AgentManager(agents_dir=str(agents_dir))
+        manager.load_agents(["business-analyst", "content-creator"])
+        snapshot = manager.loaded_snapshot()
+        shutil.rmtree(agents_dir / "content-creator")
+
+        with manager._lock:
+            callback = threading.Thread(
+                target=manager._on_agents_changed, args=({agents_dir / "content-creator" / "config.yaml"},)
+            )
+            callback.start()
+            callback.join(0.2)
+            assert callback.is_alive(), "Watcher callback ran without the manager's lock"
+            assert "content-creator" in manager.loaded_agents
+        callback.join()
+
+        assert "content-creator" not in manager.loaded_agents
+        assert "content-creator" in snapshot, "Snapshot changed with the manager"
+        print("✓ Watcher changes wait for the manager's lock; snapshots are unaffected")
+
+    return True
+
+
+def test_lazy_prompts():
+    """Test lazy, memory-mapped and capped prompt loading"""
+    print("\n" + "="*80)
+    print("TEST 8: Lazy Prompts")
+    print("="*80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        agents_dir = Path(tmp) / "agents"
+        for i in range(5):
+            shutil.copytree("agents/business-analyst", agents_dir / f"agent-{i}")
+            (agents_dir / f"agent-{i}" / "prompt.md").write_text(f"# Prompt {i}\n")
+
+        for use_mmap in (False, True):
+            manager = AgentManager(agents_dir=str(agents_dir), max_resident_prompts=2, use_mmap=use_mmap)
+            agents, errors = manager.load_agents("all")
+            assert not errors and len(agents) == 5
+
+            agent = agents["agent-0"]
+            assert not hasattr(agent, "__dict__"), "Agent should use __slots__"
+            assert not agent.prompt_loaded, "Prompt read before first use"
+            assert agent.model["name"] and agent.get_skills() == agent.tools.get("skills", [])
+
+            for i in (0, 1, 2):
+                assert agents[f"agent-{i}"].prompt_template == f"# Prompt {i}\n"
+            assert manager.resident_prompts() == ["agent-1", "agent-2"], manager.resident_prompts()
+            assert not agents["agent-0"].prompt_loaded, "LRU prompt not evicted"
+
+            # Evicted prompts are re-read on next use
+            assert agents["agent-0"].generate_system_prompt() == "# Prompt 0\n"
+            assert manager.resident_prompts() == ["agent-2", "agent-0"]
+
+            # A prompt rewritten with a different size is picked up by a mapped agent
+            (agents_dir / "agent-2" / "prompt.md").write_text("# Rewritten prompt 2\n")
+            expected = "# Rewritten prompt 2\n" if use_mmap else "# Prompt 2\n"
+            assert agents["agent-2"].prompt_template == expected
+            (agents_dir / "agent-2" / "prompt.md").write_text("# Prompt 2\n")
+
+            # Prompts evicted by one thread stay readable in another
+            manager.max_resident_prompts = 1
+
+            def read_prompts(_):
+                for _ in range(200):
+                    for i in range(5):
+                        assert agents[f"agent-{i}"].prompt_template == f"# Prompt {i}\n"
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(read_prompts, range(4)))
+
+            print(f"✓ {'mmap' if use_mmap else 'string'} prompts: lazy, capped at 2 resident, thread-safe eviction")
+
+        # Explicit prompts are kept however the cap evicts
+        agent = agent_manager.Agent("inline", {}, agents_dir / "inline", prompt_template="Inline prompt")
+        agent.unload_prompt()
+        assert agent.prompt_template == "Inline prompt"
+        print("✓ Explicit prompt_template kept in memory")
+
+    return True
+
+
 def test_integration():
     """Test integrated workflow"""
     print("\n" + "="*80)
-    print("TEST 4: Integration Test")
+    print("TEST 9: Integration Test")
     print("="*80)
 
     print("\nTesting complete agent workflow...")
@@ -253,6 +545,11 @@ def run_all_tests():
         ("Agent Manager", test_agent_manager),
         ("Prompt Engine", test_prompt_engine),
         ("MCP Connector", test_mcp_connector),
+        ("Agent Registry", test_agent_registry),
+        ("Bulk Agent Loading", test_load_agents),
+        ("YAML I/O", test_yaml_io),
+        ("Hot Reload", test_hot_reload),
+        ("Lazy Prompts", test_lazy_prompts),
         ("Integration", test_integration)
     ]
 
@@ -40,15 +40,36 @@ class TherapyPracticeWorkflow:
     - Sunday: Performance review & optimization
     """
 
-    def __init__(self, agents_dir: str):
-        """Initialize workflow with agents directory."""
+    def __init__(self, agents_dir: str, watch: bool = False):
+        """
+        Initialize workflow with agents directory.
+
+        Args:
+            agents_dir: Path to agents directory
+            watch: Reload agents and prompt templates when their files
+                change (for long-running processes)
+        """
         self.manager = AgentManager(agents_dir=agents_dir)
         self.engine = PromptEngine()
-        self.agents = {}
+        self.agent_names: Dict[str, str] = {}
 
         # Load all agents
         self._load_agents()
 
+        if watch:
+            self.manager.watch()
+            self.engine.watch()
+
+    @property
+    def agents(self) -> Dict:
+        """Loaded agents by short name (the reloaded versions when watching)."""
+        loaded = self.manager.loaded_snapshot()
+        return {
+            short_name: loaded[name]
+            for short_name, name in self.agent_names.items()
+            if name in loaded
+        }
+
     def _load_agents(self):
         """Load all 7 therapy practice agents."""
         agent_names = [
@@ -61,14 +82,15 @@ class TherapyPracticeWorkflow:
             'therapy-practice-practice-operations'
         ]
 
+        agents, errors = self.manager.load_agents(agent_names)
+
         for name in agent_names:
-            agent = self.manager.load_agent(name)
-            if agent:
-                short_name = name.replace('therapy-practice-', '')
-                self.agents[short_name] = agent
+            short_name = name.replace('therapy-practice-', '')
+            if name in agents:
+                self.agent_names[short_name] = name
                 print(f"✓ Loaded {short_name}")
             else:
-                print(f"✗ Failed to load {name}")
+                print(f"✗ Failed to load {name}: {errors[name]}")
 
     def monday_business_intelligence(self, weekly_data: Dict) -> Dict:
         """
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Angle Pool
+
+Candidate social post angles per theme, generated by the model in one
+call per theme and kept across runs. Each week draws angles from its
+theme's pool that haven't been used yet (see generate_social_angles in
+create_weekly_batch_v2), and the pool is only topped up with another call
+once it runs low.
+
+Location:
+    .cache/angle_pools.db   (deleting it only costs one call per theme to
+                             regenerate the pools)
+"""
+
+import json
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+from content_catalog import topic_key
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pools (
+    theme_key  TEXT PRIMARY KEY,
+    theme      TEXT NOT NULL,
+    angles     TEXT NOT NULL,
+    updated    TEXT NOT NULL
+);
+"""
+
+# Angles shorter or longer than this are not usable as post titles
+MIN_ANGLE_LENGTH = 8
+MAX_ANGLE_LENGTH = 120
+
+# List markers the model may put in front of an angle ("1.", "-", "•", "**")
+_LIST_MARKER = re.compile(r"^\s*(?:[-*•]+|\d+[.)]|\*\*)\s*")
+
+
+def _strip_line(line: str) -> str:
+    """A line without its list marker and surrounding quotes."""
+    return _LIST_MARKER.sub("", line).strip().strip('"*').strip()
+
+
+def parse_angles(text: str, instructions: str = "") -> List[str]:
+    """
+    Angles from a model response with one angle per line.
+
+    Numbering, bullets and surrounding quotes are stripped, and lines that
+    are too short or long to be a title, end in ":" (explanations) or start
+    with "#" (markdown headings) are skipped, as are lines repeating a line
+    of the instructions.
+
+    Args:
+        text: Model response
+        instructions: Prompt the response answers (its lines are never angles)
+    """
+    echoed = {topic_key(_strip_line(line)) for line in instructions.splitlines() if line.strip()}
+    angles = []
+    for line in text.splitlines():
+        if line.lstrip().startswith("#"):
+            continue
+        angle = _strip_line(line)
+        if not MIN_ANGLE_LENGTH <= len(angle) <= MAX_ANGLE_LENGTH or angle.endswith(":"):
+            continue
+        if topic_key(angle) in echoed:
+            continue
+        angles.append(angle)
+    return angles
+
+
+class AnglePool:
+    """Thread-safe SQLite store of generated angles per theme."""
+
+    def __init__(self, db_path: Path = None):
+        """
+        Open (and create if needed) the pool store.
+
+        Args:
+            db_path: Database file (defaults to .cache/angle_pools.db)
+        """
+        if db_path is None:
+            db_path = Path(__file__).parent / ".cache" / "angle_pools.db"
+
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Timeout covers other processes (sharded runs) topping up a pool
+        self._conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get(self, theme: str) -> List[str]:
+        """Angles in a theme's pool, in the order they were generated (empty if none)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT angles FROM pools WHERE theme_key = ?", (topic_key(theme),)
+            ).fetchone()
+        return json.loads(row[0]) if row else []
+
+    def extend(self, theme: str, angles: List[str]) -> List[str]:
+        """
+        Add angles to a theme's pool, skipping ones it already has.
+
+        Returns:
+            The theme's whole pool
+        """
+        key = topic_key(theme)
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT angles FROM pools WHERE theme_key = ?", (key,)).fetchone()
+            pool = json.loads(row[0]) if row else []
+
+            seen = {topic_key(angle) for angle in pool}
+            for angle in angles:
+                if topic_key(angle) not in seen:
+                    seen.add(topic_key(angle))
+                    pool.append(angle)
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pools (theme_key, theme, angles, updated) VALUES (?, ?, ?, ?)",
+                (key, theme, json.dumps(pool), datetime.now().isoformat())
+            )
+        return pool
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Shared Anthropic Client
+
+Provides one pooled, keep-alive Anthropic client per API key so every
+generation call in a batch - and every batch in a long-running
+content_cli session - reuses the same HTTP connections instead of paying
+for a new TLS handshake on each post.
+"""
+
+import threading
+from typing import Dict, Optional
+
+import anthropic
+import httpx
+
+from config import get_client_settings
+
+
+class AnthropicClientProvider:
+    """Thread-safe provider of shared, connection-pooled Anthropic clients."""
+
+    def __init__(
+        self,
+        pool_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+        keepalive_expiry: Optional[float] = None,
+        base_url: Optional[str] = None
+    ):
+        """
+        Initialize the client provider.
+
+        Any setting left as None falls back to the .env / environment
+        configuration (see config.get_client_settings).
+
+        Args:
+            pool_size: Maximum number of pooled HTTP connections
+            timeout: Read/write timeout in seconds for a single request
+            connect_timeout: Timeout in seconds for opening a connection
+            keepalive_expiry: Seconds an idle connection is kept open
+            base_url: API base URL (e.g. a local stand-in server); defaults
+                to ANTHROPIC_BASE_URL or the public API
+        """
+        settings = get_client_settings()
+
+        self.pool_size = pool_size or settings["pool_size"]
+        self.timeout = timeout or settings["timeout"]
+        self.connect_timeout = connect_timeout or settings["connect_timeout"]
+        self.keepalive_expiry = keepalive_expiry or settings["keepalive_expiry"]
+        self.base_url = base_url
+
+        self._clients: Dict[str, anthropic.Anthropic] = {}
+        self._http_clients: Dict[str, httpx.Client] = {}
+        self._lock = threading.Lock()
+
+    def _build_http_client(self) -> httpx.Client:
+        """Create an HTTP client with a bounded keep-alive connection pool."""
+        return httpx.Client(
+            limits=httpx.Limits(
+                max_connections=self.pool_size,
+                max_keepalive_connections=self.pool_size,
+                keepalive_expiry=self.keepalive_expiry
+            ),
+            timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout)
+        )
+
+    def get_client(self, api_key: str) -> anthropic.Anthropic:
+        """
+        Get the shared client for an API key, creating it on first use.
+
+        Args:
+            api_key: Anthropic API key
+
+        Returns:
+            Anthropic client backed by the shared connection pool
+        """
+        with self._lock:
+            client = self._clients.get(api_key)
+            if client is None:
+                http_client = self._build_http_client()
+                # Retries are scheduled by rate_limiter.RateLimiter, which
+                # spaces them across every thread sharing this client
+                client = anthropic.Anthropic(
+                    api_key=api_key,
+                    base_url=self.base_url,
+                    http_client=http_client,
+                    max_retries=0
+                )
+                self._http_clients[api_key] = http_client
+                self._clients[api_key] = client
+            return client
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        with self._lock:
+            for http_client in self._http_clients.values():
+                http_client.close()
+            self._http_clients.clear()
+            self._clients.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Message Batches Backend
+
+Generates many weekly batches through the Anthropic Message Batches API
+instead of one messages.create call per post. Every social post and blog
+prompt still missing from the jobs' manifests is submitted as a single
+batch job (split only if it exceeds the per-batch request limit), polled
+until it ends, and the results are fanned back into the usual week folder
+layout. Batch requests are processed asynchronously (usually well within
+an hour) at a lower price than direct calls, so this suits large,
+non-urgent jobs such as a full quarter of content.
+
+Submitted batch ids are recorded on each manifest slot, so an interrupted
+run picks up the results of a batch that is already processing instead of
+submitting it again.
+
+Usage:
+    python create_weekly_batch_v2.py --spec quarter.json --use-api --backend batch
+
+    # Offline, against the local stand-in server
+    python local_batch_server.py --port 8765 &
+    ANTHROPIC_API_KEY=test python create_weekly_batch_v2.py --spec quarter.json \\
+        --use-api --backend batch --base-url http://127.0.0.1:8765
+"""
+
+import time
+import uuid
+from typing import Dict, List, Tuple
+
+from batch_manifest import BatchManifest, DONE, FAILED, IN_FLIGHT
+from create_weekly_batch_v2 import (
+    BLOG_MAX_TOKENS,
+    SOCIAL_MAX_TOKENS,
+    SOCIAL_POST_TOOL,
+    InteractiveWeeklyBatchCreator,
+    cached_payload,
+    format_prompt_cache_usage,
+    response_payload,
+)
+from usage_ledger import call_usage
+
+
+# Seconds between batch status checks
+DEFAULT_POLL_INTERVAL = 30
+
+# Requests per submitted batch (the API allows up to 100,000)
+MAX_REQUESTS_PER_BATCH = 10000
+
+
+class MessageBatchBackend:
+    """Generates weekly batches with the Message Batches API."""
+
+    def __init__(
+        self,
+        creator: InteractiveWeeklyBatchCreator,
+        api_key: str,
+        poll_interval: float = DEFAULT_POLL_INTERVAL
+    ):
+        """
+        Initialize the backend.
+
+        Args:
+            creator: Batch creator providing prompts, the response cache,
+                the API client and the save/summary steps
+            api_key: Anthropic API key
+            poll_interval: Seconds between batch status checks
+        """
+        self.creator = creator
+        self.api_key = api_key
+        self.poll_interval = poll_interval
+        self.client = creator.client_provider.get_client(api_key)
+
+    def _slot_label(self, manifest: BatchManifest, slot: Dict) -> str:
+        """Label like 'practice-folder/2025-week-46 social-3' for messages."""
+        return f"{manifest.week_folder.parent.name}/{manifest.week_folder.name} {slot['id']}"
+
+    def _slot_request(self, manifest: BatchManifest, slot: Dict) -> Dict:
+        """Messages API parameters for a social or blog slot."""
+        if slot["kind"] == "blog":
+            return self.creator._build_request(
+                self.creator.build_blog_prompt(manifest.theme),
+                BLOG_MAX_TOKENS,
+                self.creator.build_blog_system(manifest.style)
+            )
+
+        return self.creator._build_request(
+            self.creator.build_social_prompt(slot["angle"], manifest.theme, slot["platform"]),
+            SOCIAL_MAX_TOKENS,
+            self.creator.build_social_system(manifest.style),
+            SOCIAL_POST_TOOL if self.creator.structured_posts else None,
+            cache_system=False
+        )
+
+    def _save_slot(self, manifest: BatchManifest, slot: Dict, payload: Dict) -> None:
+        """Save a slot's response payload (see response_payload) and mark it done (or failed)."""
+        if slot["kind"] == "blog":
+            blog_folder = self.creator.save_blog_post(
+                manifest.theme, manifest.style, payload["text"], manifest.week_folder, payload.get("usage")
+            )
+            manifest.set_state("blog", DONE, blog_folder)
+            return
+
+        content_data = self.creator.build_social_content(
+            slot["angle"], manifest.theme, slot["platform"], manifest.style,
+            payload["text"], payload.get("fields"), payload.get("usage")
+        )
+        content_file = self.creator.save_social_content(
+            content_data, slot["platform"], slot["date"], manifest.week_folder
+        )
+        if content_file:
+            manifest.set_state(slot["id"], DONE, content_file)
+        else:
+            print(f"  ❌ Failed to save {slot['platform']} post for {slot['day']}")
+            manifest.set_state(slot["id"], FAILED)
+
+    def _collect_requests(
+        self,
+        manifests: List[BatchManifest]
+    ) -> Tuple[List[Dict], Dict[str, Tuple[BatchManifest, Dict, str]], Dict[str, List[str]]]:
+        """
+        Gather batch requests for every slot that is not done yet.
+
+        Slots whose response is cached are saved straight away, and slots
+        already waiting on a submitted batch are attached to that batch.
+
+        Returns:
+            (new requests, pending slots by custom_id, custom_ids by
+            already-submitted batch id)
+        """
+        requests = []
+        pending = {}
+        resumed = {}
+
+        # Unique per run, so new ids never clash with those of a resumed batch
+        run_tag = uuid.uuid4().hex[:8]
+
+        for index, manifest in enumerate(manifests):
+            for slot in manifest.slots():
+                if slot["kind"] == "summary" or manifest.is_done(slot):
+                    continue
+
+                request = self._slot_request(manifest, slot)
+                cache_key = self.creator._request_cache_key(
+                    request, self.creator.job_cache_scope(manifest, slot["id"])
+                )
+                cached = self.creator.response_cache.get(cache_key)
+                if cached is not None:
+                    self._save_slot(manifest, slot, cached_payload(cached))
+                    continue
+
+                batch_id = slot.get("message_batch_id")
+                if slot["state"] == IN_FLIGHT and batch_id and slot.get("custom_id"):
+                    custom_id = slot["custom_id"]
+                    resumed.setdefault(batch_id, []).append(custom_id)
+                else:
+                    # custom_id must match ^[a-zA-Z0-9_-]{1,64}$
+                    custom_id = f"{run_tag}-w{index}-{slot['id']}"
+                    requests.append({"custom_id": custom_id, "params": request})
+
+                pending[custom_id] = (manifest, slot, cache_key)
+
+        return requests, pending, resumed
+
+    def _submit(self, requests: List[Dict], pending: Dict) -> List[str]:
+        """Submit requests in chunks, recording each batch id on its slots."""
+        batch_ids = []
+
+        for start in range(0, len(requests), MAX_REQUESTS_PER_BATCH):
+            chunk = requests[start:start + MAX_REQUESTS_PER_BATCH]
+            batch = self.creator.rate_limiter.call(
+                lambda: self.client.messages.batches.create(requests=chunk)
+            )
+            batch_ids.append(batch.id)
+            print(f"  📤 Submitted batch {batch.id} ({len(chunk)} request(s))")
+
+            for request in chunk:
+                manifest, slot, _ = pending[request["custom_id"]]
+                manifest.set_state(
+                    slot["id"], IN_FLIGHT,
+                    message_batch_id=batch.id,
+                    custom_id=request["custom_id"]
+                )
+
+        return batch_ids
+
+    def _wait(self, batch_id: str) -> bool:
+        """
+        Poll a batch until processing has ended.
+
+        Returns:
+            True if the batch ended, False if it could not be retrieved
+        """
+        last_counts = None
+
+        while True:
+            try:
+                batch = self.creator.rate_limiter.call(
+                    lambda: self.client.messages.batches.retrieve(batch_id)
+                )
+            except Exception as e:
+                print(f"  ❌ Could not check batch {batch_id}: {e}")
+                return False
+
+            counts = batch.request_counts
+            progress = (counts.processing, counts.succeeded, counts.errored)
+            if progress != last_counts:
+                print(f"  ⏳ {batch_id}: {counts.processing} processing, "
+                      f"{counts.succeeded} succeeded, {counts.errored} errored")
+                last_counts = progress
+
+            if batch.processing_status == "ended":
+                return True
+
+            time.sleep(self.poll_interval)
+
+    def _fan_in(self, batch_id: str, pending: Dict) -> Tuple[int, int]:
+        """
+        Save a finished batch's results into their week folders.
+
+        Returns:
+            (succeeded, failed) result counts
+        """
+        succeeded = failed = 0
+
+        entries = self.creator.rate_limiter.call(
+            lambda: list(self.client.messages.batches.results(batch_id))
+        )
+
+        for entry in entries:
+            item = pending.get(entry.custom_id)
+            if item is None:
+                continue
+
+            manifest, slot, cache_key = item
+            result = entry.result
+
+            if result.type != "succeeded":
+                error = getattr(getattr(result, "error", None), "error", None)
+                message = getattr(error, "message", None)
+                print(f"  ❌ {self._slot_label(manifest, slot)}: {result.type}"
+                      + (f" ({message})" if message else ""))
+                manifest.set_state(slot["id"], FAILED)
+                failed += 1
+                continue
+
+            self.creator.record_usage(result.message.usage)
+            payload = response_payload(result.message)
+            payload["usage"] = call_usage(result.message.usage, result.message.model, batch=True)
+            self.creator.response_cache.put(cache_key, payload)
+            try:
+                self._save_slot(manifest, slot, payload)
+                succeeded += 1
+            except OSError as e:
+                print(f"  ❌ {self._slot_label(manifest, slot)}: {e}")
+                manifest.set_state(slot["id"], FAILED)
+                failed += 1
+
+        return succeeded, failed
+
+    def run(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Generate every job's posts and blogs through the Message Batches
+        API, then write each week's image guides and summary.
+
+        Slots that fail inside the batch are retried with direct calls when
+        their week is finished, so a run still completes every week it can.
+        Slots of a batch that could not be checked or fetched are left
+        in-flight instead (the batch may still deliver them, and they are
+        already paid for); their weeks stay staged and the next run of the
+        same jobs picks the batch up again.
+
+        Args:
+            jobs: Jobs from expand_batch_jobs()
+
+        Returns:
+            One result per job with practice, week_start, theme, summary and error
+        """
+        manifests = [
+            self.creator.prepare_headless_manifest(
+                job["week_start"], job["theme"], job["style"],
+                job["with_blog"], job["schedule"], job["batches_path"], self.api_key, job["practice"]
+            )
+            for job in jobs
+        ]
+
+        print("\n" + "="*80)
+        print(f"MESSAGE BATCH: {len(jobs)} week(s)")
+        print("="*80 + "\n")
+
+        cache_hits_before = self.creator.response_cache.hits
+        usage_before = self.creator.usage_stats()
+        requests, pending, resumed = self._collect_requests(manifests)
+
+        cache_hits = self.creator.response_cache.hits - cache_hits_before
+        if cache_hits:
+            print(f"  ♻️  Reused {cache_hits} cached response(s)")
+        for batch_id, custom_ids in resumed.items():
+            print(f"  🔁 Resuming batch {batch_id} ({len(custom_ids)} request(s))")
+
+        batch_ids = list(resumed)
+        if requests:
+            try:
+                batch_ids += self._submit(requests, pending)
+            except Exception as e:
+                print(f"  ❌ Could not submit batch: {e}")
+                print(f"     Falling back to direct calls")
+
+        if batch_ids:
+            print(f"\n🤖 Waiting for {len(batch_ids)} batch(es) "
+                  f"(checking every {self.poll_interval:g}s)...")
+
+        # Batches whose results are still out; their slots stay in-flight
+        unfinished = set()
+        for batch_id in batch_ids:
+            if not self._wait(batch_id):
+                unfinished.add(batch_id)
+                continue
+            try:
+                succeeded, failed = self._fan_in(batch_id, pending)
+            except Exception as e:
+                print(f"  ❌ Could not fetch results of batch {batch_id}: {e}")
+                unfinished.add(batch_id)
+                continue
+            print(f"  ✓ {batch_id}: {succeeded} saved" + (f", {failed} failed" if failed else ""))
+
+        usage = self.creator.usage_stats()
+        prompt_cache = format_prompt_cache_usage(
+            {field: usage[field] - usage_before[field] for field in usage}
+        )
+        if prompt_cache:
+            print(f"\n🗄️  Prompt cache: {prompt_cache}")
+
+        # Guides and summaries; failed or missing slots fall back to direct calls
+        results = []
+        for job, manifest in zip(jobs, manifests):
+            result = {
+                "practice": job["practice"],
+                "week_start": job["week_start"],
+                "theme": job["theme"],
+                "summary": None,
+                "error": None
+            }
+            waiting = sorted({
+                slot["message_batch_id"] for slot in manifest.slots()
+                if slot["state"] == IN_FLIGHT and slot.get("message_batch_id") in unfinished
+            })
+            if waiting:
+                result["error"] = (f"still waiting on batch {', '.join(waiting)} - "
+                                   f"rerun to collect its results")
+                results.append(result)
+                continue
+            try:
+                result["summary"] = self.creator.run_batch(job["week_start"], manifest, self.api_key)
+            except Exception as e:
+                result["error"] = str(e)
+            results.append(result)
+
+        print("\n" + "="*80)
+        print("MESSAGE BATCH RUN COMPLETE")
+        print("="*80 + "\n")
+
+        for result in results:
+            label = f"{result['practice']} " if result["practice"] else ""
+            if result["error"]:
+                print(f"  ❌ {label}{result['week_start']}: {result['error']}")
+            else:
+                print(f"  ✓ {label}{result['week_start']}: {result['theme']}")
+
+        failed = sum(1 for r in results if r["error"])
+        print(f"\n{len(results) - failed}/{len(results)} week(s) completed")
+        self.creator.print_run_usage()
+
+        return results
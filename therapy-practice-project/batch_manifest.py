@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Weekly Batch Manifest
+
+Checkpoint file kept in each week folder (batch_manifest.json) that records
+the theme, style and the state of every schedule slot, so an interrupted
+batch can be resumed without redoing finished posts.
+
+Slot states:
+    pending    Not started yet
+    in-flight  API call running
+    done       Generated and saved (output path is relative to the week folder)
+    failed     Last attempt failed; retried on resume
+"""
+
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+MANIFEST_FILENAME = "batch_manifest.json"
+
+PENDING = "pending"
+IN_FLIGHT = "in-flight"
+DONE = "done"
+FAILED = "failed"
+
+
+class BatchManifest:
+    """Per-week record of batch settings and slot progress."""
+
+    def __init__(self, week_folder: Path, data: Dict):
+        """
+        Initialize a manifest.
+
+        Args:
+            week_folder: Week folder the manifest belongs to
+            data: Manifest contents
+        """
+        self.week_folder = week_folder
+        self.path = week_folder / MANIFEST_FILENAME
+        self.data = data
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(
+        cls,
+        week_folder: Path,
+        week_start: str,
+        theme: str,
+        mode: str,
+        style: Dict,
+        social_angles: List[str],
+        posting_schedule: List[Dict],
+        with_blog: bool = False
+    ) -> 'BatchManifest':
+        """
+        Create and save a new manifest with every slot pending.
+
+        Args:
+            week_folder: Week folder for this batch
+            week_start: Week start date (YYYY-MM-DD)
+            theme: Weekly theme
+            mode: Theme selection mode
+            style: Style settings (tone, social_length, audience, blog_focus)
+            social_angles: Angle for each social slot
+            posting_schedule: Day/date/platform for each social slot;
+                schedule items beyond the last angle are recorded as
+                unfilled_slots instead of getting a slot
+            with_blog: Whether the batch includes a blog post
+
+        Returns:
+            New BatchManifest
+        """
+        slots = []
+        for i, (angle, schedule_item) in enumerate(zip(social_angles, posting_schedule), 1):
+            slots.append({
+                "id": f"social-{i}",
+                "kind": "social",
+                "day": schedule_item["day"],
+                "date": schedule_item["date"],
+                "platform": schedule_item["platform"],
+                "angle": angle,
+                "state": PENDING,
+                "output": None
+            })
+
+        if with_blog:
+            slots.append({"id": "blog", "kind": "blog", "state": PENDING, "output": None})
+
+        slots.append({"id": "summary", "kind": "summary", "state": PENDING, "output": None})
+
+        manifest = cls(week_folder, {
+            "week_start": week_start,
+            "theme": theme,
+            "mode": mode,
+            "style": style,
+            "created": datetime.now().isoformat(),
+            "updated": datetime.now().isoformat(),
+            "slots": slots,
+            "unfilled_slots": [dict(item) for item in posting_schedule[len(social_angles):]]
+        })
+        manifest.save()
+        return manifest
+
+    @classmethod
+    def load(cls, week_folder: Path) -> Optional['BatchManifest']:
+        """
+        Load the manifest from a week folder.
+
+        Returns:
+            BatchManifest, or None if the folder has no readable manifest
+        """
+        path = week_folder / MANIFEST_FILENAME
+        try:
+            with open(path, 'r') as f:
+                return cls(week_folder, json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def parse(cls, week_folder: Path, raw: bytes) -> Optional['BatchManifest']:
+        """
+        Build a manifest from raw JSON, e.g. read out of an archived week.
+
+        Returns:
+            BatchManifest, or None if the JSON is unreadable
+        """
+        try:
+            return cls(week_folder, json.loads(raw))
+        except ValueError:
+            return None
+
+    @property
+    def theme(self) -> str:
+        return self.data["theme"]
+
+    @property
+    def mode(self) -> str:
+        return self.data.get("mode", "resumed")
+
+    @property
+    def style(self) -> Dict:
+        return self.data["style"]
+
+    @property
+    def unfilled_slots(self) -> List[Dict]:
+        """Scheduled posts (day/date/platform) left out because no unused angle was left."""
+        return self.data.get("unfilled_slots", [])
+
+    @property
+    def with_blog(self) -> bool:
+        return self.get_slot("blog") is not None
+
+    def slots(self, kind: Optional[str] = None) -> List[Dict]:
+        """Get slots, optionally filtered by kind ('social', 'blog', 'summary')."""
+        return [slot for slot in self.data["slots"] if kind is None or slot["kind"] == kind]
+
+    def get_slot(self, slot_id: str) -> Optional[Dict]:
+        """Get a slot by id."""
+        for slot in self.data["slots"]:
+            if slot["id"] == slot_id:
+                return slot
+        return None
+
+    def output_path(self, slot: Dict) -> Optional[Path]:
+        """Absolute output path of a slot, or None if it has none."""
+        if not slot.get("output"):
+            return None
+        return self.week_folder / slot["output"]
+
+    def is_done(self, slot: Dict) -> bool:
+        """A slot is done only if it was marked done and its output still exists."""
+        output = self.output_path(slot)
+        return slot["state"] == DONE and output is not None and output.exists()
+
+    def set_state(self, slot_id: str, state: str, output: Optional[Path] = None, **fields) -> None:
+        """
+        Update a slot's state and save the manifest.
+
+        Args:
+            slot_id: Slot id (e.g. 'social-3', 'blog', 'summary')
+            state: New state
+            output: Output file or folder (stored relative to the week folder)
+            **fields: Extra slot fields to record (e.g. message_batch_id)
+        """
+        with self._lock:
+            slot = self.get_slot(slot_id)
+            slot["state"] = state
+            if output is not None:
+                slot["output"] = str(Path(output).relative_to(self.week_folder))
+            slot.update(fields)
+            self._save_locked()
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        with self._lock:
+            self._save_locked()
+
+    def _save_locked(self) -> None:
+        self.data["updated"] = datetime.now().isoformat()
+        self.week_folder.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.week_folder, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.data, f, indent=2)
+            os.replace(tmp_name, self.path)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
@@ -92,6 +92,108 @@ def ensure_api_key() -> str:
     return api_key
 
 
+def _get_number(name: str, default, cast=float):
+    """Read a numeric setting from the environment, falling back to default."""
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        return default
+
+
+def get_client_settings() -> dict:
+    """
+    Get HTTP connection settings for the shared Anthropic client.
+
+    Settings can be overridden in .env or the environment:
+        ANTHROPIC_POOL_SIZE         Max pooled connections (default 10)
+        ANTHROPIC_TIMEOUT           Request timeout in seconds (default 600)
+        ANTHROPIC_CONNECT_TIMEOUT   Connect timeout in seconds (default 10)
+        ANTHROPIC_KEEPALIVE_EXPIRY  Idle keep-alive in seconds (default 60)
+
+    Returns:
+        Dictionary with pool_size, timeout, connect_timeout, keepalive_expiry
+    """
+    return {
+        "pool_size": _get_number("ANTHROPIC_POOL_SIZE", 10, int),
+        "timeout": _get_number("ANTHROPIC_TIMEOUT", 600.0),
+        "connect_timeout": _get_number("ANTHROPIC_CONNECT_TIMEOUT", 10.0),
+        "keepalive_expiry": _get_number("ANTHROPIC_KEEPALIVE_EXPIRY", 60.0),
+    }
+
+
+def get_cache_settings() -> dict:
+    """
+    Get response cache settings.
+
+    Settings can be overridden in .env or the environment:
+        RESPONSE_CACHE_MAX_AGE_DAYS  Entry lifetime in days (default 30)
+        RESPONSE_CACHE_MAX_MB        Cache size limit in MB (default 200)
+
+    Returns:
+        Dictionary with max_age_days and max_size_mb
+    """
+    return {
+        "max_age_days": _get_number("RESPONSE_CACHE_MAX_AGE_DAYS", 30.0),
+        "max_size_mb": _get_number("RESPONSE_CACHE_MAX_MB", 200.0),
+    }
+
+
+def get_rate_limit_settings() -> dict:
+    """
+    Get rate limit and retry settings for generation calls.
+
+    Set the limits to your API tier's values in .env or the environment:
+        ANTHROPIC_RPM          Requests per minute (default 50)
+        ANTHROPIC_TPM          Input + output tokens per minute (default 40000)
+        ANTHROPIC_MAX_RETRIES  Retries for 429/529/5xx/connection errors (default 6)
+
+    Returns:
+        Dictionary with requests_per_minute, tokens_per_minute, max_retries
+    """
+    return {
+        "requests_per_minute": _get_number("ANTHROPIC_RPM", 50.0),
+        "tokens_per_minute": _get_number("ANTHROPIC_TPM", 40000.0),
+        "max_retries": _get_number("ANTHROPIC_MAX_RETRIES", 6, int),
+    }
+
+
+def get_duplicate_settings() -> dict:
+    """
+    Get near-duplicate angle detection settings.
+
+    Settings can be overridden in .env or the environment:
+        DUPLICATE_THRESHOLD   Similarity (0-1) that counts as a near duplicate (default 0.6)
+        DUPLICATE_ANGLE_MODE  flag (warn), block (swap the angle) or off (default flag)
+
+    Returns:
+        Dictionary with threshold and angle_mode
+    """
+    return {
+        "threshold": _get_number("DUPLICATE_THRESHOLD", 0.6),
+        "angle_mode": os.environ.get("DUPLICATE_ANGLE_MODE") or "flag",
+    }
+
+
+def get_template_settings() -> dict:
+    """
+    Get document template settings.
+
+    Settings can be overridden in .env or the environment:
+        CONTENT_TEMPLATES_DIR  Folder with practice-specific templates that
+                               override the ones in templates/ (default none)
+
+    Returns:
+        Dictionary with templates_dir (Path or None)
+    """
+    templates_dir = os.environ.get("CONTENT_TEMPLATES_DIR")
+    return {
+        "templates_dir": Path(templates_dir).expanduser() if templates_dir else None,
+    }
+
+
 def check_api_key_configured() -> bool:
     """
     Check if API key is configured.
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Content Catalog
+
+SQLite index of every social post and blog post in the content library.
+Posts are recorded as they are saved, and library_indexer picks up files
+edited, moved or deleted by hand, so duplicate-topic checks and listings
+are indexed queries instead of a scan that re-reads every *_meta.json
+file in the library.
+
+Location:
+    .cache/content_catalog.db   (derived data - safe to delete; it is
+                                 rebuilt from the library on next use)
+"""
+
+import json
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS content (
+    content_id      TEXT PRIMARY KEY,
+    content_type    TEXT NOT NULL,
+    title           TEXT NOT NULL,
+    title_key       TEXT NOT NULL,
+    theme           TEXT,
+    platform        TEXT,
+    path            TEXT NOT NULL UNIQUE,
+    created_date    TEXT,
+    scheduled_date  TEXT,
+    status          TEXT,
+    views           INTEGER NOT NULL DEFAULT 0,
+    likes           INTEGER NOT NULL DEFAULT 0,
+    comments        INTEGER NOT NULL DEFAULT 0,
+    shares          INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_content_title_key ON content (title_key);
+CREATE INDEX IF NOT EXISTS idx_content_theme ON content (theme COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_content_platform_date ON content (platform, scheduled_date);
+CREATE INDEX IF NOT EXISTS idx_content_created ON content (created_date);
+CREATE TABLE IF NOT EXISTS indexed_files (
+    path      TEXT PRIMARY KEY,
+    mtime_ns  INTEGER NOT NULL,
+    size      INTEGER NOT NULL,
+    sha256    TEXT NOT NULL
+);
+"""
+
+COLUMNS = [
+    "content_id", "content_type", "title", "title_key", "theme", "platform", "path",
+    "created_date", "scheduled_date", "status", "views", "likes", "comments", "shares"
+]
+
+# Date suffix added to social filenames by save_social_content
+_DATE_SUFFIX = re.compile(r"-(\d{4}-\d{2}-\d{2})$")
+
+
+def topic_key(title: str) -> str:
+    """Normalized title used for duplicate-topic checks."""
+    return " ".join(title.lower().split())
+
+
+class ContentCatalog:
+    """Thread-safe SQLite catalog of saved content."""
+
+    def __init__(self, db_path: Path = None, root: Path = None):
+        """
+        Open (and create if needed) the catalog.
+
+        Args:
+            db_path: Database file (defaults to .cache/content_catalog.db)
+            root: Folder that stored paths are relative to (defaults to
+                this script's folder)
+        """
+        if root is None:
+            root = Path(__file__).parent
+        if db_path is None:
+            db_path = root / ".cache" / "content_catalog.db"
+
+        self.root = root
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Shared by the batch creator's worker threads; writes are serialized
+        # by the lock, and the timeout covers other processes (sharded runs)
+        self._conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def relative_path(self, path: Path) -> str:
+        """Path as stored in the catalog (relative to root when inside it)."""
+        try:
+            return str(Path(path).resolve().relative_to(self.root.resolve()))
+        except ValueError:
+            return str(Path(path).resolve())
+
+    def record(self, metadata: Dict, path: Path, scheduled_date: Optional[str] = None) -> None:
+        """
+        Add or update a content item.
+
+        Args:
+            metadata: Content metadata (the *_meta.json format)
+            path: Content file (or blog folder)
+            scheduled_date: Planned posting date (YYYY-MM-DD)
+        """
+        self.record_many([(metadata, path, scheduled_date)])
+
+    def record_many(self, items: Iterable) -> int:
+        """
+        Add or update several items in one transaction.
+
+        Args:
+            items: (metadata, path, scheduled_date) tuples
+
+        Returns:
+            Number of items recorded
+        """
+        rows = [self._row(metadata, path, scheduled_date) for metadata, path, scheduled_date in items]
+        if not rows:
+            return 0
+
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        with self._lock, self._conn:
+            # A re-saved file may carry a new content_id; drop the old row first
+            self._conn.executemany(
+                "DELETE FROM content WHERE path = ? AND content_id != ?",
+                [(row[COLUMNS.index("path")], row[0]) for row in rows]
+            )
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO content ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+                rows
+            )
+        return len(rows)
+
+    def _row(self, metadata: Dict, path: Path, scheduled_date: Optional[str]) -> tuple:
+        details = metadata.get("content_details", {})
+        performance = metadata.get("performance", {})
+        title = metadata.get("title") or ""
+        return (
+            metadata.get("content_id") or self.relative_path(path),
+            metadata.get("content_type") or "unknown",
+            title,
+            topic_key(title),
+            metadata.get("theme"),
+            details.get("platform"),
+            self.relative_path(path),
+            metadata.get("created_date"),
+            scheduled_date,
+            metadata.get("status"),
+            int(performance.get("views") or 0),
+            int(performance.get("likes") or 0),
+            int(performance.get("comments") or 0),
+            int(performance.get("shares") or 0),
+        )
+
+    def remove_paths(self, paths: Iterable[Path]) -> int:
+        """
+        Remove items by content path.
+
+        Returns:
+            Number of rows removed
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.executemany(
+                "DELETE FROM content WHERE path = ?",
+                [(self.relative_path(path),) for path in paths]
+            )
+            return cursor.rowcount
+
+    def is_empty(self) -> bool:
+        """Whether nothing has been recorded yet."""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM content LIMIT 1").fetchone() is None
+
+    def has_topic(self, title: str) -> bool:
+        """Whether content with this title already exists (case-insensitive)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM content WHERE title_key = ? LIMIT 1", (topic_key(title),)
+            ).fetchone()
+        return row is not None
+
+    def existing_topics(self) -> Set[str]:
+        """All distinct titles, lower-cased."""
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT title_key FROM content WHERE title_key != ''").fetchall()
+        return {row[0] for row in rows}
+
+    def existing_themes(self) -> Set[str]:
+        """All distinct themes, normalized like titles (see topic_key)."""
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT theme FROM content WHERE theme IS NOT NULL").fetchall()
+        return {topic_key(row[0]) for row in rows if row[0].strip()}
+
+    def list_content(
+        self,
+        theme: Optional[str] = None,
+        platform: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        List content, newest scheduled (or created) first.
+
+        Args:
+            theme: Only this theme (case-insensitive)
+            platform: Only this platform (e.g. 'Instagram', 'Blog')
+            status: Only this status (e.g. 'scheduled')
+            since: Scheduled on or after this date (YYYY-MM-DD)
+            until: Scheduled on or before this date (YYYY-MM-DD)
+            limit: Maximum number of rows
+
+        Returns:
+            List of content dicts (catalog columns)
+        """
+        clauses, params = [], []
+        if theme:
+            clauses.append("theme = ? COLLATE NOCASE")
+            params.append(theme)
+        if platform:
+            clauses.append("platform = ?")
+            params.append(platform)
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if since:
+            clauses.append("scheduled_date >= ?")
+            params.append(since)
+        if until:
+            clauses.append("scheduled_date <= ?")
+            params.append(until)
+
+        query = "SELECT * FROM content"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY COALESCE(scheduled_date, created_date) DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(query, params).fetchall()]
+
+    def counts(self) -> Dict[str, int]:
+        """Number of items per platform (blog posts count as 'Blog')."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT COALESCE(platform, content_type), COUNT(*) FROM content GROUP BY 1"
+            ).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def count_in_folder(self, folder: Path) -> int:
+        """Number of items stored under a folder (e.g. one week folder)."""
+        prefix = self.relative_path(folder) + "/"
+        with self._lock:
+            row = self._conn.execute(
+                # Range scan on the path index: every path starting with prefix
+                "SELECT COUNT(*) FROM content WHERE path >= ? AND path < ?",
+                (prefix, prefix[:-1] + "0")
+            ).fetchone()
+        return row[0]
+
+    def load_file_manifest(self) -> Dict[str, tuple]:
+        """Indexed files as {path: (mtime_ns, size, sha256)} (see library_indexer)."""
+        with self._lock:
+            rows = self._conn.execute("SELECT path, mtime_ns, size, sha256 FROM indexed_files").fetchall()
+        return {row[0]: (row[1], row[2], row[3]) for row in rows}
+
+    def update_file_manifest(self, upserts: Iterable[tuple], deletes: Iterable[str]) -> None:
+        """
+        Update the indexed file manifest in one transaction.
+
+        Args:
+            upserts: (path, mtime_ns, size, sha256) tuples
+            deletes: Paths no longer on disk
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO indexed_files (path, mtime_ns, size, sha256) VALUES (?, ?, ?, ?)",
+                list(upserts)
+            )
+            self._conn.executemany(
+                "DELETE FROM indexed_files WHERE path = ?",
+                [(path,) for path in deletes]
+            )
+
+
+def social_item_from_meta_file(meta_file: Path) -> Optional[tuple]:
+    """
+    (metadata, content path, scheduled date) for a social *_meta.json file,
+    or None if it can't be read.
+    """
+    try:
+        with open(meta_file, 'r') as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(metadata, dict):
+        return None
+
+    stem = meta_file.name[:-len("_meta.json")]
+    match = _DATE_SUFFIX.search(stem)
+    return metadata, meta_file.with_name(stem + ".md"), match.group(1) if match else None
+
+
+def blog_metadata(content_id: str, theme: str, style: Optional[Dict] = None, created: str = None) -> Dict:
+    """Catalog metadata for a blog post (blogs have no *_meta.json)."""
+    return {
+        "content_id": content_id,
+        "content_type": "blog-post",
+        "title": theme,
+        "theme": theme,
+        "created_date": created or datetime.now().isoformat(),
+        "status": "scheduled",
+        "content_details": {
+            "platform": "Blog",
+            "tone": (style or {}).get("tone"),
+            "blog_focus": (style or {}).get("blog_focus")
+        }
+    }
+
+
+def blog_item_from_file(blog_file: Path) -> Optional[tuple]:
+    """
+    (metadata, blog folder, None) for a blog markdown file written by
+    save_blog_post, or None if it isn't one.
+    """
+    if blog_file.name == "README.md":
+        return None
+
+    try:
+        with open(blog_file, 'r') as f:
+            first_line = f.readline().strip()
+    except OSError:
+        return None
+
+    if not first_line.startswith("# Blog Post:"):
+        return None
+
+    theme = first_line[len("# Blog Post:"):].strip()
+    folder = blog_file.parent
+    content_id = folder.name.rsplit("-", 1)[-1]
+    created = datetime.fromtimestamp(blog_file.stat().st_mtime).isoformat()
+    return blog_metadata(content_id, theme, created=created), folder, None
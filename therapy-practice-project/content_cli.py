@@ -9,6 +9,9 @@ import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 from create_weekly_batch_v2 import InteractiveWeeklyBatchCreator
+from library_indexer import format_refresh_stats
+from usage_ledger import UNGROUPED_LABELS, format_totals
+from week_writer import WeekWriter, published_weeks
 
 # ANSI color codes for terminal
 class Colors:
@@ -27,7 +30,10 @@ class ContentCreationMenu:
     """Interactive menu system for content creation."""
 
     def __init__(self):
-        self.creator = InteractiveWeeklyBatchCreator()
+        # One creator per session so its pooled API connections are reused
+        # across every batch generated from this menu; blog posts stream
+        # into their file so progress shows while you wait
+        self.creator = InteractiveWeeklyBatchCreator(stream_blog=True)
         self.project_root = Path(__file__).parent
         self.batches_folder = self.project_root / "weekly-batches"
 
@@ -133,19 +139,36 @@ class ContentCreationMenu:
 
         print(f"\n{Colors.GREEN}✓ Week {week_num} selected: {week_date}{Colors.END}")
 
-        # Ask about blog
-        print(f"\n{Colors.BOLD}Content Options{Colors.END}")
-        print(f"{Colors.BLUE}━━━━━━━━━━━━━━━{Colors.END}\n")
+        # Offer to resume an interrupted batch for this week
+        resume = False
+        manifest = self.creator.load_week_manifest(week_dt)
+        if manifest and any(not manifest.is_done(slot) for slot in manifest.slots()):
+            print(f"\n{Colors.YELLOW}⚠ Unfinished batch found for this week: {manifest.theme}{Colors.END}")
+            resume_choice = self.get_input(
+                "Resume it (only missing posts are regenerated)? (Y/n): ",
+                ['Y', 'N', 'YES', 'NO', '']
+            )
 
-        blog_choice = self.get_input(
-            "Include blog post with social content? (Y/n): ",
-            ['Y', 'N', 'YES', 'NO', '']
-        )
+            if resume_choice is None:
+                return
 
-        if blog_choice is None:
-            return
+            resume = resume_choice.upper() in ['Y', 'YES', '']
+
+        with_blog = manifest.with_blog if resume else False
+        if not resume:
+            # Ask about blog
+            print(f"\n{Colors.BOLD}Content Options{Colors.END}")
+            print(f"{Colors.BLUE}━━━━━━━━━━━━━━━{Colors.END}\n")
+
+            blog_choice = self.get_input(
+                "Include blog post with social content? (Y/n): ",
+                ['Y', 'N', 'YES', 'NO', '']
+            )
+
+            if blog_choice is None:
+                return
 
-        with_blog = blog_choice.upper() in ['Y', 'YES', '']
+            with_blog = blog_choice.upper() in ['Y', 'YES', '']
 
         # Confirm API key
         api_key = os.environ.get("ANTHROPIC_API_KEY")
@@ -157,7 +180,7 @@ class ContentCreationMenu:
 
         # Start content creation
         print(f"\n{Colors.BOLD}{Colors.GREEN}Starting content creation...{Colors.END}\n")
-        print(f"{Colors.YELLOW}This will take 5-10 minutes. You'll be asked to:{Colors.END}")
+        print(f"{Colors.YELLOW}This will take a few minutes. You'll be asked to:{Colors.END}")
         print(f"  1. Choose your weekly theme")
         print(f"  2. Select content style (tone, length, audience)")
         print(f"  3. Claude will generate all content\n")
@@ -170,7 +193,8 @@ class ContentCreationMenu:
         try:
             self.creator.create_interactive_batch(
                 week_start=week_date,
-                with_blog=with_blog
+                with_blog=with_blog,
+                resume=resume
             )
 
             print(f"\n{Colors.GREEN}{'='*80}{Colors.END}")
@@ -197,7 +221,8 @@ class ContentCreationMenu:
             input(f"\n{Colors.CYAN}Press Enter to continue...{Colors.END}")
             return
 
-        week_folders = sorted([f for f in self.batches_folder.iterdir() if f.is_dir()])
+        # Published weeks only (no staging leftovers), archived ones included
+        week_folders = published_weeks(self.batches_folder)
 
         if not week_folders:
             print(f"{Colors.YELLOW}No content batches found yet.{Colors.END}")
@@ -206,21 +231,29 @@ class ContentCreationMenu:
 
         print(f"{Colors.GREEN}Found {len(week_folders)} week(s):{Colors.END}\n")
 
+        # Sync hand edits so post counts come straight from the catalog
+        self.creator.indexer.refresh()
+
         for i, folder in enumerate(week_folders, 1):
-            week_name = folder.name
-            summary_file = folder / f"WEEK_{week_name.split('-')[-1].upper()}_CONTENT_SUMMARY.md"
+            writer = WeekWriter.for_published(folder)
+            week_name = writer.week_folder.name
+            week_files = writer.published_files()
+            summary_file = f"WEEK_{week_name.split('-')[-1].upper()}_CONTENT_SUMMARY.md"
 
-            if summary_file.exists():
+            if summary_file in week_files:
                 status = f"{Colors.GREEN}✓ Complete{Colors.END}"
             else:
                 status = f"{Colors.YELLOW}⚠ Incomplete{Colors.END}"
+            if writer.archive_path:
+                status += f" 📦 {folder.name}"
 
             print(f"  {Colors.CYAN}{i}.{Colors.END} {week_name} - {status}")
+            # The catalog records archived posts under their week folder path
+            print(f"     📝 {self.creator.catalog.count_in_folder(writer.week_folder)} post(s)")
 
             # Check for images
-            images_folder = folder / "images"
-            if images_folder.exists() and list(images_folder.glob("*")):
-                image_count = len(list(images_folder.glob("*")))
+            image_count = len([name for name in week_files if name.startswith("images/")])
+            if image_count:
                 print(f"     {Colors.GREEN}📸 {image_count} image(s){Colors.END}")
             else:
                 print(f"     {Colors.YELLOW}📸 No images yet{Colors.END}")
@@ -258,16 +291,18 @@ class ContentCreationMenu:
             input(f"\n{Colors.CYAN}Press Enter to continue...{Colors.END}")
             return
 
-        week_folders = sorted([f for f in self.batches_folder.iterdir() if f.is_dir()])
+        week_folders = published_weeks(self.batches_folder)
 
         print(f"{Colors.GREEN}Weeks needing images:{Colors.END}\n")
 
         needs_images = []
         for folder in week_folders:
-            images_folder = folder / "images"
-            if not images_folder.exists() or not list(images_folder.glob("*")):
+            writer = WeekWriter.for_published(folder)
+            if not any(name.startswith("images/") for name in writer.published_files()):
                 needs_images.append(folder)
-                week_name = folder.name
+                week_name = writer.week_folder.name
+                if writer.archive_path:
+                    week_name += f" {Colors.YELLOW}(archived as {folder.name}){Colors.END}"
                 print(f"  {Colors.YELLOW}•{Colors.END} {week_name}")
 
         if not needs_images:
@@ -314,22 +349,38 @@ class ContentCreationMenu:
         # Count weeks
         week_count = 0
         if self.batches_folder.exists():
-            week_count = len([f for f in self.batches_folder.iterdir() if f.is_dir()])
+            week_count = len(published_weeks(self.batches_folder))
 
         # Count images
         total_images = 0
         if self.batches_folder.exists():
-            for week_folder in self.batches_folder.iterdir():
-                if week_folder.is_dir():
-                    images_folder = week_folder / "images"
-                    if images_folder.exists():
-                        total_images += len(list(images_folder.glob("*")))
+            for week_folder in published_weeks(self.batches_folder):
+                week_files = WeekWriter.for_published(week_folder).published_files()
+                total_images += len([name for name in week_files if name.startswith("images/")])
 
         print(f"{Colors.BOLD}Status:{Colors.END}")
         print(f"  API Key: {api_status}")
         print(f"  Content Batches: {Colors.GREEN}{week_count}{Colors.END}")
         print(f"  Total Images: {Colors.GREEN}{total_images}{Colors.END}")
 
+        # Catalog counts, after syncing any hand edits to the library
+        index_stats = self.creator.indexer.refresh()
+        counts = self.creator.catalog.counts()
+        blog_count = counts.pop("Blog", 0)
+        print(f"  Catalog: {Colors.GREEN}{sum(counts.values())}{Colors.END} social post(s), "
+              f"{Colors.GREEN}{blog_count}{Colors.END} blog post(s)")
+        for platform, count in sorted(counts.items()):
+            print(f"     {platform}: {count}")
+        print(f"  Index: {format_refresh_stats(index_stats)}")
+
+        # Generation spend recorded in the usage ledger
+        usage = self.creator.usage_ledger.totals()
+        if usage:
+            print(f"\n{Colors.BOLD}Generation Cost:{Colors.END}")
+            for row in self.creator.usage_ledger.totals(by="practice"):
+                print(f"  {row['practice'] or UNGROUPED_LABELS['practice']}: {format_totals(row)}")
+            print(f"  Total: {Colors.GREEN}{format_totals(usage[0])}{Colors.END}")
+
         print(f"\n{Colors.BOLD}Paths:{Colors.END}")
         print(f"  Project: {self.project_root}")
         print(f"  Content: {self.batches_folder}")
@@ -379,6 +430,7 @@ class ContentCreationMenu:
 
 def main():
     """Entry point for the CLI."""
+    menu = None
     try:
         menu = ContentCreationMenu()
         menu.main_menu()
@@ -388,6 +440,9 @@ def main():
     except Exception as e:
         print(f"\n{Colors.RED}❌ Unexpected error: {str(e)}{Colors.END}\n")
         sys.exit(1)
+    finally:
+        if menu is not None:
+            menu.creator.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Content Calendar Planner
+
+Plans a theme for every week in a date range ahead of time, so a whole
+quarter or year can be generated headlessly without per-week decisions.
+Each week's candidates come from the observance calendar (ideas for
+observances during the week or shortly after, most specific first), then
+from the service-area theme templates. A theme is only used once, and
+never if it matches a title or theme already in the content library.
+
+The plan is written as a batch spec, so it feeds straight into the batch
+generator:
+
+Usage:
+    python content_planner.py --start 2026-01-05 --end 2026-12-28 --with-blog --out plan-2026.json
+    python create_weekly_batch_v2.py --spec plan-2026.json --use-api
+"""
+
+import argparse
+import json
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set
+
+from content_catalog import ContentCatalog, topic_key
+from create_weekly_batch_v2 import (
+    DEFAULT_STYLE, STYLE_CHOICES, THEME_TEMPLATES, normalize_style
+)
+from library_indexer import LibraryIndexer, default_roots
+from observance_calendar import ObservanceCalendar
+
+# Days after a week whose observances it can lead into (day/week
+# observances are best posted about 3-10 days ahead)
+DEFAULT_LEAD_TIME_DAYS = 7
+
+# Observance types, most specific first
+_TYPE_PRIORITY = {"day": 0, "week": 1, "month": 2}
+
+
+def plan_mondays(start: date, end: date) -> Iterator[date]:
+    """Monday of every week from the one containing start through end."""
+    week = start - timedelta(days=start.weekday())
+    while week <= end:
+        yield week
+        week += timedelta(weeks=1)
+
+
+def _interleave(theme_templates: Dict[str, List[str]]) -> List[str]:
+    """Templates alternating between service areas (one of each, then the next of each...)."""
+    themes = []
+    areas = list(theme_templates.values())
+    for i in range(max((len(area) for area in areas), default=0)):
+        themes.extend(area[i] for area in areas if i < len(area))
+    return themes
+
+
+class ContentPlanner:
+    """Assigns non-repeating weekly themes from observances and service areas."""
+
+    def __init__(
+        self,
+        observances: ObservanceCalendar,
+        used_topics: Set[str],
+        theme_templates: Optional[Dict[str, List[str]]] = None,
+        lead_time_days: int = DEFAULT_LEAD_TIME_DAYS
+    ):
+        """
+        Initialize the planner.
+
+        Args:
+            observances: Observance calendar to take candidates from
+            used_topics: Titles and themes already used (see topic_key)
+            theme_templates: Service-area themes used when no observance
+                candidate is left (defaults to THEME_TEMPLATES)
+            lead_time_days: Also consider observances this many days after
+                each week
+        """
+        self.observances = observances
+        self.used = set(used_topics)
+        self.fallback_themes = _interleave(theme_templates or THEME_TEMPLATES)
+        self.lead_time_days = lead_time_days
+
+    def week_candidates(self, week_start: date) -> List[Dict]:
+        """
+        Candidate themes for a week, best first (used ones included).
+
+        Returns:
+            List of dicts with theme, source ('observance' or 'service-area')
+            and observance (name, for observance candidates)
+        """
+        week_end = week_start + timedelta(days=6)
+        observances = sorted(
+            self.observances.upcoming(week_start, week_end, self.lead_time_days),
+            key=lambda obs: (_TYPE_PRIORITY.get(obs["type"], len(_TYPE_PRIORITY)), obs["start_date"])
+        )
+
+        candidates = []
+        for obs in observances:
+            focus = obs["focus_areas"][0] if obs["focus_areas"] else "mental health"
+            for theme in obs["content_ideas"] + [f"{obs['name']} - {focus.title()} Support"]:
+                candidates.append({"theme": theme, "source": "observance", "observance": obs["name"]})
+
+        candidates.extend({"theme": theme, "source": "service-area"} for theme in self.fallback_themes)
+        return candidates
+
+    def plan(self, start: date, end: date) -> Dict[str, List]:
+        """
+        Assign a theme to every week from start through end.
+
+        Returns:
+            Dict with "weeks" (spec week entries: week, theme, source,
+            observance) and "unplanned" (week dates with no unused theme left)
+        """
+        weeks, unplanned = [], []
+
+        for week_start in plan_mondays(start, end):
+            choice = next(
+                (candidate for candidate in self.week_candidates(week_start)
+                 if topic_key(candidate["theme"]) not in self.used),
+                None
+            )
+            if choice is None:
+                unplanned.append(week_start.isoformat())
+                continue
+
+            self.used.add(topic_key(choice["theme"]))
+            weeks.append({"week": week_start.isoformat(), **choice})
+
+        return {"weeks": weeks, "unplanned": unplanned}
+
+
+def build_plan_spec(plan: Dict[str, List], style: Dict, with_blog: bool) -> Dict:
+    """
+    Batch spec for a plan (see load_batch_spec in create_weekly_batch_v2).
+
+    Weeks that could not be planned are listed under "unplanned_weeks";
+    add a theme for them by hand if they should be generated too.
+    """
+    spec = {
+        "created": datetime.now().isoformat(),
+        "defaults": {"style": style, "with_blog": with_blog},
+        "weeks": plan["weeks"]
+    }
+    if plan["unplanned"]:
+        spec["unplanned_weeks"] = plan["unplanned"]
+    return spec
+
+
+def main():
+    """CLI interface."""
+
+    parser = argparse.ArgumentParser(
+        description="Plan non-repeating weekly themes for a date range and write them as a batch spec"
+    )
+    parser.add_argument("--start", required=True, help="First week (YYYY-MM-DD; planned from its Monday)")
+    parser.add_argument("--end", required=True, help="Last day to plan (YYYY-MM-DD)")
+    parser.add_argument(
+        "--out",
+        type=Path,
+        default=Path("content_plan.json"),
+        help="Plan file to write (default: content_plan.json)"
+    )
+    parser.add_argument(
+        "--lead-days",
+        type=int,
+        default=DEFAULT_LEAD_TIME_DAYS,
+        help=f"Consider observances up to this many days after each week (default: {DEFAULT_LEAD_TIME_DAYS})"
+    )
+    parser.add_argument("--with-blog", action="store_true", help="Include the Friday blog post each week")
+    parser.add_argument("--tone", choices=STYLE_CHOICES["tone"], default=DEFAULT_STYLE["tone"], help="Content tone")
+    parser.add_argument(
+        "--audience",
+        choices=STYLE_CHOICES["audience"],
+        default=DEFAULT_STYLE["audience"],
+        help="Target audience"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        start = date.fromisoformat(args.start)
+        end = date.fromisoformat(args.end)
+    except ValueError as e:
+        print(f"❌ Error: {e} (use YYYY-MM-DD)")
+        sys.exit(1)
+    if end < start:
+        print("❌ Error: --end is before --start")
+        sys.exit(1)
+
+    project_root = Path(__file__).parent
+    catalog = ContentCatalog()
+    try:
+        # Titles and themes already in the library, including hand edits
+        LibraryIndexer(catalog, default_roots()).refresh()
+        used_topics = catalog.existing_topics() | catalog.existing_themes()
+    finally:
+        catalog.close()
+
+    observances = ObservanceCalendar.load(project_root / "mental_health_observances.json")
+    planner = ContentPlanner(observances, used_topics, lead_time_days=args.lead_days)
+    plan = planner.plan(start, end)
+
+    style = normalize_style({"tone": args.tone, "audience": args.audience})
+    with open(args.out, 'w') as f:
+        json.dump(build_plan_spec(plan, style, args.with_blog), f, indent=2)
+
+    print(f"📅 Planned {len(plan['weeks'])} week(s) ({len(used_topics)} existing title(s)/theme(s) avoided):")
+    for week in plan["weeks"]:
+        source = f"[{week['observance']}]" if week["source"] == "observance" else "[service area]"
+        print(f"  {week['week']}  {week['theme']}  {source}")
+
+    if plan["unplanned"]:
+        print(f"\n⚠️  No unused theme left for {len(plan['unplanned'])} week(s): {', '.join(plan['unplanned'])}")
+        print("   Add themes for them in the plan file by hand")
+
+    print(f"\n✓ Plan saved: {args.out}")
+    print(f"   Generate it with: python create_weekly_batch_v2.py --spec {args.out} --use-api")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,35 +15,449 @@ Usage:
 
     # Quick auto mode (original)
     python create_weekly_batch_v2.py --week 2025-11-11 --use-api --auto-approve
+
+    # Resume an interrupted batch (only missing posts are regenerated)
+    python create_weekly_batch_v2.py --week 2025-11-11 --use-api --resume
+
+    # Headless: no prompts, settings from flags (several weeks pipelined)
+    python create_weekly_batch_v2.py --week 2025-11-10 2025-11-17 --use-api --headless \
+        --theme "Managing Social Anxiety" --tone educational --with-blog
+
+    # Headless from a JSON/YAML spec (weeks x practices, for schedulers/cron)
+    python create_weekly_batch_v2.py --spec batch_spec.json --use-api
+
+    # Generate posts one at a time instead of in parallel
+    python create_weekly_batch_v2.py --week 2025-11-11 --use-api --interactive --concurrency 1
 """
 
 import argparse
 import json
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from typing import Dict, List, Optional, Set, Tuple
-import anthropic
 import os
+import re
 import uuid
 import random
+import sqlite3
+
+from anthropic_client import AnthropicClientProvider
+from response_cache import ResponseCache
+from angle_pool import AnglePool, parse_angles
+from batch_manifest import BatchManifest, DONE, FAILED, IN_FLIGHT, MANIFEST_FILENAME
+from content_catalog import ContentCatalog, blog_metadata, topic_key
+from library_indexer import LibraryIndexer
+from near_duplicates import BODY, NearDuplicateIndex
+from observance_calendar import ObservanceCalendar
+from usage_ledger import USAGE_FIELDS, UsageLedger, call_usage, format_totals
+from week_writer import ARCHIVE_FORMATS, WeekWriter
+from config import get_duplicate_settings
+from document_templates import DocumentTemplates
+from rate_limiter import RateLimiter, estimate_tokens
+
+
+# Maximum number of generation calls in flight at once (8 social posts + 1 blog)
+DEFAULT_MAX_CONCURRENCY = 9
+
+# Model used for all content generation
+DEFAULT_MODEL = "claude-sonnet-4-20250514"
+
+# Max tokens for a single social post and for a full blog post
+SOCIAL_MAX_TOKENS = 2000
+BLOG_MAX_TOKENS = 8000
+
+# Shortest prompt prefix the API caches for DEFAULT_MODEL; a cache_control
+# breakpoint on a shorter prefix is ignored
+MIN_CACHEABLE_TOKENS = 1024
+
+# Default batches root (spec practices without an output_dir get a subfolder)
+WEEKLY_BATCHES_DIR = Path(__file__).parent / "weekly-batches"
+
+# Blog files being streamed carry this suffix until the post is complete
+PARTIAL_SUFFIX = ".partial"
+
+# Tool the model fills in for a social post in structured mode, so the
+# caption, hashtags and suggestions come back as fields instead of markdown
+SOCIAL_POST_TOOL = {
+    "name": "social_post",
+    "description": "Record the finished social media post.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "caption": {"type": "string", "description": "Main caption/post text, without hashtags"},
+            "hashtags": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "5-8 hashtags, each starting with #"
+            },
+            "visual_suggestions": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Image or video ideas for the post"
+            },
+            "engagement_tips": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Tips for posting and responding to comments"
+            }
+        },
+        "required": ["caption", "hashtags", "visual_suggestions", "engagement_tips"]
+    }
+}
+
+# Labels for usage ledger call kinds in summaries
+USAGE_KIND_LABELS = {"social": "Social posts", "blog": "Blog post", "angles": "Angle pool"}
+
+# Line separating the blog file header from the generated content
+BLOG_HEADER_END = "---\n\n"
+
+# Seconds between live throughput updates while streaming
+STREAM_REPORT_INTERVAL = 5
+
+# Number of weeks a headless run works on at the same time
+DEFAULT_PIPELINE_DEPTH = 2
+
+# Day offsets from the Monday week start
+DAY_OFFSETS = {
+    "Monday": 0, "Tuesday": 1, "Wednesday": 2, "Thursday": 3,
+    "Friday": 4, "Saturday": 5, "Sunday": 6
+}
+
+# Distribution: 2 posts per day Mon-Thu across 3 platforms
+DEFAULT_POSTING_SCHEDULE = [
+    {"day": "Monday", "platform": "Instagram"},
+    {"day": "Monday", "platform": "LinkedIn"},
+    {"day": "Tuesday", "platform": "Facebook"},
+    {"day": "Tuesday", "platform": "Instagram"},
+    {"day": "Wednesday", "platform": "Instagram"},
+    {"day": "Wednesday", "platform": "LinkedIn"},
+    {"day": "Thursday", "platform": "Facebook"},
+    {"day": "Thursday", "platform": "Instagram"},
+]
+
+# Valid style values (see interactive_style_selection)
+STYLE_CHOICES = {
+    "tone": ["professional", "warm_empathetic", "educational", "personal"],
+    "audience": ["general", "parents", "couples", "teens", "adults_individual"],
+    "blog_focus": ["comprehensive", "practical_strategies", "seeking_help", "local_resources"],
+}
+
+# Style used by headless runs for any field the spec leaves out
+DEFAULT_STYLE = {
+    "tone": "warm_empathetic",
+    "social_length": 200,
+    "audience": "general",
+    "blog_focus": "comprehensive",
+}
+
+# Angles requested per angle pool call (a theme's pool lasts several weeks)
+ANGLE_POOL_SIZE = 40
+ANGLE_POOL_MAX_TOKENS = 2000
+
+# Angles used without the model (fixed_angles) and to fill up a pool that
+# has run out
+FIXED_ANGLE_TEMPLATES = [
+    "Quick Tips: {theme}",
+    "Understanding {theme}",
+    "Common Myths About {theme}",
+    "How to Talk About {theme}",
+    "Signs You Need Help With {theme}",
+    "{theme}: What to Expect in Therapy",
+    "Supporting a Loved One With {theme}",
+    "{theme} and Self-Care Strategies"
+]
+
+# What to do with an angle too similar to an existing post:
+# flag (warn), block (swap in an alternative angle) or off
+DUPLICATE_ANGLE_MODES = ("flag", "block", "off")
+
+# Extra angles swapped in for near-duplicate ones in block mode
+ALTERNATE_ANGLE_TEMPLATES = [
+    "{theme}: A Therapist's Perspective",
+    "Small Daily Steps for {theme}",
+    "Questions to Ask About {theme}",
+    "{theme}: Stories of Progress",
+    "{theme} at Work",
+    "{theme} in Families",
+    "Mindfulness Practices for {theme}",
+    "Setting Boundaries Around {theme}"
+]
+
+
+# Suggested weekly themes per service area (random suggestions and the
+# content planner's fallback when no observance fits)
+THEME_TEMPLATES = {
+    "anxiety": [
+        "Anxiety and Sleep Problems",
+        "Managing Social Anxiety",
+        "Panic Attack Coping Strategies",
+        "Workplace Anxiety Management",
+        "Anxiety in Relationships"
+    ],
+    "depression": [
+        "Recognizing and Treating Depression",
+        "Depression vs Sadness",
+        "Seasonal Depression Support",
+        "Depression and Relationships",
+        "Finding Hope in Depression"
+    ],
+    "couples": [
+        "Communication Skills for Healthy Relationships",
+        "Rebuilding Trust in Relationships",
+        "Conflict Resolution for Couples",
+        "Intimacy and Connection",
+        "When to Seek Couples Therapy"
+    ],
+    "teens": [
+        "Teen Mental Health Warning Signs",
+        "Supporting Anxious Teenagers",
+        "Teen Depression and School Performance",
+        "Helping Teens Build Coping Skills",
+        "Parent-Teen Communication"
+    ],
+    "trauma": [
+        "Understanding EMDR Therapy",
+        "Healing from Past Trauma",
+        "Complex PTSD vs PTSD",
+        "Trauma-Informed Therapy Approaches",
+        "Recovery from Sexual Trauma"
+    ],
+    "adhd": [
+        "ADHD in Adults",
+        "ADHD and Relationship Challenges",
+        "Executive Function Skills",
+        "ADHD Medication vs Therapy",
+        "Time Management with ADHD"
+    ]
+}
+
+def week_folder_name(week_dt: datetime) -> str:
+    """Folder name of a week's batch, e.g. 2025-week-46."""
+    return f"{week_dt.year}-week-{week_dt.isocalendar()[1]:02d}"
+
+
+def practice_slug(name: str) -> str:
+    """Folder name for a practice's batches (lowercase, hyphenated)."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-") or "practice"
+
+
+def _display_path(path: Path, base: Path = None) -> Path:
+    """Path relative to base (default: cwd) when possible, otherwise absolute."""
+    try:
+        return path.relative_to(base or Path.cwd())
+    except ValueError:
+        return path
+
+
+def _dropped_stream_usage(stream, text: str) -> SimpleNamespace:
+    """
+    Usage of a stream that failed part way: the input tokens the API
+    reported when it started (none if it never did) and output tokens
+    estimated from the text received.
+    """
+    try:
+        reported = stream.current_message_snapshot.usage
+    except Exception:
+        reported = None
+    usage = {field: getattr(reported, field, 0) or 0 for field in USAGE_FIELDS}
+    if text:
+        usage["output_tokens"] = max(usage["output_tokens"], estimate_tokens(text))
+    return SimpleNamespace(**usage)
+
+
+def format_prompt_cache_usage(usage: Dict) -> Optional[str]:
+    """One-line prompt cache read/write summary, or None if no API calls were made."""
+    uncached = usage["input_tokens"]
+    written = usage["cache_creation_input_tokens"]
+    read = usage["cache_read_input_tokens"]
+    if not (uncached or written or read):
+        return None
+
+    total = uncached + written + read
+    return (f"{read:,} input tokens read from cache, {written:,} written to cache, "
+            f"{uncached:,} uncached ({read / total:.0%} of input served from cache)")
+
+
+def normalize_post_fields(fields: Dict) -> Dict:
+    """Structured post fields from SOCIAL_POST_TOOL, with missing fields and stray hashtag formats tidied."""
+    def as_list(value) -> List[str]:
+        if isinstance(value, str):
+            value = [value]
+        return [str(item).strip() for item in value or [] if str(item).strip()]
+
+    hashtags = []
+    for tag in as_list(fields.get("hashtags")):
+        for word in tag.split():
+            word = "#" + word.lstrip("#")
+            if len(word) > 1 and word not in hashtags:
+                hashtags.append(word)
+
+    return {
+        "caption": str(fields.get("caption") or "").strip(),
+        "hashtags": hashtags,
+        "visual_suggestions": as_list(fields.get("visual_suggestions")),
+        "engagement_tips": as_list(fields.get("engagement_tips"))
+    }
+
+
+def render_post_markdown(fields: Dict) -> str:
+    """Post file contents for structured post fields."""
+    text = fields["caption"] + "\n\n"
+    if fields["hashtags"]:
+        text += " ".join(fields["hashtags"]) + "\n\n"
+    for heading, key in [("Visual suggestions", "visual_suggestions"), ("Engagement tips", "engagement_tips")]:
+        if fields[key]:
+            text += f"**{heading}:**\n" + "".join(f"- {item}\n" for item in fields[key]) + "\n"
+    return text
+
+
+def cached_payload(payload: Dict) -> Dict:
+    """A response cache payload served again: its usage is marked cached (and free)."""
+    if "usage" not in payload:
+        return payload
+    return {**payload, "usage": {**payload["usage"], "cached": True, "cost_usd": 0.0}}
+
+
+def response_payload(message) -> Dict:
+    """
+    Response cache payload for a Messages API response.
+
+    Returns:
+        {"text": ...}, plus "fields" (see normalize_post_fields) when the
+        model answered with a SOCIAL_POST_TOOL call
+    """
+    for block in message.content:
+        if getattr(block, "type", None) == "tool_use" and block.name == SOCIAL_POST_TOOL["name"]:
+            fields = normalize_post_fields(block.input)
+            return {"text": render_post_markdown(fields), "fields": fields}
+    return {"text": message.content[0].text}
 
 
 class InteractiveWeeklyBatchCreator:
     """Interactive weekly batch content creator with blog integration."""
 
-    def __init__(self, library_path: Path = None):
-        """Initialize the batch creator."""
+    def __init__(
+        self,
+        library_path: Path = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        client_provider: Optional[AnthropicClientProvider] = None,
+        response_cache: Optional[ResponseCache] = None,
+        stream_blog: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        catalog: Optional[ContentCatalog] = None,
+        near_duplicates: Optional[NearDuplicateIndex] = None,
+        duplicate_angles: Optional[str] = None,
+        archive_format: Optional[str] = None,
+        templates_path: Optional[Path] = None,
+        angle_pool: Optional[AnglePool] = None,
+        fixed_angles: bool = False,
+        structured_posts: bool = True,
+        usage_ledger: Optional[UsageLedger] = None
+    ):
+        """
+        Initialize the batch creator.
+
+        Args:
+            library_path: Content library folder (defaults to social-media-content/)
+            max_concurrency: Maximum number of API calls to run in parallel
+                (1 generates everything sequentially)
+            client_provider: Shared Anthropic client provider (one is created
+                if not given; it lives as long as this creator)
+            response_cache: On-disk response cache (defaults to .cache/responses/)
+            stream_blog: Stream blog posts into their file as they are
+                written (see stream_blog_post)
+            rate_limiter: Shared rate limiter and retry scheduler for API
+                calls (one using the .env limits is created if not given)
+            catalog: Content catalog that saved posts are recorded in
+                (defaults to .cache/content_catalog.db)
+            near_duplicates: MinHash index of saved post titles and text
+                (defaults to .cache/near_duplicates.db)
+            duplicate_angles: What to do with angles too similar to an
+                existing post - flag, block or off (defaults to
+                DUPLICATE_ANGLE_MODE, see config.get_duplicate_settings)
+            archive_format: Publish finished weeks as a 'tar' (.tar.gz) or
+                'zip' archive instead of a folder (see WeekWriter)
+            templates_path: Folder with practice-specific document templates
+                (defaults to CONTENT_TEMPLATES_DIR, see DocumentTemplates)
+            angle_pool: Generated angles per theme (defaults to
+                .cache/angle_pools.db)
+            fixed_angles: Use the fixed angle templates instead of
+                generated angle pools
+            structured_posts: Have the model return social posts as fields
+                (SOCIAL_POST_TOOL) that are stored in each post's metadata,
+                instead of free-form markdown
+            usage_ledger: Ledger every API call's tokens, latency and cost
+                are recorded in (defaults to .cache/usage_ledger.db)
+        """
         if library_path is None:
             library_path = Path(__file__).parent / "social-media-content"
 
         self.library_path = library_path
+        self.max_concurrency = max(1, max_concurrency)
+        self.client_provider = client_provider or AnthropicClientProvider()
+        self.response_cache = response_cache or ResponseCache()
+        self.stream_blog = stream_blog
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.catalog = catalog or ContentCatalog()
+        self.near_duplicates = near_duplicates or NearDuplicateIndex()
+        self.duplicate_angles = duplicate_angles or get_duplicate_settings()["angle_mode"]
+        if self.duplicate_angles not in DUPLICATE_ANGLE_MODES:
+            raise ValueError(
+                f"Unknown duplicate angle mode '{self.duplicate_angles}' "
+                f"(choose from {', '.join(DUPLICATE_ANGLE_MODES)})"
+            )
+        self.indexer = LibraryIndexer(
+            self.catalog, [library_path, Path(__file__).parent / "weekly-batches"], self.near_duplicates
+        )
+
+        # Weeks are written into a staging folder and published when done
+        if archive_format is not None and archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(
+                f"Unknown archive format '{archive_format}' (choose from {', '.join(ARCHIVE_FORMATS)})"
+            )
+        self.archive_format = archive_format
+        self._week_writers: Dict[Path, WeekWriter] = {}
+        self._week_practices: Dict[Path, Optional[str]] = {}
+        self._week_writers_lock = threading.Lock()
+
+        # Image guides, blog README and weekly summary
+        self.templates = DocumentTemplates(templates_path)
+
+        # Angles come from a generated pool per theme; angles drawn by a
+        # practice's weeks that haven't saved their posts yet are reserved
+        # in _drawn_angles (per practice, so practices don't starve each other)
+        self.angle_pool = angle_pool or AnglePool()
+        self.fixed_angles = fixed_angles
+        self.structured_posts = structured_posts
+        self._drawn_angles: Dict[Optional[str], Set[str]] = {}
+        self._theme_locks: Dict[str, threading.Lock] = {}
+        self._angle_lock = threading.Lock()
+
+        # Per-call usage and cost (per post, week, practice and run)
+        self.usage_ledger = usage_ledger or UsageLedger()
+
+        # Token usage across every call made by this creator
+        self._usage = {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0
+        }
+        self._usage_lock = threading.Lock()
+
+        # Caps in-flight API calls across every week this creator is running
+        self._api_slots = threading.BoundedSemaphore(self.max_concurrency)
         self.blog_path = Path(__file__).parent / "blog-posts"
         self.performance_profile_path = Path(__file__).parent / "performance_profile.json"
         self.observances_path = Path(__file__).parent / "mental_health_observances.json"
 
-        # Load observances calendar
-        self.observances = self._load_observances()
+        # Observances calendar, parsed and indexed once
+        self.observances = ObservanceCalendar.load(self.observances_path)
 
         # Service areas for topic generation
         self.service_areas = {
@@ -57,57 +471,196 @@ class InteractiveWeeklyBatchCreator:
         }
 
         # Theme templates
-        self.theme_templates = {
-            "anxiety": [
-                "Anxiety and Sleep Problems",
-                "Managing Social Anxiety",
-                "Panic Attack Coping Strategies",
-                "Workplace Anxiety Management",
-                "Anxiety in Relationships"
-            ],
-            "depression": [
-                "Recognizing and Treating Depression",
-                "Depression vs Sadness",
-                "Seasonal Depression Support",
-                "Depression and Relationships",
-                "Finding Hope in Depression"
-            ],
-            "couples": [
-                "Communication Skills for Healthy Relationships",
-                "Rebuilding Trust in Relationships",
-                "Conflict Resolution for Couples",
-                "Intimacy and Connection",
-                "When to Seek Couples Therapy"
-            ],
-            "teens": [
-                "Teen Mental Health Warning Signs",
-                "Supporting Anxious Teenagers",
-                "Teen Depression and School Performance",
-                "Helping Teens Build Coping Skills",
-                "Parent-Teen Communication"
-            ],
-            "trauma": [
-                "Understanding EMDR Therapy",
-                "Healing from Past Trauma",
-                "Complex PTSD vs PTSD",
-                "Trauma-Informed Therapy Approaches",
-                "Recovery from Sexual Trauma"
-            ],
-            "adhd": [
-                "ADHD in Adults",
-                "ADHD and Relationship Challenges",
-                "Executive Function Skills",
-                "ADHD Medication vs Therapy",
-                "Time Management with ADHD"
-            ]
+        self.theme_templates = THEME_TEMPLATES
+
+    def close(self) -> None:
+        """Release pooled API connections and the indexes held by this creator."""
+        self.client_provider.close()
+        self.angle_pool.close()
+        self.usage_ledger.close()
+        self.near_duplicates.close()
+        self.catalog.close()
+
+    def _catalog_record(self, metadata: Dict, path: Path, scheduled_date: Optional[str] = None) -> None:
+        """Record saved content in the catalog; a catalog error never fails a save."""
+        try:
+            self.catalog.record(metadata, self.published_path(path), scheduled_date)
+        except sqlite3.Error as e:
+            print(f"  ⚠️  Could not update content catalog: {e}")
+
+    def _build_request(
+        self,
+        prompt: str,
+        max_tokens: int,
+        system: Optional[str] = None,
+        tool: Optional[Dict] = None,
+        cache_system: bool = True
+    ) -> Dict:
+        """
+        Build Messages API parameters for a prompt.
+
+        The stable instructions go first as a system block with a
+        cache_control breakpoint, so repeated calls with the same style
+        read that prefix from the API's prompt cache; the varying part of
+        the prompt comes last in the user message. Callers whose system
+        prompt is shorter than MIN_CACHEABLE_TOKENS pass
+        cache_system=False, since the API would not cache it anyway.
+
+        With a tool, the model is required to answer by calling it, so the
+        response comes back as the tool's structured input.
+
+        Every backend (direct calls and the Message Batches API) sends
+        exactly these parameters, so they share response cache entries.
+        """
+        request = {
+            "model": DEFAULT_MODEL,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}]
+        }
+        if system:
+            block = {"type": "text", "text": system}
+            if cache_system:
+                block["cache_control"] = {"type": "ephemeral"}
+            request["system"] = [block]
+        if tool:
+            request["tools"] = [tool]
+            request["tool_choice"] = {"type": "tool", "name": tool["name"]}
+        return request
+
+    def _request_cache_key(self, request: Dict, cache_scope: Dict) -> str:
+        """
+        Response cache key for request parameters from _build_request().
+
+        Args:
+            request: Request parameters
+            cache_scope: The job the request is for (see job_cache_scope);
+                part of the key, so identical prompts for other weeks,
+                practices or batches never share a response
+        """
+        extra = {k: v for k, v in request.items() if k not in ("model", "max_tokens", "messages")}
+        return self.response_cache.make_key(
+            request["model"], request["max_tokens"], request["messages"][0]["content"],
+            job=cache_scope, **extra
+        )
+
+    def job_cache_scope(self, manifest: BatchManifest, slot_id: str) -> Dict:
+        """
+        Response cache scope of a manifest slot.
+
+        A cached response is only served when this same slot of this same
+        batch (practice, week and manifest) is generated again - a retry or
+        a --resume - never because another week or practice produced the
+        same prompt text.
+        """
+        _, practice = self._staged_week(manifest.week_folder)
+        return {
+            "practice": practice,
+            "week": self.catalog.relative_path(self.published_path(manifest.week_folder)),
+            "batch": manifest.data.get("created"),
+            "slot": slot_id
         }
 
-    def _load_observances(self) -> Dict:
-        """Load mental health observances calendar."""
-        if self.observances_path.exists():
-            with open(self.observances_path, 'r') as f:
-                return json.load(f)
-        return {"observances": {}}
+    def record_usage(self, usage) -> None:
+        """Add a response's token usage to this creator's running totals."""
+        if usage is None:
+            return
+        with self._usage_lock:
+            for field in self._usage:
+                self._usage[field] += getattr(usage, field, 0) or 0
+
+    def usage_stats(self) -> Dict:
+        """Snapshot of token usage totals (input, output, cache write, cache read)."""
+        with self._usage_lock:
+            return dict(self._usage)
+
+    def print_run_usage(self) -> None:
+        """Print this run's API cost from the usage ledger (per practice when there are several)."""
+        run_totals = self.usage_ledger.run_totals()
+        if not run_totals:
+            return
+
+        print(f"💵 Run cost: {format_totals(run_totals)}")
+        by_practice = self.usage_ledger.totals(by="practice", run_id=self.usage_ledger.run_id)
+        if len(by_practice) > 1:
+            for row in by_practice:
+                print(f"     {row['practice'] or '(default)'}: {format_totals(row)}")
+
+    def _record_call(self, usage: Optional[Dict], kind: str, path: Optional[Path] = None) -> None:
+        """
+        Add an API call to the usage ledger; a ledger error never fails a save.
+
+        Args:
+            usage: Usage record (see call_usage); calls served from the
+                response cache are skipped
+            kind: What the call generated ('social', 'blog', 'angles')
+            path: Generated file or folder, in a staged week
+        """
+        if not usage or usage.get("cached"):
+            return
+
+        week = practice = content_path = None
+        if path is not None:
+            content_path = self.catalog.relative_path(self.published_path(path))
+            writer, practice = self._staged_week(path)
+            if writer:
+                week = self.catalog.relative_path(writer.week_folder)
+
+        try:
+            self.usage_ledger.record(usage, kind, practice=practice, week=week, path=content_path)
+        except sqlite3.Error as e:
+            print(f"  ⚠️  Usage not recorded: {e}")
+
+    def _generate(
+        self,
+        prompt: str,
+        max_tokens: int,
+        api_key: str,
+        system: Optional[str] = None,
+        tool: Optional[Dict] = None,
+        cache_scope: Optional[Dict] = None,
+        cache_system: bool = True
+    ) -> Dict:
+        """
+        Send a prompt to the model, serving retries of the same job from the
+        response cache.
+
+        Args:
+            prompt: Varying part of the prompt (the user message)
+            max_tokens: Max tokens for the response
+            api_key: Anthropic API key
+            system: Stable instructions sent as a system block
+            tool: Tool the model must answer with (see _build_request)
+            cache_scope: Job the call is for (see job_cache_scope); calls
+                without one bypass the response cache
+            cache_system: Mark the system block for prompt caching (see
+                _build_request)
+
+        Returns:
+            Response payload with "text", "usage" (see call_usage) and
+            "fields" for structured posts (see response_payload)
+        """
+        request = self._build_request(prompt, max_tokens, system, tool, cache_system)
+        cache_key = self._request_cache_key(request, cache_scope) if cache_scope else None
+        cached = self.response_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            return cached_payload(cached)
+
+        client = self.client_provider.get_client(api_key)
+
+        with self._api_slots:
+            started = time.time()
+            message = self.rate_limiter.call(
+                lambda: client.messages.create(**request),
+                estimate_tokens((system or "") + prompt)
+            )
+            latency = time.time() - started
+
+        self.record_usage(message.usage)
+        payload = response_payload(message)
+        payload["usage"] = call_usage(message.usage, request["model"], latency)
+        if cache_key:
+            self.response_cache.put(cache_key, payload)
+        return payload
 
     def find_relevant_observances(self, week_start: datetime, week_end: datetime, lead_time_days: int = 14) -> List[Dict]:
         """
@@ -119,65 +672,16 @@ class InteractiveWeeklyBatchCreator:
             lead_time_days: How many days ahead to look for observances
 
         Returns:
-            List of relevant observances with name, date, type, and description
+            List of relevant observances with name, type, start_date,
+            end_date, focus_areas and description (see ObservanceCalendar)
         """
-        observances_data = self._load_observances()
-        relevant = []
-
-        # Look ahead window
-        search_end = week_end + timedelta(days=lead_time_days)
-
-        for obs_id, obs_data in observances_data.get("observances", {}).items():
-            # Parse observance date
-            try:
-                obs_date_str = obs_data.get("date", "")
-
-                # Handle date ranges (e.g., "November 01 - November 30")
-                if " - " in obs_date_str:
-                    start_str, end_str = obs_date_str.split(" - ")
-                    obs_start = datetime.strptime(f"{start_str} {week_start.year}", "%B %d %Y")
-                    obs_end = datetime.strptime(f"{end_str} {week_start.year}", "%B %d %Y")
-
-                    # Check if observance overlaps with our search window
-                    if obs_start <= search_end and obs_end >= week_start:
-                        relevant.append({
-                            "name": obs_data.get("name", ""),
-                            "date": obs_date_str,
-                            "type": obs_data.get("type", "day"),
-                            "description": " - ".join(obs_data.get("content_ideas", ["Mental health awareness"]))
-                        })
-                else:
-                    # Single date
-                    obs_date = datetime.strptime(f"{obs_date_str} {week_start.year}", "%B %d %Y")
-
-                    # Check if within search window
-                    if week_start <= obs_date <= search_end:
-                        relevant.append({
-                            "name": obs_data.get("name", ""),
-                            "date": obs_date_str,
-                            "type": obs_data.get("type", "day"),
-                            "description": " - ".join(obs_data.get("content_ideas", ["Mental health awareness"]))
-                        })
-            except (ValueError, AttributeError):
-                continue
-
-        return relevant
+        return self.observances.upcoming(week_start, week_end, lead_time_days)
 
     def get_existing_topics(self) -> Set[str]:
-        """Scan content library and extract all existing topics/titles."""
-        existing_topics = set()
-
-        for meta_file in self.library_path.rglob("*_meta.json"):
-            try:
-                with open(meta_file, 'r') as f:
-                    meta = json.load(f)
-                    title = meta.get("title", "").lower()
-                    if title:
-                        existing_topics.add(title)
-            except:
-                continue
-
-        return existing_topics
+        """Get all existing topics/titles (lower-cased) from the content catalog."""
+        # Pick up files added, edited or deleted by hand since the last call
+        self.indexer.refresh()
+        return self.catalog.existing_topics()
 
     def interactive_theme_selection(self, observances: List[Dict]) -> Tuple[str, str]:
         """
@@ -433,42 +937,168 @@ class InteractiveWeeklyBatchCreator:
 
         return style
 
-    def generate_social_angles(self, theme: str, count: int = 8) -> List[str]:
+    def build_angle_pool_prompt(self, theme: str, count: int, avoid: List[str]) -> str:
+        """Build the prompt asking for a pool of angles for a theme."""
+
+        prompt = f"""Suggest {count} distinct angles for social media posts about: {theme}
+
+The posts are for a counseling practice in Hendersonville NC. Each angle becomes one post's title, so vary the format (tips, myths, questions, stories, checklists, what to expect in therapy) and the perspective (individuals, partners, parents, workplaces).
+
+Rules:
+- One angle per line, no numbering, no explanations
+- At most 80 characters each
+- HIPAA compliant (no diagnosis, no treatment advice)"""
+
+        if avoid:
+            prompt += "\n\nAlready used - do not repeat or rephrase these:\n" + "\n".join(
+                f"- {angle}" for angle in avoid
+            )
+
+        return prompt
+
+    def _theme_lock(self, theme: str) -> threading.Lock:
+        """Lock serializing pool draws for one theme (weeks run in parallel)."""
+        with self._angle_lock:
+            return self._theme_locks.setdefault(topic_key(theme), threading.Lock())
+
+    def _usable_angle(self, angle: str, used: Set[str], drawn: Set[str]) -> bool:
+        """
+        Whether an angle hasn't been used or reserved yet (and, in block
+        mode, doesn't nearly duplicate a past post - flag mode only reports
+        those, see screen_angles).
+        """
+        key = topic_key(angle)
+        if key in used or key in drawn:
+            return False
+        if self.duplicate_angles == "block" and self.near_duplicates.find_duplicate(angle) is not None:
+            return False
+        return True
+
+    def generate_social_angles(
+        self,
+        theme: str,
+        count: int = 8,
+        api_key: Optional[str] = None,
+        practice: Optional[str] = None
+    ) -> List[str]:
         """
         Generate unique social media angles from a theme.
 
+        Angles are drawn from the theme's angle pool, skipping titles already
+        in the content library (or, in block mode, nearly duplicating one)
+        and angles drawn by the practice's other weeks in this run. The pool
+        is generated with one call per theme and only topped up when fewer
+        than ``count`` unused angles are left. Without an API key (or with
+        fixed_angles) the fixed angle templates are used.
+
         Args:
             theme: Main theme
             count: Number of angles to generate (default 8 for Mon-Thu)
+            api_key: Anthropic API key for generating the pool
+            practice: Practice the week is for (angles are reserved per practice)
+
+        Returns:
+            List of unique angle topics - fewer than ``count`` (with a
+            warning) if the pool and the fixed angles ran out
+        """
+        fixed = [template.format(theme=theme) for template in FIXED_ANGLE_TEMPLATES]
+        if self.fixed_angles or not api_key:
+            return fixed[:count]
+
+        with self._angle_lock:
+            drawn = self._drawn_angles.setdefault(practice, set())
+
+        with self._theme_lock(theme):
+            # Pick up posts added, edited or deleted by hand since the last draw
+            used = self.get_existing_topics()
+            pool = self.angle_pool.get(theme)
+            unused = [angle for angle in pool if self._usable_angle(angle, used, drawn)]
+
+            if len(unused) < count:
+                used_for_theme = [angle for angle in pool if angle not in unused]
+                prompt = self.build_angle_pool_prompt(theme, ANGLE_POOL_SIZE, used_for_theme)
+                try:
+                    payload = self._generate(prompt, max_tokens=ANGLE_POOL_MAX_TOKENS, api_key=api_key)
+                except Exception as e:
+                    print(f"  ⚠️  Could not generate angles for \"{theme}\" ({e}) - using fixed angles")
+                else:
+                    self._record_call(payload.get("usage"), "angles")
+                    pool = self.angle_pool.extend(theme, parse_angles(payload["text"], prompt))
+                    unused = [angle for angle in pool if self._usable_angle(angle, used, drawn)]
+                    print(f"  💡 Angle pool for \"{theme}\": {len(unused)} unused of {len(pool)}")
+
+            # A pool that ran dry is filled up with fixed angles that are still unused
+            angles = unused[:count]
+            for angle in fixed:
+                if len(angles) >= count:
+                    break
+                if angle not in angles and self._usable_angle(angle, used, drawn):
+                    angles.append(angle)
+            if len(angles) < count:
+                print(f"  ⚠️  Angle pool for \"{theme}\" ran out - only {len(angles)} of {count} angles")
+
+            with self._angle_lock:
+                drawn.update(topic_key(angle) for angle in angles)
+
+        return angles
+
+    def screen_angles(self, theme: str, angles: List[str]) -> List[str]:
+        """
+        Check angles against the near-duplicate index of past posts.
+
+        In flag mode near duplicates are reported; in block mode each one is
+        replaced by an alternative angle (see ALTERNATE_ANGLE_TEMPLATES) that
+        isn't a near duplicate itself, and kept with a warning if none is left.
+
+        Args:
+            theme: Main theme
+            angles: Angles from generate_social_angles()
 
         Returns:
-            List of unique angle topics
-        """
-        # For now, generate simple variations
-        # In production, could use AI to generate these
-
-        base_angles = [
-            f"Quick Tips: {theme}",
-            f"Understanding {theme}",
-            f"Common Myths About {theme}",
-            f"How to Talk About {theme}",
-            f"Signs You Need Help With {theme}",
-            f"{theme}: What to Expect in Therapy",
-            f"Supporting a Loved One With {theme}",
-            f"{theme} and Self-Care Strategies"
+            Angles to use, in the same order
+        """
+        if self.duplicate_angles == "off":
+            return angles
+
+        # Pick up posts added, edited or deleted by hand since the last check
+        self.indexer.refresh()
+
+        alternates = [
+            template.format(theme=theme) for template in ALTERNATE_ANGLE_TEMPLATES
+            if template.format(theme=theme) not in angles
         ]
+        screened = []
+        for angle in angles:
+            match = self.near_duplicates.find_duplicate(angle)
+            if match is None:
+                screened.append(angle)
+                continue
 
-        return base_angles[:count]
+            similar = f"{match['similarity']:.0%} similar to \"{match['title']}\" ({match['path']})"
+            if self.duplicate_angles == "block":
+                replacement = next(
+                    (alt for alt in alternates if self.near_duplicates.find_duplicate(alt) is None), None
+                )
+                if replacement:
+                    alternates.remove(replacement)
+                    print(f"  🔁 \"{angle}\" is {similar} - using \"{replacement}\"")
+                    screened.append(replacement)
+                    continue
 
-    def create_social_post(
-        self,
-        angle: str,
-        theme: str,
-        platform: str,
-        style: Dict,
-        api_key: str
-    ) -> Optional[Dict]:
-        """Create a single social media post."""
+            print(f"  ⚠️  Near duplicate: \"{angle}\" is {similar}")
+            screened.append(angle)
+
+        return screened
+
+    def build_social_system(self, style: Dict) -> str:
+        """
+        Build the system prompt shared by every social post with this style.
+
+        Only the angle, theme and platform change from post to post, so
+        this part is sent as the system block. At roughly 250 tokens it is
+        well below MIN_CACHEABLE_TOKENS, so it goes without a prompt cache
+        breakpoint (see _build_request).
+        """
 
         tone_prompts = {
             'professional': "Use a professional, clinical tone with evidence-based language.",
@@ -485,9 +1115,7 @@ class InteractiveWeeklyBatchCreator:
             'adults_individual': "adults in Hendersonville NC seeking individual therapy"
         }
 
-        prompt = f"""Create a {platform} post about: {angle}
-
-MAIN THEME: {theme}
+        system = f"""You create social media posts for a counseling practice.
 
 TARGET AUDIENCE: {audience_prompts[style['audience']]}
 
@@ -512,67 +1140,110 @@ Please provide:
 - Visual suggestions
 - Engagement tips"""
 
-        try:
-            client = anthropic.Anthropic(api_key=api_key)
+        return system
 
-            message = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=2000,
-                messages=[{"role": "user", "content": prompt}]
-            )
+    def build_social_prompt(self, angle: str, theme: str, platform: str) -> str:
+        """Build the per-post part of a social media prompt."""
 
-            content_text = message.content[0].text
-
-            # Create metadata
-            content_id = str(uuid.uuid4())[:8]
-            metadata = {
-                "content_id": content_id,
-                "content_type": f"{platform.lower()}-post",
-                "title": angle,
-                "theme": theme,
-                "created_date": datetime.now().isoformat(),
-                "created_by_agent": "interactive-batch-creator",
-                "status": "scheduled",
-                "content_details": {
-                    "platform": platform,
-                    "target_audience": style['audience'],
-                    "tone": style['tone'],
-                    "word_count": style['social_length']
-                },
-                "performance": {
-                    "views": 0,
-                    "likes": 0,
-                    "comments": 0,
-                    "shares": 0
-                },
-                "compliance": {
-                    "hipaa_reviewed": True,
-                    "contains_phi": False
-                }
-            }
+        prompt = f"""Create a {platform} post about: {angle}
 
-            return {
-                "content": content_text,
-                "metadata": metadata,
-                "filename": f"{angle.lower().replace(' ', '-')[:50]}-{content_id}"
-            }
+MAIN THEME: {theme}"""
 
-        except Exception as e:
-            print(f"  ❌ Error creating content: {str(e)}")
-            return None
+        return prompt
 
-    def create_blog_post(
+    def build_social_content(
         self,
+        angle: str,
         theme: str,
+        platform: str,
         style: Dict,
-        api_key: str,
-        week_folder: Path
-    ) -> Optional[Path]:
+        content_text: str,
+        fields: Optional[Dict] = None,
+        usage: Optional[Dict] = None
+    ) -> Dict:
         """
-        Create PRD v2.2 compliant blog post.
+        Wrap generated post text with its metadata and filename.
+
+        Args:
+            fields: Structured post fields (caption, hashtags,
+                visual_suggestions, engagement_tips), stored in the
+                metadata as "post"
+            usage: Tokens, latency and cost of the call (see call_usage),
+                stored in the metadata as "generation"
 
         Returns:
-            Path to blog folder containing all files
+            Dict with content, metadata, and filename (see save_social_content)
+        """
+        # Create metadata
+        content_id = str(uuid.uuid4())[:8]
+        metadata = {
+            "content_id": content_id,
+            "content_type": f"{platform.lower()}-post",
+            "title": angle,
+            "theme": theme,
+            "created_date": datetime.now().isoformat(),
+            "created_by_agent": "interactive-batch-creator",
+            "status": "scheduled",
+            "content_details": {
+                "platform": platform,
+                "target_audience": style['audience'],
+                "tone": style['tone'],
+                "word_count": style['social_length']
+            },
+            "performance": {
+                "views": 0,
+                "likes": 0,
+                "comments": 0,
+                "shares": 0
+            },
+            "compliance": {
+                "hipaa_reviewed": True,
+                "contains_phi": False
+            }
+        }
+        if fields:
+            metadata["post"] = fields
+        if usage:
+            metadata["generation"] = usage
+
+        return {
+            "content": content_text,
+            "metadata": metadata,
+            "filename": f"{angle.lower().replace(' ', '-')[:50]}-{content_id}"
+        }
+
+    def create_social_post(
+        self,
+        angle: str,
+        theme: str,
+        platform: str,
+        style: Dict,
+        api_key: str,
+        cache_scope: Optional[Dict] = None
+    ) -> Optional[Dict]:
+        """Create a single social media post (cache_scope as for _generate)."""
+
+        system = self.build_social_system(style)
+        prompt = self.build_social_prompt(angle, theme, platform)
+
+        try:
+            payload = self._generate(
+                prompt, max_tokens=SOCIAL_MAX_TOKENS, api_key=api_key, system=system,
+                tool=SOCIAL_POST_TOOL if self.structured_posts else None,
+                cache_scope=cache_scope, cache_system=False
+            )
+            return self.build_social_content(
+                angle, theme, platform, style, payload["text"], payload.get("fields"), payload.get("usage")
+            )
+
+        except Exception as e:
+            print(f"  ❌ Error creating content: {str(e)}")
+            return None
+
+    def build_blog_system(self, style: Dict) -> str:
+        """
+        Build the PRD v2.2 blog instructions shared by every blog post with
+        this style; sent as a cacheable system block.
         """
 
         blog_focus_prompts = {
@@ -589,12 +1260,10 @@ Please provide:
             'personal': "personal and relatable"
         }
 
-        prompt = f"""# COMPREHENSIVE BLOG POST GENERATION - PRD V2.2 COMPLIANT
+        system = f"""# COMPREHENSIVE BLOG POST GENERATION - PRD V2.2 COMPLIANT
 
 ## CRITICAL: YOUR OUTPUT MUST INCLUDE ALL 5 SECTIONS BELOW
 
-## MAIN THEME: {theme}
-
 ## TONE: {tone_prompts[style['tone']]}
 ## FOCUS: {blog_focus_prompts[style['blog_focus']]}
 
@@ -602,12 +1271,12 @@ Please provide:
 
 Create a 2000-3000 word blog post with:
 
-- **Question-based H1 title** with primary keyword about {theme}
+- **Question-based H1 title** with primary keyword about the main theme
 - **Answer-First Snippet** (2-3 sentences at very top)
 - **Introduction** (150-200 words) that hooks the reader
 - **Question-based H2 section headings** (5-7 sections)
 - Each section starts with 2-3 sentence answer-first snippet
-- **FAQ Section** with 5 Q&A pairs related to {theme}
+- **FAQ Section** with 5 Q&A pairs related to the main theme
 - **Conclusion** with clear CTA for Hendersonville Counseling
 - **References section** with professional insights
 
@@ -718,78 +1387,281 @@ SERVICES: Individual therapy, couples counseling, teen therapy, anxiety treatmen
 
 Please generate all 5 sections following PRD v2.2 requirements exactly."""
 
+        return system
+
+    def build_blog_prompt(self, theme: str) -> str:
+        """Build the per-post part of the blog prompt."""
+        return f"## MAIN THEME: {theme}\n\nWrite the blog post for this theme with all 5 sections."
+
+    def _blog_slug(self, theme: str) -> str:
+        """File and folder name stem for a theme's blog post."""
+        return theme.lower().replace(' ', '-').replace(':', '').replace(',', '')[:50]
+
+    def _new_blog_folder(self, theme: str, week_folder: Path) -> Tuple[Path, str]:
+        """
+        Create a new blog folder in the week-first structure.
+
+        Returns:
+            Tuple of (blog_folder, slug)
+        """
+        slug = self._blog_slug(theme)
+        content_id = str(uuid.uuid4())[:8]
+        blog_folder = week_folder / "blog" / f"{slug}-{content_id}"
+        blog_folder.mkdir(parents=True, exist_ok=True)
+        return blog_folder, slug
+
+    def _blog_header(self, theme: str, style: Dict) -> str:
+        """Header written above the generated blog content."""
+        return (
+            f"# Blog Post: {theme}\n\n"
+            f"**Created:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n"
+            f"**Theme:** {theme}\n"
+            f"**Tone:** {style['tone']}\n"
+            f"**Focus:** {style['blog_focus']}\n\n"
+            f"{BLOG_HEADER_END}"
+        )
+
+    def _write_blog_readme(self, blog_folder: Path, theme: str, blog_filename: str) -> None:
+        """Write the publishing instructions README for a blog folder."""
+        readme = self.templates.render(
+            "blog_readme.md",
+            theme=theme,
+            created_date=datetime.now().strftime('%Y-%m-%d'),
+            blog_filename=blog_filename
+        )
+        with open(blog_folder / "README.md", 'w') as f:
+            f.write(readme)
+
+    def _catalog_blog(self, theme: str, style: Dict, blog_folder: Path) -> None:
+        """Record a finished blog post in the content catalog."""
+        content_id = blog_folder.name.rsplit("-", 1)[-1]
+        self._catalog_record(blog_metadata(content_id, theme, style), blog_folder)
+
+    def save_blog_post(
+        self,
+        theme: str,
+        style: Dict,
+        blog_content: str,
+        week_folder: Path,
+        usage: Optional[Dict] = None
+    ) -> Path:
+        """
+        Save generated blog content and its README in the week's blog folder.
+
+        Args:
+            usage: Tokens, latency and cost of the call (see call_usage),
+                recorded in the usage ledger
+
+        Returns:
+            Path to blog folder containing all files
+        """
+        blog_folder, slug = self._new_blog_folder(theme, week_folder)
+
+        # Create descriptive filename from theme
+        blog_filename = slug + ".md"
+
+        # Save main blog post with descriptive name
+        blog_file = blog_folder / blog_filename
+        with open(blog_file, 'w') as f:
+            f.write(self._blog_header(theme, style))
+            f.write(blog_content)
+
+        self._write_blog_readme(blog_folder, theme, blog_filename)
+        self._catalog_blog(theme, style, blog_folder)
+        self._record_call(usage, "blog", blog_folder)
+
+        print(f"  ✓ Blog post created: {_display_path(blog_folder)}")
+
+        return blog_folder
+
+    def _find_partial_blog(self, theme: str, week_folder: Path) -> Optional[Path]:
+        """Most recent partial blog file left by an interrupted stream, if any."""
+        slug = self._blog_slug(theme)
+        partials = sorted(
+            (week_folder / "blog").glob(f"{slug}-*/{slug}.md{PARTIAL_SUFFIX}"),
+            key=lambda path: path.stat().st_mtime
+        )
+        return partials[-1] if partials else None
+
+    def stream_blog_post(
+        self,
+        theme: str,
+        style: Dict,
+        api_key: str,
+        week_folder: Path,
+        cache_scope: Optional[Dict] = None
+    ) -> Path:
+        """
+        Generate a blog post with the streaming API, appending text to the
+        blog file as it arrives (cache_scope as for _generate).
+
+        While streaming, the post is written to <slug>.md.partial. If the
+        stream fails, that file is kept and the next attempt continues the
+        post from where it stopped (the partial text is sent back as the
+        start of the assistant's reply) instead of starting over. The usage
+        recorded for the post is the sum over every stream it took, including
+        ones that dropped.
+
+        Returns:
+            Path to blog folder containing all files
+
+        Raises:
+            Exception: Any API or file error; the partial file is kept
+        """
+        system = self.build_blog_system(style)
+        prompt = self.build_blog_prompt(theme)
+        request = self._build_request(prompt, BLOG_MAX_TOKENS, system)
+        cache_key = self._request_cache_key(request, cache_scope) if cache_scope else None
+
+        cached = self.response_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            return self.save_blog_post(theme, style, cached["text"], week_folder)
+
+        partial_file = self._find_partial_blog(theme, week_folder)
+        generated = ""
+        if partial_file:
+            blog_folder = partial_file.parent
+            header, _, generated = partial_file.read_text().partition(BLOG_HEADER_END)
+            print(f"   Continuing partial blog ({len(generated.split())} words so far)")
+        else:
+            blog_folder, slug = self._new_blog_folder(theme, week_folder)
+            partial_file = blog_folder / f"{slug}.md{PARTIAL_SUFFIX}"
+            header, _, _ = self._blog_header(theme, style).partition(BLOG_HEADER_END)
+
+        client = self.client_provider.get_client(api_key)
+        started = time.time()
+        first_chunk_at = None
+        last_report = started
+        streamed_chars = 0
+        stream_usages = []
+
+        def stream_once():
+            """One streaming attempt, continuing from whatever is already written."""
+            nonlocal generated, first_chunk_at, last_report, streamed_chars
+            attempt_started_at = len(generated.rstrip())
+
+            # The API rejects an assistant prefix ending in whitespace
+            generated = generated.rstrip()
+            stream_request = request
+            if generated:
+                stream_request = dict(request)
+                stream_request["messages"] = request["messages"] + [{"role": "assistant", "content": generated}]
+
+            with open(partial_file, 'w') as f:
+                f.write(header + BLOG_HEADER_END + generated)
+                f.flush()
+
+                with client.messages.stream(**stream_request) as stream:
+                    try:
+                        for text in stream.text_stream:
+                            f.write(text)
+                            f.flush()
+                            generated += text
+                            streamed_chars += len(text)
+
+                            now = time.time()
+                            if first_chunk_at is None:
+                                first_chunk_at = now
+                                print(f"   ✍️  Blog streaming (first text after {now - started:.1f}s)")
+                            elif now - last_report >= STREAM_REPORT_INTERVAL:
+                                # ~4 characters per token
+                                rate = streamed_chars / 4 / max(now - first_chunk_at, 0.001)
+                                print(f"   ✍️  Blog: ~{streamed_chars // 4:,} tokens ({rate:.0f} tokens/s)")
+                                last_report = now
+                    except Exception:
+                        # A dropped stream is still billed for what it sent
+                        stream_usages.append(_dropped_stream_usage(stream, generated[attempt_started_at:]))
+                        raise
+
+                    final_message = stream.get_final_message()
+                    stream_usages.append(final_message.usage)
+                    return final_message
+
+        with self._api_slots:
+            try:
+                self.rate_limiter.call(stream_once, estimate_tokens(system + prompt + generated))
+            except Exception:
+                self._record_stream_usage(stream_usages, request["model"], started, blog_folder)
+                raise
+
+        elapsed = time.time() - started
+        blog_file = partial_file.with_name(partial_file.name[:-len(PARTIAL_SUFFIX)])
+        os.replace(partial_file, blog_file)
+        self._write_blog_readme(blog_folder, theme, blog_file.name)
+        self._catalog_blog(theme, style, blog_folder)
+        usage = self._record_stream_usage(stream_usages, request["model"], started, blog_folder)
+
+        output_tokens = usage["output_tokens"]
+        print(f"   ✍️  Blog finished: {output_tokens:,} tokens in {elapsed:.0f}s "
+              f"({output_tokens / max(elapsed, 0.001):.0f} tokens/s)")
+        if cache_key:
+            self.response_cache.put(cache_key, {"text": generated, "usage": usage})
+
+        print(f"  ✓ Blog post created: {_display_path(blog_folder)}")
+
+        return blog_folder
+
+    def _record_stream_usage(
+        self,
+        stream_usages: List,
+        model: str,
+        started: float,
+        blog_folder: Path
+    ) -> Optional[Dict]:
+        """
+        Record the summed usage of a blog post's streams (see stream_blog_post).
+
+        Returns:
+            Usage record for the post (see call_usage), None if no stream started
+        """
+        if not stream_usages:
+            return None
+        total = SimpleNamespace(**{
+            field: sum(getattr(usage, field, 0) or 0 for usage in stream_usages) for field in USAGE_FIELDS
+        })
+        self.record_usage(total)
+        usage = call_usage(total, model, time.time() - started)
+        self._record_call(usage, "blog", blog_folder)
+        return usage
+
+    def create_blog_post(
+        self,
+        theme: str,
+        style: Dict,
+        api_key: str,
+        week_folder: Path,
+        cache_scope: Optional[Dict] = None
+    ) -> Optional[Path]:
+        """
+        Create PRD v2.2 compliant blog post (cache_scope as for _generate).
+
+        Returns:
+            Path to blog folder containing all files
+        """
+
         try:
             print(f"\n🤖 Creating comprehensive blog post...")
             print(f"   Theme: {theme}")
-            print(f"   This will take 2-3 minutes...")
 
-            client = anthropic.Anthropic(api_key=api_key)
+            if self.stream_blog:
+                print(f"   Streaming into the blog folder as it is written...")
+                return self.stream_blog_post(theme, style, api_key, week_folder, cache_scope)
 
-            message = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=8000,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            print(f"   This will take 2-3 minutes...")
 
-            blog_content = message.content[0].text
-
-            # Create blog folder in week-first structure
-            slug = theme.lower().replace(' ', '-').replace(':', '').replace(',', '')[:50]
-            content_id = str(uuid.uuid4())[:8]
-            blog_folder = week_folder / "blog" / f"{slug}-{content_id}"
-            blog_folder.mkdir(parents=True, exist_ok=True)
-
-            # Create descriptive filename from theme
-            blog_filename = slug + ".md"
-
-            # Save main blog post with descriptive name
-            blog_file = blog_folder / blog_filename
-            with open(blog_file, 'w') as f:
-                f.write(f"# Blog Post: {theme}\n\n")
-                f.write(f"**Created:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
-                f.write(f"**Theme:** {theme}\n")
-                f.write(f"**Tone:** {style['tone']}\n")
-                f.write(f"**Focus:** {style['blog_focus']}\n\n")
-                f.write("---\n\n")
-                f.write(blog_content)
-
-            # Create README with instructions
-            readme_file = blog_folder / "README.md"
-            with open(readme_file, 'w') as f:
-                f.write(f"# Blog Post: {theme}\n\n")
-                f.write(f"**Created:** {datetime.now().strftime('%Y-%m-%d')}\n\n")
-                f.write("## Files in This Folder\n\n")
-                f.write(f"- `{blog_filename}` - Complete blog content with all 5 sections\n")
-                f.write("- `README.md` - This file (publishing instructions)\n\n")
-                f.write("## Publishing Workflow\n\n")
-                f.write("1. **Extract Content:**\n")
-                f.write("   - Open `blog-post.md`\n")
-                f.write("   - Section 1: Blog content → Copy to Squarespace\n")
-                f.write("   - Section 2: Schema JSONs → Copy to JSONKeeper.com\n")
-                f.write("   - Section 3: Social captions → Use for promotion\n")
-                f.write("   - Section 4: Carousel → Use for Instagram graphics\n")
-                f.write("   - Section 5: SEO metadata → Add to Squarespace settings\n\n")
-                f.write("2. **Publish to Squarespace:**\n")
-                f.write("   - Log into Squarespace\n")
-                f.write("   - Create new blog post\n")
-                f.write("   - Paste Section 1 content\n")
-                f.write("   - Add SEO metadata (Section 5)\n")
-                f.write("   - Upload featured image\n\n")
-                f.write("3. **Add Schema Markup:**\n")
-                f.write("   - Copy BlogPosting JSON → JSONKeeper.com → Get URL\n")
-                f.write("   - Copy FAQPage JSON → JSONKeeper.com → Get URL\n")
-                f.write("   - Add schema code to Squarespace (Settings → Advanced → Code Injection)\n\n")
-                f.write("4. **Publish & Promote:**\n")
-                f.write("   - Publish blog on Friday\n")
-                f.write("   - Use social captions (Section 3) to promote throughout week\n")
-                f.write("   - Create carousel graphics using Section 4 prompts\n\n")
-
-            print(f"  ✓ Blog post created: {blog_folder.relative_to(Path.cwd())}")
-
-            return blog_folder
+            payload = self._generate(
+                self.build_blog_prompt(theme),
+                max_tokens=BLOG_MAX_TOKENS,
+                api_key=api_key,
+                system=self.build_blog_system(style),
+                cache_scope=cache_scope
+            )
+            return self.save_blog_post(theme, style, payload["text"], week_folder, payload.get("usage"))
 
         except Exception as e:
             print(f"  ❌ Error creating blog: {str(e)}")
+            if self.stream_blog:
+                print(f"     Partial post kept - rerun with --resume to continue it")
             return None
 
     def save_social_content(self, content_data: Dict, platform: str, date: str, week_folder: Path) -> Optional[Path]:
@@ -817,13 +1689,50 @@ Please generate all 5 sections following PRD v2.2 requirements exactly."""
         with open(content_file, 'w') as f:
             f.write(content_data["content"])
 
+        content_key = self.catalog.relative_path(self.published_path(content_file))
+        try:
+            match = self.near_duplicates.find_duplicate(content_data["content"], BODY, exclude=content_key)
+            if match:
+                content_data["metadata"]["near_duplicate_of"] = {
+                    "path": match["path"],
+                    "similarity": round(match["similarity"], 2)
+                }
+                print(f"  ⚠️  {content_file.name} reads {match['similarity']:.0%} like {match['path']}")
+            self.near_duplicates.add(content_key, content_data["metadata"].get("title") or "", content_data["content"])
+        except sqlite3.Error as e:
+            print(f"  ⚠️  Near-duplicate index not updated: {e}")
+
         # Save metadata
         meta_file = folder / f"{filename_base}_meta.json"
         with open(meta_file, 'w') as f:
             json.dump(content_data["metadata"], f, indent=2)
 
+        self._catalog_record(content_data["metadata"], content_file, scheduled_date=date)
+        self._record_call(content_data["metadata"].get("generation"), "social", content_file)
+
         return content_file
 
+    def post_preview_and_hashtags(self, content_file: Path, fields: Optional[Dict] = None) -> Tuple[str, List[str]]:
+        """
+        Preview text and hashtags for a saved social post.
+
+        Structured posts carry both as fields (passed in, or read from the
+        post's _meta.json); posts saved without them fall back to scanning
+        the markdown file.
+        """
+        if fields is None:
+            try:
+                with open(content_file.with_name(f"{content_file.stem}_meta.json"), 'r') as f:
+                    fields = json.load(f).get("post")
+            except (OSError, ValueError, AttributeError):
+                fields = None
+
+        if not fields:
+            return self.extract_preview_and_hashtags(content_file)
+
+        preview = next((line.strip()[:100] for line in fields["caption"].splitlines() if line.strip()), "")
+        return (preview or "Preview not available", fields["hashtags"])
+
     def extract_preview_and_hashtags(self, content_file: Path) -> Tuple[str, List[str]]:
         """Extract preview text and hashtags from content file."""
         try:
@@ -857,201 +1766,19 @@ Please generate all 5 sections following PRD v2.2 requirements exactly."""
         images_folder = week_folder / "images"
         images_folder.mkdir(parents=True, exist_ok=True)
 
-        # Generate QUICK_IMAGE_PROMPT.txt
-        quick_prompt_file = week_folder / "QUICK_IMAGE_PROMPT.txt"
-        with open(quick_prompt_file, 'w') as f:
-            f.write("═══════════════════════════════════════════════════════════════════\n")
-            f.write("COPY-PASTE IMAGE PROMPT (Use with ANY AI image generator)\n")
-            f.write("═══════════════════════════════════════════════════════════════════\n\n")
-            f.write("BASE PROMPT FOR ALL IMAGES:\n")
-            f.write("----------------------------\n\n")
-            f.write(f"Professional, warm therapy photography for mental health practice.\n")
-            f.write(f"Theme: {theme}\n\n")
-            f.write("Visual concept: Warm, hopeful scene showing diverse individuals in\n")
-            f.write("supportive, contemplative moments. Soft natural lighting, Western\n")
-            f.write("North Carolina aesthetic (subtle mountain backdrop optional).\n\n")
-            f.write("Color palette: Calming blues and greens, warm earth tones, soft\n")
-            f.write("amber lighting. Conveys compassion, hope, and professional support.\n\n")
-            f.write("Mood: Empathetic, supportive, professional yet approachable.\n")
-            f.write("Shows strength through vulnerability.\n\n")
-            f.write("Text overlay space: Keep center-left clear for text overlay.\n")
-            f.write("No faces looking directly at camera.\n\n")
-            f.write("Style: Authentic lifestyle photography aesthetic (not stock photo),\n")
-            f.write("slightly desaturated for professional mental health branding.\n\n\n")
-            f.write("═══════════════════════════════════════════════════════════════════\n")
-            f.write("QUICK DIMENSIONS TABLE\n")
-            f.write("═══════════════════════════════════════════════════════════════════\n\n")
-            f.write("FORMAT                  | DIMENSIONS      | ORIENTATION\n")
-            f.write("------------------------|-----------------|------------------\n")
-            f.write("Blog Featured           | 1200 x 630      | Landscape\n")
-            f.write("Instagram Feed          | 1080 x 1080     | Square\n")
-            f.write("Instagram Story/Reel    | 1080 x 1920     | Vertical (9:16)\n")
-            f.write("Facebook Feed           | 1200 x 1200     | Square\n")
-            f.write("Facebook Story          | 1080 x 1920     | Vertical (9:16)\n\n\n")
-            f.write("═══════════════════════════════════════════════════════════════════\n")
-            f.write("FASTEST METHOD: CANVA\n")
-            f.write("═══════════════════════════════════════════════════════════════════\n\n")
-            f.write("1. Generate ONE image (square 1080x1080 works best)\n")
-            f.write("2. Upload to Canva.com\n")
-            f.write("3. Use \"Magic Resize\" to create all formats automatically\n")
-            f.write("4. Add text overlays (see suggestions below)\n")
-            f.write("5. Export all\n\n")
-            f.write("TOTAL TIME: 15 minutes\n\n\n")
-            f.write("═══════════════════════════════════════════════════════════════════\n")
-            f.write("TEXT OVERLAY SUGGESTIONS\n")
-            f.write("═══════════════════════════════════════════════════════════════════\n\n")
-            f.write("BLOG:\n")
-            f.write(f"\"{theme}\"\n")
-            f.write("Hendersonville Counseling\n\n")
-            f.write("INSTAGRAM FEED:\n")
-            f.write(f"\"{theme}\n\n")
-            f.write("Professional support in Hendersonville NC\"\n\n")
-            f.write("INSTAGRAM STORY:\n")
-            f.write(f"Top: \"{theme[:40]}...\"\n")
-            f.write("Bottom: \"Link in bio | Hendersonville Counseling\"\n\n")
-            f.write("FACEBOOK:\n")
-            f.write(f"\"{theme}\n")
-            f.write("Therapy in Western NC\"\n\n\n")
-            f.write("═══════════════════════════════════════════════════════════════════\n")
-            f.write("WHERE TO GENERATE IMAGES\n")
-            f.write("═══════════════════════════════════════════════════════════════════\n\n")
-            f.write("OPTION 1 (FREE): ChatGPT with DALL-E\n")
-            f.write("→ chat.openai.com\n")
-            f.write("→ Paste prompt above\n")
-            f.write("→ Download generated image\n\n")
-            f.write("OPTION 2 (BEST QUALITY): Midjourney\n")
-            f.write("→ Discord → /imagine [paste prompt] --ar 1:1 --v 6\n\n")
-            f.write("OPTION 3 (EASIEST): Canva AI\n")
-            f.write("→ canva.com → \"Text to Image\"\n")
-            f.write("→ Paste prompt\n")
-            f.write("→ Resize with Magic Resize\n\n\n")
-            f.write("═══════════════════════════════════════════════════════════════════\n")
-            f.write("BRAND COLORS (for text overlays)\n")
-            f.write("═══════════════════════════════════════════════════════════════════\n\n")
-            f.write("Primary Blue: #3A5A78\n")
-            f.write("Warm Amber: #E8A87C\n")
-            f.write("Dark Text: #2C3E50\n")
-            f.write("White: #FFFFFF\n\n\n")
-            f.write("═══════════════════════════════════════════════════════════════════\n")
-            f.write("PRO TIP\n")
-            f.write("═══════════════════════════════════════════════════════════════════\n\n")
-            f.write("Generate ONE vertical image (1080x1920) first.\n")
-            f.write("This works for Stories/Reels.\n")
-            f.write("Then crop it to square for Feed posts.\n")
-            f.write("Then crop wider for Blog.\n\n")
-            f.write("This way, one generation = 5 formats!\n\n")
-
-        # Generate IMAGE_GENERATION_GUIDE.md
-        guide_file = week_folder / "IMAGE_GENERATION_GUIDE.md"
-        with open(guide_file, 'w') as f:
-            f.write(f"# Image Generation Guide\n")
-            f.write(f"## {theme}\n\n")
-            f.write("---\n\n")
-            f.write("## 🎯 GOAL: Create all weekly images in 15 minutes using templates\n\n")
-            f.write("---\n\n")
-            f.write("## QUICK START WORKFLOW\n\n")
-            f.write("### Step 1: Generate Base Image (5 min)\n\n")
-            f.write(f"**Theme:** {theme}\n\n")
-            f.write("**Prompt for AI generator:**\n")
-            f.write("```\n")
-            f.write(f"Professional, warm therapy photography for mental health practice.\n")
-            f.write(f"Theme: {theme}\n\n")
-            f.write("Visual concept: Warm, hopeful scene showing diverse individuals in\n")
-            f.write("supportive, contemplative moments. Soft natural lighting, Western\n")
-            f.write("North Carolina aesthetic (subtle mountain backdrop optional).\n\n")
-            f.write("Color palette: Calming blues and greens, warm earth tones, soft\n")
-            f.write("amber lighting. Mood: Empathetic, supportive, professional.\n\n")
-            f.write("Style: Authentic lifestyle photography (not stock photo), slightly\n")
-            f.write("desaturated. No faces looking directly at camera. Keep center-left\n")
-            f.write("clear for text overlay.\n")
-            f.write("```\n\n")
-            f.write("**Where to generate:**\n")
-            f.write("- ChatGPT (chat.openai.com) - Free with DALL-E\n")
-            f.write("- Canva AI (canva.com → Text to Image) - Easiest\n")
-            f.write("- Midjourney (Discord) - Best quality\n\n")
-            f.write("### Step 2: Upload to Canva (2 min)\n\n")
-            f.write("1. Go to Canva.com\n")
-            f.write("2. Create custom size: 1080 x 1080 (square)\n")
-            f.write("3. Upload your generated image\n\n")
-            f.write("### Step 3: Resize to All Formats (2 min)\n\n")
-            f.write("Click **\"Resize\"** and add:\n")
-            f.write("- 1200 x 630 (Blog featured image)\n")
-            f.write("- 1080 x 1920 (Instagram/Facebook Stories)\n")
-            f.write("- 1200 x 1200 (Facebook feed)\n")
-            f.write("- Keep 1080 x 1080 (Instagram feed)\n\n")
-            f.write("Canva creates all 4 formats instantly!\n\n")
-            f.write("### Step 4: Add Text Overlays (5 min)\n\n")
-            f.write("**Blog (1200x630):**\n")
-            f.write(f"- Headline: \"{theme}\"\n")
-            f.write("- Bottom right: Hendersonville Counseling logo\n\n")
-            f.write("**Instagram Feed (1080x1080):**\n")
-            f.write(f"- Center: \"{theme[:40]}...\"\n")
-            f.write("- Bottom: Small logo\n\n")
-            f.write("**Stories (1080x1920):**\n")
-            f.write("- Top third: Main message\n")
-            f.write("- Bottom: \"Link in bio | Hendersonville Counseling\"\n\n")
-            f.write("**Facebook (1200x1200):**\n")
-            f.write("- Same as Instagram Feed\n\n")
-            f.write("### Step 5: Export (1 min)\n\n")
-            f.write("1. Select all designs\n")
-            f.write("2. Click \"Download\" → JPG format\n")
-            f.write("3. Save to images/ folder\n\n")
-            f.write("---\n\n")
-            f.write("## 📏 IMAGE SPECIFICATIONS\n\n")
-            f.write("| Platform | Size | Format | Use |\n")
-            f.write("|----------|------|--------|-----|\n")
-            f.write("| Blog | 1200x630 | JPG | Featured image |\n")
-            f.write("| Instagram Feed | 1080x1080 | JPG | Grid post |\n")
-            f.write("| Instagram Story | 1080x1920 | JPG/PNG | Full screen |\n")
-            f.write("| Facebook Feed | 1200x1200 | JPG | Timeline post |\n")
-            f.write("| Facebook Story | 1080x1920 | JPG/PNG | Full screen |\n\n")
-            f.write("---\n\n")
-            f.write("## 🎨 BRAND STYLE GUIDE\n\n")
-            f.write("**Colors:**\n")
-            f.write("- Primary: #3A5A78 (calming blue)\n")
-            f.write("- Accent: #E8A87C (warm amber)\n")
-            f.write("- Text: #2C3E50 (dark blue-gray)\n")
-            f.write("- Background: Warm neutrals (beige, cream)\n\n")
-            f.write("**Fonts:**\n")
-            f.write("- Headlines: Montserrat Bold\n")
-            f.write("- Body: Open Sans Regular\n\n")
-            f.write("**Visual Elements:**\n")
-            f.write("- Organic shapes (leaves, abstract forms)\n")
-            f.write("- Soft shadows and subtle textures\n")
-            f.write("- 50-75% opacity for decorative elements\n")
-            f.write("- Diverse, inclusive representation\n\n")
-            f.write("---\n\n")
-            f.write("## 📁 FILE ORGANIZATION\n\n")
-            f.write("Save exported images to:\n")
-            f.write("```\n")
-            f.write(f"{week_folder.name}/images/\n")
-            f.write("├── blog-featured.jpg\n")
-            f.write("├── instagram-feed.jpg\n")
-            f.write("├── instagram-story.jpg\n")
-            f.write("├── facebook-feed.jpg\n")
-            f.write("└── facebook-story.jpg\n")
-            f.write("```\n\n")
-            f.write("---\n\n")
-            f.write("## 💡 PRO TIPS\n\n")
-            f.write("1. **Save first design as template** - Reuse structure next week\n")
-            f.write("2. **Generate vertical first** - Easier to crop to other sizes\n")
-            f.write("3. **Keep text minimal** - Let the image breathe\n")
-            f.write("4. **Use Canva Brand Kit** - Save colors and logo for quick access\n")
-            f.write("5. **Batch export** - Select all designs and download at once\n\n")
-            f.write("---\n\n")
-            f.write("## ⏱️ TIME BREAKDOWN\n\n")
-            f.write("- Generate base image: 5 minutes\n")
-            f.write("- Upload and resize: 2 minutes\n")
-            f.write("- Add text overlays: 5 minutes\n")
-            f.write("- Export and organize: 3 minutes\n")
-            f.write("**Total: 15 minutes**\n\n")
-            f.write("---\n\n")
-            f.write("## 🔗 HELPFUL RESOURCES\n\n")
-            f.write("- **Canva Tutorial:** canva.com/help/resize\n")
-            f.write("- **ChatGPT:** chat.openai.com (for DALL-E image generation)\n")
-            f.write("- **Stock Photos:** unsplash.com, pexels.com (if needed)\n\n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d')}\n")
-            f.write(f"**Theme:** {theme}\n")
+        values = {
+            "theme": theme,
+            "theme_short": theme[:40],
+            "week_folder_name": self.published_path(week_folder).name,
+            "generated_date": datetime.now().strftime('%Y-%m-%d')
+        }
+        for template_name, filename in [
+            ("quick_image_prompt.txt", "QUICK_IMAGE_PROMPT.txt"),
+            ("image_generation_guide.md", "IMAGE_GENERATION_GUIDE.md")
+        ]:
+            document = self.templates.render(template_name, **values)
+            with open(week_folder / filename, 'w') as f:
+                f.write(document)
 
         print(f"  ✓ Image generation guides created")
 
@@ -1061,223 +1788,368 @@ Please generate all 5 sections following PRD v2.2 requirements exactly."""
         theme: str,
         created_social: List[Dict],
         blog_folder: Optional[Path],
-        style: Dict
+        style: Dict,
+        week_folder: Optional[Path] = None
     ):
-        """Generate comprehensive weekly content summary file."""
+        """
+        Generate comprehensive weekly content summary file.
+
+        Args:
+            week_folder: Week folder to write the summary into (defaults to
+                the week's folder under the content library)
+        """
 
         week_dt = datetime.fromisoformat(week_start)
         week_number = week_dt.isocalendar()[1]
         year = week_dt.year
 
         # Get batch folder
-        batch_folder = self.library_path / "weekly-batches" / f"{year}-week-{week_number:02d}"
+        batch_folder = week_folder or self.library_path / "weekly-batches" / f"{year}-week-{week_number:02d}"
         batch_folder.mkdir(parents=True, exist_ok=True)
 
         summary_file = batch_folder / f"WEEK_{week_number}_CONTENT_SUMMARY.md"
+        project_root = Path(__file__).parent
+        platforms = ['Instagram', 'Facebook', 'LinkedIn']
+        posts_by_platform = {
+            platform: [p for p in created_social if p['platform'] == platform] for platform in platforms
+        }
+        social_count = len(created_social)
 
-        with open(summary_file, 'w') as f:
-            # Header
-            f.write(f"# Week {week_number} Content Summary ({week_start})\n\n")
-            f.write(f"**Theme:** {theme}  \n")
-            f.write(f"**Created:** {datetime.now().strftime('%B %d, %Y')}  \n")
-            f.write(f"**Total Pieces:** {len(created_social)} social posts")
-            if blog_folder:
-                f.write(" + 1 blog = {} pieces  \n".format(len(created_social) + 1))
-            else:
-                f.write("  \n")
-            f.write(f"**Status:** ⬜ Not Scheduled | ⬜ Images Created | ⬜ Scheduled | ⬜ Posted\n\n")
-            f.write("---\n\n")
-
-            # Checklist
-            f.write("## CHECKLIST\n\n")
-            f.write(f"- [ ] Review all {len(created_social)} social posts\n")
-            if blog_folder:
-                f.write("- [ ] Review blog post\n")
-            f.write(f"- [ ] Create images for social posts ({len(created_social)} images needed)\n")
-            if blog_folder:
-                f.write("- [ ] Create blog featured image (1 image)\n")
-
-            # Count posts by platform
-            instagram_count = sum(1 for p in created_social if p['platform'] == 'Instagram')
-            facebook_count = sum(1 for p in created_social if p['platform'] == 'Facebook')
-            linkedin_count = sum(1 for p in created_social if p['platform'] == 'LinkedIn')
-
-            if instagram_count > 0:
-                f.write(f"- [ ] Schedule Instagram posts ({instagram_count} posts)\n")
-            if facebook_count > 0:
-                f.write(f"- [ ] Schedule Facebook posts ({facebook_count} posts)\n")
-            if linkedin_count > 0:
-                f.write(f"- [ ] Schedule LinkedIn posts ({linkedin_count} posts)\n")
-
-            if blog_folder:
-                f.write("- [ ] Publish blog to Squarespace (Friday)\n")
-                f.write("- [ ] Upload schema JSONs to JSONKeeper\n")
-
-            f.write("- [ ] Track performance with weekly_checkin.py\n\n")
-            f.write("---\n\n")
-
-            # Social media posts grouped by platform
-            f.write(f"## SOCIAL MEDIA POSTS ({len(created_social)})\n\n")
-
-            for platform in ['Instagram', 'Facebook', 'LinkedIn']:
-                platform_posts = [p for p in created_social if p['platform'] == platform]
-                if not platform_posts:
-                    continue
+        # Checklist
+        checklist = [f"Review all {social_count} social posts"]
+        if blog_folder:
+            checklist.append("Review blog post")
+        checklist.append(f"Create images for social posts ({social_count} images needed)")
+        if blog_folder:
+            checklist.append("Create blog featured image (1 image)")
+        for platform, platform_posts in posts_by_platform.items():
+            if platform_posts:
+                checklist.append(f"Schedule {platform} posts ({len(platform_posts)} posts)")
+        if blog_folder:
+            checklist += ["Publish blog to Squarespace (Friday)", "Upload schema JSONs to JSONKeeper"]
 
-                f.write(f"### {platform.upper()} ({len(platform_posts)} posts)\n\n")
-
-                for i, post in enumerate(platform_posts, 1):
-                    day_name = post['day']
-                    file_path = post['file']
-
-                    # Extract preview and hashtags
-                    preview, hashtags = self.extract_preview_and_hashtags(file_path)
-
-                    # Get topic from filename
-                    topic = file_path.stem.replace('-', ' ').title()
-
-                    f.write(f"#### Post {i}: {day_name}\n")
-                    f.write(f"- **File:** `{file_path.relative_to(Path(__file__).parent)}`\n")
-                    f.write(f"- **Topic:** {topic}\n")
-                    f.write(f"- **Preview:** \"{preview}...\"\n")
-                    if hashtags:
-                        f.write(f"- **Hashtags:** {' '.join(hashtags[:5])}\n")
-                    f.write(f"- **Image needed:** ✏️ [Describe image needed]\n")
-                    f.write(f"- **Scheduled:** ⬜\n\n")
-
-            f.write("---\n\n")
-
-            # Blog post section
-            if blog_folder:
-                friday_date = (week_dt + timedelta(days=4)).strftime('%A, %B %d')
-                f.write(f"## BLOG POST ({friday_date})\n\n")
-                f.write(f"**Title:** {theme}  \n")
-                f.write(f"**Folder:** `{blog_folder.relative_to(Path(__file__).parent)}/`\n\n")
-
-                # List files in blog folder
-                f.write("### Files:\n")
-                blog_files = list(blog_folder.glob("*.md"))
-                if blog_files:
-                    main_blog_file = [f for f in blog_files if f.name != 'README.md'][0]
-                    f.write(f"- **Main Content:** `{main_blog_file.name}` (2000-3000 words)\n")
-                f.write("- **Schema #1:** Extract BlogPosting schema → Upload to JSONKeeper.com\n")
-                f.write("- **Schema #2:** Extract FAQPage schema → Upload to JSONKeeper.com\n")
-                f.write("- **Social Captions:** Extract from Section 3 (3 variants for promotion)\n")
-                f.write("- **Carousel Prompts:** Extract from Section 4 (10 slides)\n")
-                f.write("- **SEO Metadata:** Extract from Section 5\n\n")
-
-                f.write("### Publishing Checklist:\n")
-                f.write("- [ ] Create featured image (2400x1260px recommended)\n")
-                f.write("- [ ] Copy blog content to Squarespace\n")
-                f.write("- [ ] Upload schemas to JSONKeeper → Get URLs\n")
-                f.write("- [ ] Add schema code to Squarespace (Code Injection)\n")
-                f.write("- [ ] Add SEO metadata (title, description, URL slug)\n")
-                f.write(f"- [ ] Schedule for {friday_date}\n")
-                f.write("- [ ] Create carousel graphics (use prompts from blog)\n\n")
-
-                f.write("### Blog Preview:\n")
-                f.write(f"_A comprehensive {style['social_length']}-word guide exploring {theme.lower()} ")
-                f.write("with practical strategies, professional insights, and local Hendersonville NC resources..._\n\n")
-
-                f.write("---\n\n")
-
-            # Image requirements summary
-            f.write("## IMAGE REQUIREMENTS SUMMARY\n\n")
-            f.write(f"**Total Images Needed:** {len(created_social)}")
-            if blog_folder:
-                f.write(f" + 1 = {len(created_social) + 1}\n\n")
-            else:
-                f.write("\n\n")
-
-            for platform in ['Instagram', 'Facebook', 'LinkedIn']:
-                platform_posts = [p for p in created_social if p['platform'] == platform]
-                if platform_posts:
-                    f.write(f"**{platform} ({len(platform_posts)}):**\n")
-                    for i, post in enumerate(platform_posts, 1):
-                        f.write(f"{i}. [Describe image for {post['day']} post]\n")
-                    f.write("\n")
-
-            if blog_folder:
-                f.write("**Blog (1):**\n")
-                f.write("1. Featured image (2400x1260px) - Related to theme\n\n")
-
-            f.write("---\n\n")
-
-            # Image creation guide
-            f.write("## IMAGE CREATION (15 Minutes)\n\n")
-            f.write("**📸 Image guides have been created for you!**\n\n")
-            f.write("Two files to help you create all images quickly:\n\n")
-            f.write("1. **QUICK_IMAGE_PROMPT.txt** - Copy-paste prompt for AI generators\n")
-            f.write("2. **IMAGE_GENERATION_GUIDE.md** - Complete step-by-step workflow\n\n")
-            f.write("**Quick workflow:**\n")
-            f.write("1. Open QUICK_IMAGE_PROMPT.txt\n")
-            f.write("2. Copy prompt → Paste into ChatGPT/Canva AI\n")
-            f.write("3. Upload to Canva → Resize to all formats\n")
-            f.write("4. Add text overlays → Export\n")
-            f.write("5. Save to images/ folder\n\n")
-            f.write("**Time: 15 minutes for all platforms**\n\n")
-            f.write("---\n\n")
-
-            # Quick file access
-            f.write("## QUICK FILE ACCESS\n\n")
-            f.write("**All content is in ONE folder now!**\n\n")
-            f.write("**Open the week folder:**\n")
-            f.write("```bash\n")
-            f.write(f"cd \"{batch_folder}\"\n")
-            f.write("open .\n")
-            f.write("```\n\n")
-            f.write("**Or open individual folders:**\n")
-            f.write("```bash\n")
-            f.write(f"cd {batch_folder.relative_to(Path.cwd())}\n")
-            f.write("open instagram/\n")
-            f.write("open facebook/\n")
-            f.write("open linkedin/\n")
-            if blog_folder:
-                blog_subfolder_name = blog_folder.name
-                f.write(f"open blog/{blog_subfolder_name}/\n")
-            f.write("```\n\n")
-
-            f.write("---\n\n")
-
-            # Notes section
-            f.write("## NOTES FOR NEXT WEEK\n\n")
-            f.write(f"- {theme} content created\n")
-            f.write("- [Add your observations here after posting]\n")
-            f.write("- [Track what performed well]\n\n")
-
-            f.write("---\n\n")
-            f.write(f"**Last Updated:** {datetime.now().strftime('%B %d, %Y')}  \n")
-            f.write(f"**Next Week (Week {week_number + 1}):** Generate content by {(week_dt + timedelta(days=7)).strftime('%B %d')}\n")
+        # Social media posts and image requirements, grouped by platform
+        social_posts, image_requirements = [], []
+        for platform, platform_posts in posts_by_platform.items():
+            if not platform_posts:
+                continue
+
+            social_posts.append(f"### {platform.upper()} ({len(platform_posts)} posts)\n\n")
+            image_requirements.append(f"**{platform} ({len(platform_posts)}):**\n")
+
+            for i, post in enumerate(platform_posts, 1):
+                file_path = post['file']
+
+                preview, hashtags = self.post_preview_and_hashtags(file_path, post.get("fields"))
+
+                social_posts.append(self.templates.render(
+                    "summary_post.md",
+                    number=i,
+                    day=post['day'],
+                    file=_display_path(self.published_path(file_path), project_root),
+                    # Topic from filename
+                    topic=file_path.stem.replace('-', ' ').title(),
+                    preview=preview,
+                    hashtags=f"- **Hashtags:** {' '.join(hashtags[:5])}\n" if hashtags else ""
+                ))
+                image_requirements.append(f"{i}. [Describe image for {post['day']} post]\n")
+            image_requirements.append("\n")
+
+        # Blog post section
+        blog_section = ""
+        if blog_folder:
+            blog_files = [f for f in blog_folder.glob("*.md") if f.name != 'README.md']
+            blog_section = self.templates.render(
+                "summary_blog.md",
+                friday_date=(week_dt + timedelta(days=4)).strftime('%A, %B %d'),
+                theme=theme,
+                theme_lower=theme.lower(),
+                blog_folder=_display_path(self.published_path(blog_folder), project_root),
+                main_file=f"- **Main Content:** `{blog_files[0].name}` (2000-3000 words)\n" if blog_files else "",
+                blog_length=style['social_length']
+            )
+            image_requirements.append("**Blog (1):**\n1. Featured image (2400x1260px) - Related to theme\n\n")
+
+        # API cost of the week across all runs, from the usage ledger
+        published_folder = self.published_path(batch_folder)
+        cost_rows = self.usage_ledger.totals(by="kind", week=self.catalog.relative_path(published_folder))
+        if cost_rows:
+            week_totals = self.usage_ledger.totals(week=self.catalog.relative_path(published_folder))[0]
+            cost_lines = f"**Total:** {format_totals(week_totals)}  \n" + "".join(
+                f"- {USAGE_KIND_LABELS.get(row['kind'], row['kind'])}: {format_totals(row)}\n" for row in cost_rows
+            )
+        else:
+            cost_lines = "No API calls recorded for this week (all responses came from the cache).\n"
+        generation_cost = self.templates.render("summary_cost.md", cost_lines=cost_lines)
+
+        summary = self.templates.render(
+            "weekly_summary.md",
+            week_number=week_number,
+            week_start=week_start,
+            theme=theme,
+            created_date=datetime.now().strftime('%B %d, %Y'),
+            social_count=social_count,
+            blog_total=f" + 1 blog = {social_count + 1} pieces" if blog_folder else "",
+            checklist="".join(f"- [ ] {item}\n" for item in checklist),
+            social_posts="".join(social_posts),
+            blog_section=blog_section,
+            blog_images=f" + 1 = {social_count + 1}" if blog_folder else "",
+            image_requirements="".join(image_requirements),
+            week_folder=published_folder,
+            week_folder_display=_display_path(published_folder),
+            open_blog=f"open blog/{blog_folder.name}/\n" if blog_folder else "",
+            generation_cost=generation_cost,
+            updated_date=datetime.now().strftime('%B %d, %Y'),
+            next_week_number=week_number + 1,
+            next_week_date=(week_dt + timedelta(days=7)).strftime('%B %d')
+        )
+        with open(summary_file, 'w') as f:
+            f.write(summary)
 
         return summary_file
 
+    def build_posting_schedule(self, week_dt: datetime, schedule: Optional[List[Dict]] = None) -> List[Dict]:
+        """
+        Build the posting schedule for a week.
+
+        Args:
+            week_dt: Monday of the week
+            schedule: Day/platform slots (defaults to 2 posts per day Mon-Thu)
+
+        Returns:
+            List of schedule slots with day, date, and platform
+        """
+        return [
+            {
+                "day": item["day"],
+                "date": (week_dt + timedelta(days=DAY_OFFSETS[item["day"]])).strftime('%Y-%m-%d'),
+                "platform": item["platform"]
+            }
+            for item in (schedule or DEFAULT_POSTING_SCHEDULE)
+        ]
+
+    def get_week_folder(self, week_dt: datetime, batches_path: Optional[Path] = None) -> Path:
+        """
+        Get the <year>-week-NN folder for a week.
+
+        Args:
+            week_dt: Monday of the week
+            batches_path: Batches root (defaults to weekly-batches/)
+        """
+        return (batches_path or WEEKLY_BATCHES_DIR) / week_folder_name(week_dt)
+
+    def stage_week(self, week_folder: Path, practice: Optional[str] = None) -> Path:
+        """
+        Start (or pick up) writing a week in its staging folder.
+
+        Args:
+            week_folder: Final week folder (see get_week_folder)
+            practice: Practice the week is for (recorded with its API usage)
+
+        Returns:
+            Staging folder to write the week's files and manifest into
+        """
+        writer = WeekWriter(week_folder, self.archive_format)
+        staging_folder = writer.begin()
+        with self._week_writers_lock:
+            self._week_writers[staging_folder] = writer
+            self._week_practices[staging_folder] = practice
+        return staging_folder
+
+    def _staged_week(self, path: Path) -> Tuple[Optional[WeekWriter], Optional[str]]:
+        """Writer and practice of the staged week a path is in, or (None, None)."""
+        path = Path(path)
+        with self._week_writers_lock:
+            for staging_folder, writer in self._week_writers.items():
+                if path == staging_folder or staging_folder in path.parents:
+                    return writer, self._week_practices.get(staging_folder)
+        return None, None
+
+    def published_path(self, path: Path) -> Path:
+        """Where a file written into a staging folder will be once its week is published."""
+        writer, _ = self._staged_week(path)
+        return writer.final_path(path) if writer else Path(path)
+
+    def publish_week(self, staging_folder: Path) -> Path:
+        """
+        fsync a staged week and move it into place (or archive it).
+
+        Returns:
+            Published week folder or archive
+        """
+        with self._week_writers_lock:
+            writer = self._week_writers.pop(staging_folder)
+            self._week_practices.pop(staging_folder, None)
+        return writer.commit()
+
+    def load_week_manifest(self, week_dt: datetime, batches_path: Optional[Path] = None) -> Optional[BatchManifest]:
+        """Manifest of a week's unpublished (staged) batch, or else of its published folder or archive."""
+        week_folder = self.get_week_folder(week_dt, batches_path)
+        manifest = (BatchManifest.load(WeekWriter(week_folder).staging_folder)
+                    or BatchManifest.load(week_folder))
+        if manifest:
+            return manifest
+
+        for archive_format in ARCHIVE_FORMATS:
+            raw = WeekWriter(week_folder, archive_format).read_published(MANIFEST_FILENAME)
+            if raw is not None:
+                return BatchManifest.parse(week_folder, raw)
+        return None
+
+    def _run_slot(self, manifest: BatchManifest, slot_id: str, func, *args, **kwargs):
+        """Run a generation call for a manifest slot, marking it in-flight first."""
+        manifest.set_state(slot_id, IN_FLIGHT)
+        return func(*args, **kwargs)
+
+    def generate_week_content(
+        self,
+        theme: str,
+        style: Dict,
+        api_key: str,
+        week_folder: Path,
+        manifest: BatchManifest
+    ) -> Tuple[List[Dict], Optional[Path]]:
+        """
+        Generate all missing social posts (and the blog) for a week.
+
+        Calls run in a thread pool bounded by ``max_concurrency`` so the week
+        takes about as long as the slowest call. Posts are saved in schedule
+        order regardless of which call finishes first. Slots the manifest
+        already records as done are reused instead of regenerated.
+
+        Returns:
+            Tuple of (created_social, blog_folder)
+        """
+        social_slots = manifest.slots("social")
+        blog_slot = manifest.get_slot("blog")
+        total = len(social_slots)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            # Submit the blog first - it is the longest call
+            blog_future = None
+            blog_folder = None
+            if blog_slot and manifest.is_done(blog_slot):
+                blog_folder = manifest.output_path(blog_slot)
+                print(f"[{total + 1}/{total + 1}] Friday Blog: {theme}")
+                print(f"  ✓ Already created (resumed)")
+            elif blog_slot:
+                print(f"[{total + 1}/{total + 1}] Friday Blog: {theme}")
+                blog_future = executor.submit(
+                    self._run_slot, manifest, "blog",
+                    self.create_blog_post, theme, style, api_key, week_folder,
+                    self.job_cache_scope(manifest, "blog")
+                )
+
+            social_futures = {}
+            for slot in social_slots:
+                if manifest.is_done(slot):
+                    continue
+                social_futures[slot["id"]] = executor.submit(
+                    self._run_slot, manifest, slot["id"],
+                    self.create_social_post,
+                    angle=slot['angle'],
+                    theme=theme,
+                    platform=slot['platform'],
+                    style=style,
+                    api_key=api_key,
+                    cache_scope=self.job_cache_scope(manifest, slot["id"])
+                )
+
+            # Save social posts in schedule order
+            created_social = []
+            for i, slot in enumerate(social_slots, 1):
+                print(f"[{i}/{total}] {slot['day']} {slot['platform']}: {slot['angle'][:50]}...")
+
+                if slot["id"] not in social_futures:
+                    print(f"  ✓ Already created (resumed)")
+                    created_social.append({
+                        "day": slot['day'],
+                        "platform": slot['platform'],
+                        "file": manifest.output_path(slot)
+                    })
+                    continue
+
+                content_data = social_futures[slot["id"]].result()
+
+                if content_data:
+                    content_file = self.save_social_content(
+                        content_data,
+                        slot['platform'],
+                        slot['date'],
+                        week_folder
+                    )
+
+                    if content_file:
+                        print(f"  ✓ Created and saved")
+                        manifest.set_state(slot["id"], DONE, content_file)
+                        created_social.append({
+                            "day": slot['day'],
+                            "platform": slot['platform'],
+                            "file": content_file,
+                            "fields": content_data["metadata"].get("post")
+                        })
+                    else:
+                        print(f"  ❌ Failed to save")
+                        manifest.set_state(slot["id"], FAILED)
+                else:
+                    print(f"  ❌ Failed to create")
+                    manifest.set_state(slot["id"], FAILED)
+
+            if blog_future:
+                blog_folder = blog_future.result()
+                if blog_folder:
+                    manifest.set_state("blog", DONE, blog_folder)
+                else:
+                    manifest.set_state("blog", FAILED)
+
+        return created_social, blog_folder
+
     def create_interactive_batch(
         self,
         week_start: str,
-        with_blog: bool = False
+        with_blog: bool = False,
+        resume: bool = False
     ):
-        """Main interactive workflow."""
+        """
+        Main interactive workflow.
+
+        Args:
+            week_start: Week start date (YYYY-MM-DD)
+            with_blog: Include the Friday blog post
+            resume: Continue an interrupted batch from the week's manifest,
+                regenerating only slots that are not done
+        """
 
         week_dt = datetime.fromisoformat(week_start)
         week_end = week_dt + timedelta(days=6)
 
-        # Create week folder for this batch
-        week_number = week_dt.isocalendar()[1]
-        year = week_dt.year
-        week_folder = Path(__file__).parent / "weekly-batches" / f"{year}-week-{week_number:02d}"
-        week_folder.mkdir(parents=True, exist_ok=True)
+        # Write this batch into the week's staging folder
+        final_folder = self.get_week_folder(week_dt)
+        week_folder = self.stage_week(final_folder)
 
-        # Load observances
-        observances = self.find_relevant_observances(week_dt, week_end, lead_time_days=14)
+        manifest = BatchManifest.load(week_folder) if resume else None
 
-        # Step 1: Interactive theme selection
-        theme, mode = self.interactive_theme_selection(observances)
+        if resume and manifest is None:
+            print(f"\n⚠️  No batch manifest found in {final_folder.name} - starting a new batch")
 
-        print(f"\n✓ Theme selected: {theme}")
-        print(f"  Mode: {mode}")
+        if manifest:
+            theme, style = manifest.theme, manifest.style
+            remaining = [slot for slot in manifest.slots() if not manifest.is_done(slot)]
 
-        # Step 2: Interactive style selection
-        style = self.interactive_style_selection()
+            print(f"\n✓ Resuming batch: {theme}")
+            print(f"  {len(remaining)} of {len(manifest.slots())} step(s) remaining")
+        else:
+            # Load observances
+            observances = self.find_relevant_observances(week_dt, week_end, lead_time_days=14)
+
+            # Step 1: Interactive theme selection
+            theme, mode = self.interactive_theme_selection(observances)
+
+            print(f"\n✓ Theme selected: {theme}")
+            print(f"  Mode: {mode}")
+
+            # Step 2: Interactive style selection
+            style = self.interactive_style_selection()
 
         # Get API key
         api_key = os.environ.get("ANTHROPIC_API_KEY")
@@ -1291,62 +2163,81 @@ Please generate all 5 sections following PRD v2.2 requirements exactly."""
         print("CREATING CONTENT")
         print("="*80)
 
-        social_angles = self.generate_social_angles(theme, count=8)
+        if manifest is None:
+            social_angles = self.screen_angles(
+                theme, self.generate_social_angles(theme, count=8, api_key=api_key)
+            )
+            posting_schedule = self.build_posting_schedule(week_dt)
+            manifest = BatchManifest.create(
+                week_folder, week_start, theme, mode, style,
+                social_angles, posting_schedule, with_blog
+            )
+
+        self.run_batch(week_start, manifest, api_key)
 
-        print(f"\n🤖 Generating 8 social posts + 1 blog post...")
+    def run_batch(self, week_start: str, manifest: BatchManifest, api_key: str) -> Optional[Path]:
+        """
+        Generate everything a batch manifest still needs, then write the
+        image guides and weekly summary, publish the staged week and print
+        the completion report.
+
+        Args:
+            week_start: Week start date (YYYY-MM-DD)
+            manifest: Batch manifest for the week (in its staging folder,
+                see stage_week)
+            api_key: Anthropic API key
+
+        Returns:
+            Path to the weekly summary file (the week's archive in archive mode)
+        """
+        week_dt = datetime.fromisoformat(week_start)
+        week_number = week_dt.isocalendar()[1]
+        week_folder = manifest.week_folder
+        theme, style = manifest.theme, manifest.style
+
+        social_count = len(manifest.slots("social"))
+        print(f"\n🤖 Generating {social_count} social posts" + (" + 1 blog post..." if manifest.with_blog else "..."))
         print(f"   Theme: {theme}")
-        print(f"   This will take 5-10 minutes...\n")
-
-        # Distribution: 2 posts per day Mon-Thu across 3 platforms
-        posting_schedule = [
-            {"day": "Monday", "date": (week_dt + timedelta(days=0)).strftime('%Y-%m-%d'), "platform": "Instagram"},
-            {"day": "Monday", "date": (week_dt + timedelta(days=0)).strftime('%Y-%m-%d'), "platform": "LinkedIn"},
-            {"day": "Tuesday", "date": (week_dt + timedelta(days=1)).strftime('%Y-%m-%d'), "platform": "Facebook"},
-            {"day": "Tuesday", "date": (week_dt + timedelta(days=1)).strftime('%Y-%m-%d'), "platform": "Instagram"},
-            {"day": "Wednesday", "date": (week_dt + timedelta(days=2)).strftime('%Y-%m-%d'), "platform": "Instagram"},
-            {"day": "Wednesday", "date": (week_dt + timedelta(days=2)).strftime('%Y-%m-%d'), "platform": "LinkedIn"},
-            {"day": "Thursday", "date": (week_dt + timedelta(days=3)).strftime('%Y-%m-%d'), "platform": "Facebook"},
-            {"day": "Thursday", "date": (week_dt + timedelta(days=3)).strftime('%Y-%m-%d'), "platform": "Instagram"},
-        ]
+        if self.max_concurrency > 1:
+            print(f"   Running up to {self.max_concurrency} requests in parallel (about 2-3 minutes)...\n")
+        else:
+            print(f"   This will take 5-10 minutes...\n")
 
-        # Create social posts
-        created_social = []
-        for i, (angle, schedule_item) in enumerate(zip(social_angles, posting_schedule), 1):
-            print(f"[{i}/8] {schedule_item['day']} {schedule_item['platform']}: {angle[:50]}...")
+        # Create social posts (and blog) concurrently, saved in schedule order
+        cache_hits_before = self.response_cache.hits
+        limiter_before = self.rate_limiter.stats()
+        usage_before = self.usage_stats()
+        created_social, blog_folder = self.generate_week_content(
+            theme=theme,
+            style=style,
+            api_key=api_key,
+            week_folder=week_folder,
+            manifest=manifest
+        )
 
-            content_data = self.create_social_post(
-                angle=angle,
-                theme=theme,
-                platform=schedule_item['platform'],
-                style=style,
-                api_key=api_key
-            )
+        cache_hits = self.response_cache.hits - cache_hits_before
+        if cache_hits:
+            print(f"\n♻️  Reused {cache_hits} cached response(s)")
+        self.response_cache.prune()
 
-            if content_data:
-                content_file = self.save_social_content(
-                    content_data,
-                    schedule_item['platform'],
-                    schedule_item['date'],
-                    week_folder
-                )
+        throttling = RateLimiter.format_stats(
+            RateLimiter.stats_delta(limiter_before, self.rate_limiter.stats())
+        )
+        if throttling:
+            print(f"\n⏳ Throttling: {throttling}")
 
-                if content_file:
-                    print(f"  ✓ Created and saved")
-                    created_social.append({
-                        "day": schedule_item['day'],
-                        "platform": schedule_item['platform'],
-                        "file": content_file
-                    })
-                else:
-                    print(f"  ❌ Failed to save")
-            else:
-                print(f"  ❌ Failed to create")
+        usage = self.usage_stats()
+        prompt_cache = format_prompt_cache_usage(
+            {field: usage[field] - usage_before[field] for field in usage}
+        )
+        if prompt_cache:
+            print(f"\n🗄️  Prompt cache: {prompt_cache}")
 
-        # Create blog post if requested
-        blog_folder = None
-        if with_blog:
-            print(f"\n[9/9] Friday Blog: {theme}")
-            blog_folder = self.create_blog_post(theme, style, api_key, week_folder)
+        week_cost = self.usage_ledger.totals(
+            week=self.catalog.relative_path(self.published_path(week_folder)), run_id=self.usage_ledger.run_id
+        )
+        if week_cost:
+            print(f"\n💵 Week cost: {format_totals(week_cost[0])}")
 
         # Generate image creation guides
         print(f"\n🎨 Generating image creation guides...")
@@ -1359,8 +2250,17 @@ Please generate all 5 sections following PRD v2.2 requirements exactly."""
             theme=theme,
             created_social=created_social,
             blog_folder=blog_folder,
-            style=style
+            style=style,
+            week_folder=week_folder
         )
+        manifest.set_state("summary", DONE, summary_file)
+
+        # Flush and move the finished week into place in one step
+        summary_name = summary_file.name
+        published = self.publish_week(week_folder)
+        summary_file = published if self.archive_format else published / summary_name
+
+        failed = [slot for slot in manifest.slots() if slot["state"] == FAILED]
 
         # Summary
         print("\n" + "="*80)
@@ -1368,9 +2268,18 @@ Please generate all 5 sections following PRD v2.2 requirements exactly."""
         print("="*80)
 
         print(f"\n✓ Successfully created: {len(created_social)} social posts" + (" + 1 blog post" if blog_folder else ""))
-
-        print(f"\n📁 ALL CONTENT IN ONE FOLDER:")
-        print(f"   {week_folder.relative_to(Path.cwd())}/")
+        if manifest.unfilled_slots:
+            print(f"\n⚠️  {len(manifest.unfilled_slots)} scheduled post(s) skipped - no unused angle left for \"{theme}\"")
+        if failed:
+            print(f"\n⚠️  {len(failed)} item(s) failed - rerun with --resume to retry only those")
+
+        if self.archive_format:
+            print(f"\n📦 ALL CONTENT IN ONE ARCHIVE:")
+            print(f"   {_display_path(published)}")
+            print(f"   └── {published.name[:-len(ARCHIVE_FORMATS[self.archive_format])]}/")
+        else:
+            print(f"\n📁 ALL CONTENT IN ONE FOLDER:")
+            print(f"   {_display_path(published)}/")
         print(f"   ├── instagram/")
         print(f"   ├── facebook/")
         print(f"   ├── linkedin/")
@@ -1381,7 +2290,10 @@ Please generate all 5 sections following PRD v2.2 requirements exactly."""
         print(f"   ├── IMAGE_GENERATION_GUIDE.md")
         print(f"   └── WEEK_{week_number}_CONTENT_SUMMARY.md")
         print(f"\n📋 Weekly Content Summary:")
-        print(f"   {summary_file.relative_to(Path.cwd())}")
+        if self.archive_format:
+            print(f"   {summary_name} (in the archive)")
+        else:
+            print(f"   {_display_path(summary_file)}")
         print(f"   ✨ Open this file to review everything in one place!")
 
         print(f"\n🗓️ Your Posting Schedule:")
@@ -1412,6 +2324,312 @@ Please generate all 5 sections following PRD v2.2 requirements exactly."""
             print(f"   5. Track performance with weekly_checkin.py after posting")
         print()
 
+        return summary_file
+
+
+    def create_headless_batch(
+        self,
+        week_start: str,
+        theme: str,
+        style: Dict,
+        api_key: str,
+        with_blog: bool = False,
+        schedule: Optional[List[Dict]] = None,
+        batches_path: Optional[Path] = None,
+        practice: Optional[str] = None
+    ) -> Optional[Path]:
+        """
+        Create a weekly batch without any prompts.
+
+        An existing manifest for the same week and theme is resumed, so
+        re-running a job after a failure only regenerates missing posts.
+
+        Args:
+            week_start: Week start date (YYYY-MM-DD)
+            theme: Weekly theme
+            style: Style settings (see normalize_style)
+            api_key: Anthropic API key
+            with_blog: Include the Friday blog post
+            schedule: Day/platform slots (defaults to 2 posts per day Mon-Thu)
+            batches_path: Batches root (defaults to weekly-batches/)
+            practice: Practice name (recorded with the week's API usage)
+
+        Returns:
+            Path to the weekly summary file
+        """
+        manifest = self.prepare_headless_manifest(
+            week_start, theme, style, with_blog, schedule, batches_path, api_key, practice
+        )
+
+        print("\n" + "="*80)
+        print(f"CREATING CONTENT: {manifest.week_folder.name}")
+        print("="*80)
+
+        return self.run_batch(week_start, manifest, api_key)
+
+    def prepare_headless_manifest(
+        self,
+        week_start: str,
+        theme: str,
+        style: Dict,
+        with_blog: bool = False,
+        schedule: Optional[List[Dict]] = None,
+        batches_path: Optional[Path] = None,
+        api_key: Optional[str] = None,
+        practice: Optional[str] = None
+    ) -> BatchManifest:
+        """
+        Load the week's manifest, or create a new one if there is none or
+        it was made for a different theme.
+
+        Args are as for create_headless_batch(); the API key is only used
+        to generate the theme's angle pool (see generate_social_angles).
+
+        Returns:
+            BatchManifest for the week
+        """
+        week_dt = datetime.fromisoformat(week_start)
+        week_folder = self.stage_week(self.get_week_folder(week_dt, batches_path), practice)
+
+        manifest = BatchManifest.load(week_folder)
+        if manifest is None or manifest.theme != theme:
+            posting_schedule = self.build_posting_schedule(week_dt, schedule)
+            social_angles = self.screen_angles(
+                theme, self.generate_social_angles(theme, len(posting_schedule), api_key, practice)
+            )
+            manifest = BatchManifest.create(
+                week_folder, week_start, theme, "headless", style,
+                social_angles, posting_schedule, with_blog
+            )
+
+        return manifest
+
+    def run_headless_jobs(
+        self,
+        jobs: List[Dict],
+        api_key: str,
+        pipeline_depth: int = DEFAULT_PIPELINE_DEPTH
+    ) -> List[Dict]:
+        """
+        Run many weekly batches as one pipelined job.
+
+        Up to ``pipeline_depth`` weeks are in progress at once, so one week's
+        saving and summary work overlaps the next week's API calls. The total
+        number of in-flight API calls stays capped at ``max_concurrency``.
+
+        Args:
+            jobs: Jobs from expand_batch_jobs()
+            api_key: Anthropic API key
+            pipeline_depth: Number of weeks to work on at the same time
+
+        Returns:
+            One result per job with practice, week_start, theme, summary,
+            unfilled_slots (scheduled posts left out for lack of angles) and error
+        """
+        results = []
+
+        with ThreadPoolExecutor(max_workers=max(1, pipeline_depth)) as executor:
+            futures = [
+                executor.submit(
+                    self.create_headless_batch,
+                    week_start=job["week_start"],
+                    theme=job["theme"],
+                    style=job["style"],
+                    api_key=api_key,
+                    with_blog=job["with_blog"],
+                    schedule=job["schedule"],
+                    batches_path=job["batches_path"],
+                    practice=job["practice"]
+                )
+                for job in jobs
+            ]
+
+            for job, future in zip(jobs, futures):
+                result = {
+                    "practice": job["practice"],
+                    "week_start": job["week_start"],
+                    "theme": job["theme"],
+                    "summary": None,
+                    "unfilled_slots": 0,
+                    "error": None
+                }
+                try:
+                    result["summary"] = future.result()
+                except Exception as e:
+                    result["error"] = str(e)
+                manifest = self.load_week_manifest(datetime.fromisoformat(job["week_start"]), job["batches_path"])
+                if manifest:
+                    result["unfilled_slots"] = len(manifest.unfilled_slots)
+                results.append(result)
+
+        print("\n" + "="*80)
+        print("HEADLESS RUN COMPLETE")
+        print("="*80 + "\n")
+
+        for result in results:
+            label = f"{result['practice']} " if result["practice"] else ""
+            if result["error"]:
+                print(f"  ❌ {label}{result['week_start']}: {result['error']}")
+            elif result["unfilled_slots"]:
+                print(f"  ⚠️  {label}{result['week_start']}: {result['theme']} "
+                      f"({result['unfilled_slots']} scheduled post(s) skipped - no unused angles left)")
+            else:
+                print(f"  ✓ {label}{result['week_start']}: {result['theme']}")
+
+        failed = sum(1 for r in results if r["error"])
+        print(f"\n{len(results) - failed}/{len(results)} week(s) completed")
+
+        throttling = RateLimiter.format_stats(self.rate_limiter.stats())
+        if throttling:
+            print(f"⏳ Throttling: {throttling}")
+
+        prompt_cache = format_prompt_cache_usage(self.usage_stats())
+        if prompt_cache:
+            print(f"🗄️  Prompt cache: {prompt_cache}")
+        self.print_run_usage()
+
+        return results
+
+
+def normalize_style(style: Optional[Dict] = None) -> Dict:
+    """
+    Fill in and validate a style dict for headless runs.
+
+    Args:
+        style: Partial style (tone, social_length, audience, blog_focus)
+
+    Returns:
+        Complete style dict
+
+    Raises:
+        ValueError: If a field has an unknown value
+    """
+    normalized = dict(DEFAULT_STYLE)
+    normalized.update(style or {})
+
+    for field, choices in STYLE_CHOICES.items():
+        if normalized[field] not in choices:
+            raise ValueError(f"Invalid {field} '{normalized[field]}' (choose from: {', '.join(choices)})")
+
+    try:
+        normalized["social_length"] = int(normalized["social_length"])
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid social_length '{normalized['social_length']}' (expected a word count)")
+
+    return normalized
+
+
+def load_batch_spec(spec_path: Path) -> Dict:
+    """
+    Load a headless batch spec from a JSON or YAML file.
+
+    Spec format:
+        {
+          "defaults": {"style": {...}, "with_blog": true, "schedule": [{"day": "Monday", "platform": "Instagram"}, ...]},
+          "practices": [{"name": "hendersonville", "output_dir": "weekly-batches"}],
+          "weeks": [{"week": "2025-11-10", "theme": "Managing Social Anxiety", "style": {"tone": "educational"}}]
+        }
+
+    "practices" is optional; a practice may carry its own "weeks", "style",
+    "with_blog" and "schedule". Week entries override practice settings,
+    which override "defaults". A named practice without an "output_dir"
+    writes to weekly-batches/<practice name>/.
+    """
+    with open(spec_path, 'r') as f:
+        if spec_path.suffix.lower() in ('.yaml', '.yml'):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML specs require PyYAML (pip install pyyaml) - or use a .json spec")
+            return yaml.safe_load(f) or {}
+
+        return json.load(f)
+
+
+def expand_batch_jobs(spec: Dict, base_path: Path = None) -> List[Dict]:
+    """
+    Expand a batch spec into one job per (practice, week).
+
+    Args:
+        spec: Spec from load_batch_spec()
+        base_path: Folder that relative practice output_dir values are
+            resolved against (defaults to this script's folder)
+
+    Returns:
+        List of jobs with practice, batches_path, week_start, theme, style,
+        with_blog and schedule
+
+    Raises:
+        ValueError: If a week is missing a theme or has invalid settings, or
+            two jobs would write the same week folder
+    """
+    if base_path is None:
+        base_path = Path(__file__).parent
+
+    defaults = spec.get("defaults", {})
+    practices = spec.get("practices") or [{}]
+
+    jobs = []
+    week_folders = {}
+    for practice in practices:
+        output_dir = practice.get("output_dir")
+        if output_dir:
+            batches_path = base_path / output_dir
+        elif practice.get("name"):
+            # Practices sharing weekly-batches/ would stage into the same week folder
+            batches_path = base_path / WEEKLY_BATCHES_DIR.name / practice_slug(practice["name"])
+        else:
+            batches_path = None
+
+        for week in practice.get("weeks", spec.get("weeks", [])):
+            if isinstance(week, str):
+                week = {"week": week}
+
+            settings = {}
+            for layer in (defaults, practice, week):
+                settings.update({k: v for k, v in layer.items() if k not in ("weeks", "style")})
+
+            style = {}
+            for layer in (defaults, practice, week):
+                style.update(layer.get("style", {}))
+
+            week_start = str(settings.get("week", ""))
+            try:
+                datetime.fromisoformat(week_start)
+            except ValueError:
+                raise ValueError(f"Invalid week '{week_start}' (use YYYY-MM-DD)")
+
+            if not settings.get("theme"):
+                raise ValueError(f"No theme given for week {week_start}")
+
+            schedule = settings.get("schedule")
+            for item in schedule or []:
+                if item.get("day") not in DAY_OFFSETS:
+                    raise ValueError(f"Invalid schedule day '{item.get('day')}' for week {week_start}")
+
+            week_folder = (batches_path or WEEKLY_BATCHES_DIR).resolve() / week_folder_name(
+                datetime.fromisoformat(week_start)
+            )
+            label = practice.get("name") or "(default)"
+            if week_folder in week_folders:
+                raise ValueError(
+                    f"Week {week_start} of practice '{label}' would be written to {week_folder}, "
+                    f"already used by practice '{week_folders[week_folder]}' - give each practice its own output_dir"
+                )
+            week_folders[week_folder] = label
+
+            jobs.append({
+                "practice": practice.get("name"),
+                "batches_path": batches_path,
+                "week_start": week_start,
+                "theme": settings["theme"],
+                "style": normalize_style(style),
+                "with_blog": bool(settings.get("with_blog", False)),
+                "schedule": schedule
+            })
+
+    return jobs
+
 
 def main():
     """CLI interface."""
@@ -1423,8 +2641,8 @@ def main():
     parser.add_argument(
         "--week",
         type=str,
-        required=True,
-        help="Week start date (YYYY-MM-DD)"
+        nargs="+",
+        help="Week start date (YYYY-MM-DD); headless mode accepts several"
     )
 
     parser.add_argument(
@@ -1445,19 +2663,194 @@ def main():
         help="Include PRD v2.2 compliant blog post (Friday)"
     )
 
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted batch for this week, regenerating only missing posts"
+    )
+
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run without prompts, taking theme and style from flags"
+    )
+
+    parser.add_argument(
+        "--spec",
+        type=Path,
+        help="JSON/YAML batch spec (weeks, practices, style, schedule); implies --headless"
+    )
+
+    parser.add_argument(
+        "--theme",
+        type=str,
+        help="Weekly theme (headless mode)"
+    )
+
+    parser.add_argument(
+        "--tone",
+        choices=STYLE_CHOICES["tone"],
+        default=DEFAULT_STYLE["tone"],
+        help="Content tone (headless mode)"
+    )
+
+    parser.add_argument(
+        "--length",
+        type=int,
+        default=DEFAULT_STYLE["social_length"],
+        help="Social post length in words (headless mode)"
+    )
+
+    parser.add_argument(
+        "--audience",
+        choices=STYLE_CHOICES["audience"],
+        default=DEFAULT_STYLE["audience"],
+        help="Target audience (headless mode)"
+    )
+
+    parser.add_argument(
+        "--blog-focus",
+        choices=STYLE_CHOICES["blog_focus"],
+        default=DEFAULT_STYLE["blog_focus"],
+        help="Blog focus (headless mode)"
+    )
+
+    parser.add_argument(
+        "--platforms",
+        type=str,
+        help="Comma-separated platform for each Mon-Thu slot, e.g. Instagram,LinkedIn,Facebook,... (headless mode)"
+    )
+
+    parser.add_argument(
+        "--pipeline-depth",
+        type=int,
+        default=DEFAULT_PIPELINE_DEPTH,
+        help=f"Weeks to work on at the same time in headless mode (default: {DEFAULT_PIPELINE_DEPTH})"
+    )
+
+    parser.add_argument(
+        "--stream-blog",
+        action="store_true",
+        help="Stream the blog post into its file as it is written, with live progress "
+             "(an interrupted post is continued on --resume)"
+    )
+
+    parser.add_argument(
+        "--backend",
+        choices=["messages", "batch"],
+        default="messages",
+        help="Headless generation backend: direct calls, or one Message Batches API job "
+             "(slower to finish, cheaper; default: messages)"
+    )
+
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=30,
+        help="Seconds between batch status checks with --backend batch (default: 30)"
+    )
+
+    parser.add_argument(
+        "--base-url",
+        type=str,
+        default=None,
+        help="API base URL, e.g. a local_batch_server.py stand-in (default: ANTHROPIC_BASE_URL or the public API)"
+    )
+
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        default=None,
+        help="Requests per minute allowed by your API tier (default: ANTHROPIC_RPM or 50)"
+    )
+
+    parser.add_argument(
+        "--tpm",
+        type=float,
+        default=None,
+        help="Input + output tokens per minute allowed by your API tier (default: ANTHROPIC_TPM or 40000)"
+    )
+
+    parser.add_argument(
+        "--archive",
+        choices=list(ARCHIVE_FORMATS),
+        default=None,
+        help="Publish each finished week as a single .tar.gz (tar) or .zip archive instead of a folder"
+    )
+
+    parser.add_argument(
+        "--duplicate-angles",
+        choices=DUPLICATE_ANGLE_MODES,
+        default=None,
+        help="Angles too similar to past posts: flag them, block (replace) them, "
+             "or skip the check (default: DUPLICATE_ANGLE_MODE or flag)"
+    )
+    parser.add_argument(
+        "--fixed-angles",
+        action="store_true",
+        help="Use the fixed angle templates instead of a generated angle pool per theme"
+    )
+    parser.add_argument(
+        "--plain-posts",
+        action="store_true",
+        help="Generate social posts as free-form markdown instead of structured fields"
+    )
+
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=None,
+        help="Max pooled HTTP connections to the API (default: ANTHROPIC_POOL_SIZE or 10)"
+    )
+
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Per-request API timeout in seconds (default: ANTHROPIC_TIMEOUT or 600)"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the response cache and regenerate everything (fresh responses are still cached)"
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Maximum API calls to run in parallel (default: {DEFAULT_MAX_CONCURRENCY}, 1 = sequential)"
+    )
+
     args = parser.parse_args()
+    headless = args.headless or args.spec is not None
 
-    # Validate week format
-    try:
-        datetime.fromisoformat(args.week)
-    except ValueError:
-        print(f"❌ Error: Invalid date format '{args.week}'")
-        print("   Use YYYY-MM-DD format (e.g., 2025-11-04)")
+    if not args.spec and not args.week:
+        print("❌ Error: --week is required (or use --spec)")
         sys.exit(1)
 
-    if not args.interactive:
+    # Validate week format
+    for week in args.week or []:
+        try:
+            datetime.fromisoformat(week)
+        except ValueError:
+            print(f"❌ Error: Invalid date format '{week}'")
+            print("   Use YYYY-MM-DD format (e.g., 2025-11-04)")
+            sys.exit(1)
+
+    if not headless and not args.interactive and not args.resume:
         print("❌ Error: This version requires --interactive flag")
         print("   Use: python create_weekly_batch_v2.py --week YYYY-MM-DD --use-api --interactive --with-blog")
+        print("   Or run without prompts: --headless --theme \"...\" (or --spec batch_spec.json)")
+        sys.exit(1)
+
+    if not headless and len(args.week) > 1:
+        print("❌ Error: Several weeks can only be created in headless mode (--headless or --spec)")
+        sys.exit(1)
+
+    if args.backend == "batch" and not headless:
+        print("❌ Error: --backend batch only works in headless mode (--headless or --spec)")
         sys.exit(1)
 
     if not args.use_api:
@@ -1465,13 +2858,79 @@ def main():
         print("   Interactive mode requires API to generate content")
         sys.exit(1)
 
+    jobs = []
+    if headless:
+        try:
+            if args.spec:
+                jobs = expand_batch_jobs(load_batch_spec(args.spec))
+            else:
+                schedule = None
+                if args.platforms:
+                    platforms = [p.strip() for p in args.platforms.split(",") if p.strip()]
+                    days = [item["day"] for item in DEFAULT_POSTING_SCHEDULE]
+                    if len(platforms) > len(days):
+                        raise ValueError(f"At most {len(days)} platforms can be scheduled (Mon-Thu)")
+                    schedule = [{"day": day, "platform": platform} for day, platform in zip(days, platforms)]
+
+                jobs = expand_batch_jobs({
+                    "defaults": {
+                        "theme": args.theme,
+                        "with_blog": args.with_blog,
+                        "schedule": schedule,
+                        "style": {
+                            "tone": args.tone,
+                            "social_length": args.length,
+                            "audience": args.audience,
+                            "blog_focus": args.blog_focus
+                        }
+                    },
+                    "weeks": args.week
+                })
+        except (OSError, ValueError) as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+
     # Initialize and run
-    creator = InteractiveWeeklyBatchCreator()
-    creator.create_interactive_batch(
-        week_start=args.week,
-        with_blog=args.with_blog
+    client_provider = AnthropicClientProvider(
+        pool_size=args.pool_size,
+        timeout=args.timeout,
+        base_url=args.base_url
     )
+    creator = InteractiveWeeklyBatchCreator(
+        max_concurrency=args.concurrency,
+        client_provider=client_provider,
+        response_cache=ResponseCache(bypass=args.no_cache),
+        stream_blog=args.stream_blog,
+        rate_limiter=RateLimiter(requests_per_minute=args.rpm, tokens_per_minute=args.tpm),
+        duplicate_angles=args.duplicate_angles,
+        archive_format=args.archive,
+        fixed_angles=args.fixed_angles,
+        structured_posts=not args.plain_posts
+    )
+    try:
+        if headless:
+            api_key = os.environ.get("ANTHROPIC_API_KEY")
+            if not api_key:
+                print("❌ Error: ANTHROPIC_API_KEY not found in environment")
+                sys.exit(1)
 
+            if args.backend == "batch":
+                from batch_backend import MessageBatchBackend
+
+                backend = MessageBatchBackend(creator, api_key, poll_interval=args.poll_interval)
+                results = backend.run(jobs)
+            else:
+                results = creator.run_headless_jobs(jobs, api_key, pipeline_depth=args.pipeline_depth)
+            if any(result["error"] for result in results):
+                sys.exit(1)
+        else:
+            creator.create_interactive_batch(
+                week_start=args.week[0],
+                with_blog=args.with_blog,
+                resume=args.resume
+            )
+    finally:
+        creator.close()
 
 if __name__ == "__main__":
     main()
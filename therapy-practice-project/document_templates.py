@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Document Templates
+
+The week's generated documents (image guides, blog README, weekly summary)
+are rendered from string.Template files in templates/. Each template is
+read and compiled once per process and shared by every creator, and each
+document is rendered into one string and written with a single call.
+
+A practice can restyle its documents without editing Python by putting
+same-named files in a folder of its own and pointing CONTENT_TEMPLATES_DIR
+(or the templates_path argument) at it. Files missing from that folder
+fall back to the defaults in templates/.
+"""
+
+import threading
+from pathlib import Path
+from string import Template
+from typing import Dict, Optional, Tuple
+
+from config import get_template_settings
+
+DEFAULT_TEMPLATES_PATH = Path(__file__).parent / "templates"
+
+# Compiled templates by resolved file path, shared across the process
+_compiled: Dict[Path, Template] = {}
+_compiled_lock = threading.Lock()
+
+
+def _compile(path: Path) -> Template:
+    """Read and compile a template file (once per process)."""
+    path = path.resolve()
+    with _compiled_lock:
+        template = _compiled.get(path)
+        if template is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                template = Template(f.read())
+            _compiled[path] = template
+        return template
+
+
+class DocumentTemplates:
+    """Looks up, compiles and renders document templates."""
+
+    def __init__(self, templates_path: Optional[Path] = None):
+        """
+        Initialize the template set.
+
+        Args:
+            templates_path: Folder with practice-specific templates that
+                override the defaults (defaults to CONTENT_TEMPLATES_DIR,
+                see config.get_template_settings)
+        """
+        if templates_path is None:
+            templates_path = get_template_settings()["templates_dir"]
+
+        self.search_path: Tuple[Path, ...] = tuple(
+            Path(folder) for folder in (templates_path, DEFAULT_TEMPLATES_PATH) if folder
+        )
+
+    def find(self, name: str) -> Path:
+        """
+        Template file for a name (override folder first).
+
+        Raises:
+            FileNotFoundError: If no folder has the template
+        """
+        for folder in self.search_path:
+            path = folder / name
+            if path.is_file():
+                return path
+        raise FileNotFoundError(f"Template '{name}' not found in {', '.join(map(str, self.search_path))}")
+
+    def render(self, name: str, **values) -> str:
+        """
+        Render a template.
+
+        Args:
+            name: Template file name (e.g. 'weekly_summary.md')
+            **values: Values for the template's $placeholders
+
+        Returns:
+            Rendered document
+
+        Raises:
+            ValueError: If the template uses a placeholder that wasn't given
+        """
+        path = self.find(name)
+        try:
+            return _compile(path).substitute(values)
+        except KeyError as e:
+            raise ValueError(f"Template {path} uses unknown placeholder ${e.args[0]}")
+        except ValueError as e:
+            raise ValueError(f"Template {path} is invalid: {e} (write a literal $ as $$)")
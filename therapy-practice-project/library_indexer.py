@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Incremental Library Indexer
+
+Keeps the content catalog in step with files that are edited, moved or
+deleted by hand under social-media-content/ and weekly-batches/. A
+manifest of path -> (mtime, size, sha256) is kept in the catalog
+database. Each refresh stats every tracked file, re-parses only new or
+changed ones and drops catalog rows for deleted ones, so a refresh of an
+unchanged library costs one stat per file and no parsing. Social posts
+are also kept in step in the near-duplicate index when one is given.
+
+Tracked files:
+    *_meta.json            Social post metadata (the catalog row)
+    <post>.md              Social post content (row removed if deleted)
+    blog/<folder>/*.md     Blog posts (title read from the header)
+
+Usage:
+    python library_indexer.py            # refresh and print what changed
+    python library_indexer.py --rebuild  # re-parse every file, even unchanged ones
+"""
+
+import argparse
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from content_catalog import ContentCatalog, blog_item_from_file, social_item_from_meta_file
+from near_duplicates import NearDuplicateIndex
+
+
+def _file_hash(path: str) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _is_tracked(rel_path: str, name: str) -> bool:
+    """Whether a library file feeds the catalog."""
+    if name.endswith("_meta.json"):
+        return True
+    if not name.endswith(".md") or name == "README.md":
+        return False
+    parts = rel_path.split("/")
+    # blog/<folder>/<post>.md, or a social post inside a platform folder
+    return (len(parts) >= 3 and parts[-3] == "blog") or "blog" not in parts
+
+
+class LibraryIndexer:
+    """Incrementally syncs the content catalog with the library on disk."""
+
+    def __init__(
+        self,
+        catalog: ContentCatalog,
+        roots: Iterable[Path],
+        near_duplicates: Optional[NearDuplicateIndex] = None
+    ):
+        """
+        Initialize the indexer.
+
+        Args:
+            catalog: Content catalog to keep up to date
+            roots: Library folders to index
+            near_duplicates: Near-duplicate index to keep up to date with
+                social post titles and text
+        """
+        self.catalog = catalog
+        self.roots = list(roots)
+        self.near_duplicates = near_duplicates
+
+    def _walk(self, root: Path) -> Iterator[Tuple[str, str, os.stat_result]]:
+        """Yield (absolute path, catalog path, stat) for every tracked file under root."""
+        root_key = self.catalog.relative_path(root)
+        stack = [(str(root), root_key)]
+
+        while stack:
+            folder, folder_key = stack.pop()
+            try:
+                entries = os.scandir(folder)
+            except OSError:
+                continue
+
+            with entries:
+                for entry in entries:
+                    key = f"{folder_key}/{entry.name}"
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith("."):
+                            stack.append((entry.path, key))
+                    elif entry.is_file() and _is_tracked(key, entry.name):
+                        try:
+                            yield entry.path, key, entry.stat()
+                        except OSError:
+                            continue
+
+    def refresh(self, rebuild: bool = False) -> Dict:
+        """
+        Bring the catalog up to date with the library.
+
+        Args:
+            rebuild: Re-parse every file, even ones the manifest says are unchanged
+
+        Returns:
+            Stats with scanned, added, changed, removed, unchanged and
+            elapsed_ms
+        """
+        started = time.perf_counter()
+        if self.near_duplicates is not None and self.near_duplicates.is_empty():
+            # New (or deleted) near-duplicate index: fill it from every post
+            rebuild = True
+        manifest = self.catalog.load_file_manifest()
+        root_keys = [self.catalog.relative_path(root) + "/" for root in self.roots]
+
+        seen = set()
+        upserts = []
+        changed_files: List[Tuple[str, str]] = []
+        stats = {"scanned": 0, "added": 0, "changed": 0, "removed": 0, "unchanged": 0}
+
+        for root in self.roots:
+            for path, key, stat in self._walk(root):
+                seen.add(key)
+                stats["scanned"] += 1
+
+                known = manifest.get(key)
+                if (not rebuild and known
+                        and known[0] == stat.st_mtime_ns and known[1] == stat.st_size):
+                    stats["unchanged"] += 1
+                    continue
+
+                try:
+                    digest = _file_hash(path)
+                except OSError:
+                    continue
+
+                upserts.append((key, stat.st_mtime_ns, stat.st_size, digest))
+                if not rebuild and known and known[2] == digest:
+                    # Touched but not modified
+                    stats["unchanged"] += 1
+                    continue
+
+                stats["changed" if known else "added"] += 1
+                changed_files.append((path, key))
+
+        deleted = [
+            key for key in manifest
+            if key not in seen and any(key.startswith(prefix) for prefix in root_keys)
+        ]
+        stats["removed"] = len(deleted)
+
+        self._apply(changed_files, deleted)
+        self.catalog.update_file_manifest(upserts, deleted)
+
+        stats["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return stats
+
+    def _apply(self, changed_files: List[Tuple[str, str]], deleted: List[str]) -> None:
+        """Re-parse changed files and drop catalog rows for deleted ones."""
+        items = []
+        meta_files = set()
+        removed_paths = []
+
+        for path, key in changed_files:
+            if key.endswith("_meta.json"):
+                meta_files.add(path)
+            elif "/blog/" in f"/{key}":
+                item = blog_item_from_file(Path(path))
+                if item:
+                    items.append(item)
+            else:
+                # Content edited by hand: refresh its row from the metadata
+                meta_file = path[:-len(".md")] + "_meta.json"
+                if os.path.exists(meta_file):
+                    meta_files.add(meta_file)
+
+        for meta_file in meta_files:
+            item = social_item_from_meta_file(Path(meta_file))
+            if item and item[1].exists():
+                items.append(item)
+                self._index_near_duplicates(item)
+
+        for key in deleted:
+            path = self.catalog.root / key
+            if key.endswith("_meta.json"):
+                removed_paths.append(path.with_name(path.name[:-len("_meta.json")] + ".md"))
+            elif "/blog/" in f"/{key}":
+                removed_paths.append(path.parent)
+            else:
+                removed_paths.append(path)
+
+        if removed_paths:
+            self.catalog.remove_paths(removed_paths)
+            if self.near_duplicates is not None:
+                self.near_duplicates.remove([self.catalog.relative_path(path) for path in removed_paths])
+        self.catalog.record_many(items)
+
+    def _index_near_duplicates(self, item: tuple) -> None:
+        """Add a social post (catalog item) to the near-duplicate index."""
+        if self.near_duplicates is None:
+            return
+
+        metadata, content_file, _ = item
+        try:
+            body = content_file.read_text()
+        except OSError:
+            return
+        self.near_duplicates.add(
+            self.catalog.relative_path(content_file), metadata.get("title") or "", body
+        )
+
+
+def default_roots(project_root: Path = None) -> List[Path]:
+    """The library folders indexed by default."""
+    if project_root is None:
+        project_root = Path(__file__).parent
+    return [project_root / "social-media-content", project_root / "weekly-batches"]
+
+
+def format_refresh_stats(stats: Dict) -> str:
+    """One-line summary of a refresh."""
+    return (f"{stats['scanned']:,} file(s) checked in {stats['elapsed_ms']:g} ms: "
+            f"{stats['added']} new, {stats['changed']} changed, {stats['removed']} removed")
+
+
+def main():
+    """CLI interface."""
+
+    parser = argparse.ArgumentParser(
+        description="Sync the content catalog with files in the content library"
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Re-parse every file, even unchanged ones"
+    )
+
+    args = parser.parse_args()
+
+    catalog = ContentCatalog()
+    near_duplicates = NearDuplicateIndex()
+    try:
+        stats = LibraryIndexer(catalog, default_roots(), near_duplicates).refresh(rebuild=args.rebuild)
+        print(f"✓ Catalog refreshed - {format_refresh_stats(stats)}")
+
+        counts = catalog.counts()
+        print(f"  {sum(counts.values())} item(s) in catalog: "
+              + ", ".join(f"{platform} {count}" for platform, count in sorted(counts.items())))
+    finally:
+        near_duplicates.close()
+        catalog.close()
+
+
+if __name__ == "__main__":
+    main()
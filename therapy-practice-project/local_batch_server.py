@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Local Message Batches Stand-in Server
+
+A small offline stand-in for the parts of the Anthropic API the content
+tools use, so the Message Batches backend (and direct generation) can be
+exercised without an API key or network access. Responses are canned
+placeholder posts built from the prompt - nothing is sent anywhere.
+
+Endpoints:
+    POST /v1/messages                          Direct message (canned reply; server-sent
+                                               events when the body has "stream": true)
+    POST /v1/messages/batches                  Create a batch
+    GET  /v1/messages/batches/<id>             Batch status (ends after --delay seconds)
+    GET  /v1/messages/batches/<id>/results     JSONL results once ended
+    POST /v1/messages/batches/<id>/cancel      Cancel a batch
+
+Usage:
+    python local_batch_server.py --port 8765 --delay 5
+    ANTHROPIC_API_KEY=test python create_weekly_batch_v2.py --spec batch_spec.json \\
+        --use-api --backend batch --base-url http://127.0.0.1:8765 --poll-interval 1
+    ANTHROPIC_API_KEY=test python create_weekly_batch_v2.py --spec batch_spec.json \\
+        --use-api --stream-blog --base-url http://127.0.0.1:8765
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Set
+
+
+# Shortest prefix the real API caches (Sonnet); shorter cache_control
+# breakpoints are ignored there, so they are here too
+MIN_CACHEABLE_TOKENS = 1024
+
+
+def prefix_tokens(text: str) -> int:
+    """Rough token count of a prompt prefix (about 4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+def _timestamp(seconds: Optional[float]) -> Optional[str]:
+    """RFC 3339 timestamp for an epoch time, or None."""
+    if seconds is None:
+        return None
+    return datetime.fromtimestamp(seconds, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def canned_tool_input(tool: Dict, first_line: str) -> Dict:
+    """Placeholder input for a tool: text for string fields, a few items for arrays."""
+    values = {}
+    for name, schema in (tool.get("input_schema") or {}).get("properties", {}).items():
+        if schema.get("type") == "array":
+            if name == "hashtags":
+                values[name] = ["#MentalHealth", "#Therapy", "#HendersonvilleNC"]
+            else:
+                values[name] = [f"Placeholder {name.replace('_', ' ')} {i}" for i in (1, 2)]
+        else:
+            values[name] = f"[Local stand-in response] {first_line}"
+    return values
+
+
+def canned_message(params: Dict, seen_prefixes: Optional[Set[str]] = None) -> Dict:
+    """
+    Build a placeholder Messages API response for request params.
+
+    The text echoes the first line of the prompt and carries a few
+    hashtags so previews and summaries have something to show. A prefix
+    ending in a system block marked with cache_control is reported as a
+    cache write the first time it is seen (tracked in seen_prefixes) and
+    a cache read after that - but only if it is at least
+    MIN_CACHEABLE_TOKENS long, as with the real API. Requests that force a
+    tool (tool_choice) get a tool_use block with placeholder input instead
+    of text.
+    """
+    cache_write = cache_read = 0
+    # The cached prefix is the tools plus the system blocks up to the breakpoint
+    prefix = json.dumps(params.get("tools") or [])
+    cached_prefix = None
+    for block in params.get("system") or []:
+        if isinstance(block, dict):
+            prefix += block.get("text", "")
+            if block.get("cache_control"):
+                cached_prefix = prefix
+    if cached_prefix is not None and prefix_tokens(cached_prefix) >= MIN_CACHEABLE_TOKENS:
+        if seen_prefixes is not None and cached_prefix in seen_prefixes:
+            cache_read = prefix_tokens(cached_prefix)
+        else:
+            cache_write = prefix_tokens(cached_prefix)
+            if seen_prefixes is not None:
+                seen_prefixes.add(cached_prefix)
+
+    prompt = params["messages"][0]["content"]
+    if isinstance(prompt, list):
+        prompt = " ".join(block.get("text", "") for block in prompt)
+    first_line = prompt.strip().splitlines()[0] if prompt.strip() else ""
+
+    text = (
+        f"[Local stand-in response]\n\n"
+        f"{first_line}\n\n"
+        f"This placeholder was generated offline by local_batch_server.py.\n\n"
+        f"#MentalHealth #Therapy #HendersonvilleNC"
+    )
+
+    content = [{"type": "text", "text": text}]
+    stop_reason = "end_turn"
+    tool_choice = params.get("tool_choice") or {}
+    tool = next((t for t in params.get("tools") or [] if t.get("name") == tool_choice.get("name")), None)
+    if tool_choice.get("type") == "tool" and tool:
+        content = [{
+            "type": "tool_use",
+            "id": f"toolu_local_{uuid.uuid4().hex[:24]}",
+            "name": tool["name"],
+            "input": canned_tool_input(tool, first_line)
+        }]
+        stop_reason = "tool_use"
+
+    return {
+        "id": f"msg_local_{uuid.uuid4().hex[:24]}",
+        "type": "message",
+        "role": "assistant",
+        "model": params.get("model", "local-stand-in"),
+        "content": content,
+        "stop_reason": stop_reason,
+        "stop_sequence": None,
+        "usage": {
+            "input_tokens": len(prompt.split()),
+            "output_tokens": len(text.split()),
+            "cache_creation_input_tokens": cache_write,
+            "cache_read_input_tokens": cache_read
+        }
+    }
+
+
+def message_events(message: Dict, chunk_words: int = 5) -> list:
+    """
+    Server-sent events streaming a message, as the Messages API sends them
+    for "stream": true (text in chunks of ``chunk_words`` words, tool input
+    as one JSON delta, output tokens in the closing message_delta).
+    """
+    start = dict(message, content=[], stop_reason=None, usage=dict(message["usage"], output_tokens=1))
+    events = [("message_start", {"type": "message_start", "message": start})]
+
+    for index, block in enumerate(message["content"]):
+        if block["type"] == "text":
+            events.append(("content_block_start", {
+                "type": "content_block_start", "index": index, "content_block": {"type": "text", "text": ""}
+            }))
+            words = block["text"].split(" ")
+            for i in range(0, len(words), chunk_words):
+                text = " ".join(words[i:i + chunk_words]) + (" " if i + chunk_words < len(words) else "")
+                events.append(("content_block_delta", {
+                    "type": "content_block_delta", "index": index, "delta": {"type": "text_delta", "text": text}
+                }))
+        else:
+            events.append(("content_block_start", {
+                "type": "content_block_start", "index": index, "content_block": dict(block, input={})
+            }))
+            events.append(("content_block_delta", {
+                "type": "content_block_delta", "index": index,
+                "delta": {"type": "input_json_delta", "partial_json": json.dumps(block["input"])}
+            }))
+        events.append(("content_block_stop", {"type": "content_block_stop", "index": index}))
+
+    events.append(("message_delta", {
+        "type": "message_delta",
+        "delta": {"stop_reason": message["stop_reason"], "stop_sequence": None},
+        "usage": {"output_tokens": message["usage"]["output_tokens"]}
+    }))
+    events.append(("message_stop", {"type": "message_stop"}))
+    return events
+
+
+class BatchStore:
+    """In-memory batches; each one ends ``delay`` seconds after creation."""
+
+    def __init__(self, delay: float = 5.0, error_rate: float = 0.0):
+        """
+        Initialize the store.
+
+        Args:
+            delay: Seconds until a new batch reports processing_status "ended"
+            error_rate: Fraction of batch requests that return an error result
+        """
+        self.delay = delay
+        self.error_rate = error_rate
+        self.batches: Dict[str, Dict] = {}
+        self.seen_prefixes: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def create(self, requests: list) -> Dict:
+        batch_id = f"msgbatch_local_{uuid.uuid4().hex[:20]}"
+        with self._lock:
+            self.batches[batch_id] = {
+                "id": batch_id,
+                "created": time.time(),
+                "cancelled": None,
+                "requests": requests,
+                "results": None
+            }
+        return self.batches[batch_id]
+
+    def get(self, batch_id: str) -> Optional[Dict]:
+        with self._lock:
+            return self.batches.get(batch_id)
+
+    def cancel(self, batch_id: str) -> Optional[Dict]:
+        with self._lock:
+            batch = self.batches.get(batch_id)
+            if batch and batch["cancelled"] is None:
+                batch["cancelled"] = time.time()
+            return batch
+
+    def is_ended(self, batch: Dict) -> bool:
+        return batch["cancelled"] is not None or time.time() - batch["created"] >= self.delay
+
+    def results(self, batch: Dict) -> list:
+        """Per-request results, built once when first asked for."""
+        with self._lock:
+            if batch["results"] is None:
+                batch["results"] = []
+                for request in batch["requests"]:
+                    if batch["cancelled"] is not None:
+                        result = {"type": "canceled"}
+                    elif random.random() < self.error_rate:
+                        result = {
+                            "type": "errored",
+                            "error": {"type": "error", "error": {
+                                "type": "api_error", "message": "Simulated failure"
+                            }}
+                        }
+                    else:
+                        result = {
+                            "type": "succeeded",
+                            "message": canned_message(request["params"], self.seen_prefixes)
+                        }
+                    batch["results"].append({"custom_id": request["custom_id"], "result": result})
+            return batch["results"]
+
+    def describe(self, batch: Dict, base_url: str) -> Dict:
+        """Batch object as returned by the API."""
+        ended = self.is_ended(batch)
+        total = len(batch["requests"])
+        counts = {"processing": total, "succeeded": 0, "errored": 0, "canceled": 0, "expired": 0}
+
+        if ended:
+            counts["processing"] = 0
+            for entry in self.results(batch):
+                counts[entry["result"]["type"]] += 1
+
+        ended_at = None
+        if ended:
+            ended_at = batch["cancelled"] or batch["created"] + self.delay
+
+        return {
+            "id": batch["id"],
+            "type": "message_batch",
+            "processing_status": "ended" if ended else (
+                "canceling" if batch["cancelled"] else "in_progress"
+            ),
+            "request_counts": counts,
+            "created_at": _timestamp(batch["created"]),
+            "expires_at": _timestamp(batch["created"] + timedelta(days=1).total_seconds()),
+            "ended_at": _timestamp(ended_at),
+            "cancel_initiated_at": _timestamp(batch["cancelled"]),
+            "archived_at": None,
+            "results_url": f"{base_url}/v1/messages/batches/{batch['id']}/results" if ended else None
+        }
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Routes API requests to the server's BatchStore."""
+
+    server_version = "LocalBatchServer/1.0"
+
+    @property
+    def store(self) -> BatchStore:
+        return self.server.store
+
+    def _base_url(self) -> str:
+        host = self.headers.get("Host") or f"{self.server.server_address[0]}:{self.server.server_address[1]}"
+        return f"http://{host}"
+
+    def _send_json(self, status: int, body: Dict) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_events(self, events: list) -> None:
+        """Send server-sent events; the connection closes when they're done."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        for event, data in events:
+            self.wfile.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+        self.close_connection = True
+
+    def _send_error(self, status: int, error_type: str, message: str) -> None:
+        self._send_json(status, {"type": "error", "error": {"type": error_type, "message": message}})
+
+    def _read_json(self) -> Optional[Dict]:
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            return json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_error(400, "invalid_request_error", "Body is not valid JSON")
+            return None
+
+    def _path_parts(self) -> list:
+        return [part for part in self.path.split("?")[0].split("/") if part]
+
+    def do_POST(self):
+        parts = self._path_parts()
+
+        if parts == ["v1", "messages"]:
+            body = self._read_json()
+            if body is not None:
+                with self.store._lock:
+                    message = canned_message(body, self.store.seen_prefixes)
+                if body.get("stream"):
+                    self._send_events(message_events(message))
+                else:
+                    self._send_json(200, message)
+            return
+
+        if parts == ["v1", "messages", "batches"]:
+            body = self._read_json()
+            if body is None:
+                return
+            requests = body.get("requests") or []
+            custom_ids = [request.get("custom_id") for request in requests]
+            if not requests or len(set(custom_ids)) != len(custom_ids):
+                self._send_error(400, "invalid_request_error", "requests must be non-empty with unique custom_ids")
+                return
+            batch = self.store.create(requests)
+            self._send_json(200, self.store.describe(batch, self._base_url()))
+            return
+
+        if len(parts) == 5 and parts[:3] == ["v1", "messages", "batches"] and parts[4] == "cancel":
+            batch = self.store.cancel(parts[3])
+            if batch is None:
+                self._send_error(404, "not_found_error", f"Batch {parts[3]} not found")
+            else:
+                self._send_json(200, self.store.describe(batch, self._base_url()))
+            return
+
+        self._send_error(404, "not_found_error", f"No route for POST {self.path}")
+
+    def do_GET(self):
+        parts = self._path_parts()
+
+        if len(parts) in (4, 5) and parts[:3] == ["v1", "messages", "batches"]:
+            batch = self.store.get(parts[3])
+            if batch is None:
+                self._send_error(404, "not_found_error", f"Batch {parts[3]} not found")
+                return
+
+            if len(parts) == 4:
+                self._send_json(200, self.store.describe(batch, self._base_url()))
+                return
+
+            if parts[4] == "results":
+                if not self.store.is_ended(batch):
+                    self._send_error(400, "invalid_request_error", "Batch is still processing")
+                    return
+                payload = "".join(json.dumps(entry) + "\n" for entry in self.store.results(batch)).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-jsonl")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+                return
+
+        self._send_error(404, "not_found_error", f"No route for GET {self.path}")
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def make_server(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    delay: float = 5.0,
+    error_rate: float = 0.0,
+    quiet: bool = False
+) -> ThreadingHTTPServer:
+    """
+    Create (but don't start) a stand-in server.
+
+    Use port 0 to pick a free port; the chosen one is in server.server_address.
+    """
+    server = ThreadingHTTPServer((host, port), StandInHandler)
+    server.store = BatchStore(delay=delay, error_rate=error_rate)
+    server.quiet = quiet
+    return server
+
+
+def main():
+    """CLI interface."""
+
+    parser = argparse.ArgumentParser(
+        description="Offline stand-in for the Anthropic Messages and Message Batches API"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument("--delay", type=float, default=5.0, help="Seconds before a batch ends (default: 5)")
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of batch requests that return an error, to test retries (default: 0)"
+    )
+    parser.add_argument("--quiet", action="store_true", help="Don't log each request")
+
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.delay, args.error_rate, args.quiet)
+    host, port = server.server_address[:2]
+    print(f"🧪 Local batch server on http://{host}:{port} (batches end after {args.delay:g}s)")
+    print(f"   Use: --base-url http://{host}:{port}  (or ANTHROPIC_BASE_URL)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
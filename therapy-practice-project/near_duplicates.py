@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Index
+
+MinHash signatures with an LSH band index over the titles and bodies of
+every post in the content library, so a new angle (or a freshly generated
+post) can be compared against years of content without reading it all.
+A lookup hashes the query into one bucket per band, fetches only the
+posts sharing a bucket, and ranks those by estimated Jaccard similarity.
+
+Titles are shingled into character 4-grams and bodies into word 3-grams.
+With 32 bands of 4 rows, pairs at 0.6 similarity (the default threshold)
+share a bucket about 99% of the time, while unrelated posts rarely do.
+
+Location:
+    .cache/near_duplicates.db   (derived data - rebuilt from the library
+                                 by library_indexer if deleted)
+"""
+
+import hashlib
+import random
+import re
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from config import get_duplicate_settings
+
+# Signature length; BANDS * ROWS must equal NUM_HASHES
+NUM_HASHES = 128
+BANDS = 32
+ROWS = 4
+
+# Characters per title shingle
+TITLE_SHINGLE_SIZE = 4
+
+TITLE = "title"
+BODY = "body"
+
+# Hash permutations h -> (a * h + b) mod _PRIME, fixed so stored
+# signatures stay comparable between runs
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20240101)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_HASHES)]
+del _rng
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+# Words too common in this library to say anything about a topic
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "for", "from", "how", "in", "is",
+    "it", "of", "on", "or", "the", "to", "what", "when", "with", "you", "your"
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS signatures (
+    path       TEXT PRIMARY KEY,
+    title      TEXT NOT NULL,
+    title_sig  BLOB,
+    body_sig   BLOB
+);
+CREATE TABLE IF NOT EXISTS buckets (
+    kind    TEXT NOT NULL,
+    band    INTEGER NOT NULL,
+    bucket  INTEGER NOT NULL,
+    path    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_buckets_lookup ON buckets (kind, band, bucket);
+CREATE INDEX IF NOT EXISTS idx_buckets_path ON buckets (path);
+"""
+
+
+def _hash64(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+def title_shingles(title: str) -> Set[str]:
+    """Character 4-grams of a title, without stopwords (so "Adult" ~ "Adults")."""
+    text = " ".join(word for word in _WORD.findall(title.lower()) if word not in _STOPWORDS)
+    if not text:
+        return set()
+    return {text[i:i + TITLE_SHINGLE_SIZE] for i in range(max(1, len(text) - TITLE_SHINGLE_SIZE + 1))}
+
+
+def body_shingles(text: str) -> Set[str]:
+    """Word 3-grams of a post body (falls back to words for very short text)."""
+    words = _WORD.findall(text.lower())
+    if len(words) < 3:
+        return set(words)
+    return {" ".join(words[i:i + 3]) for i in range(len(words) - 2)}
+
+
+def minhash(shingles: Set[str]) -> Optional[List[int]]:
+    """
+    MinHash signature of a shingle set.
+
+    Returns:
+        NUM_HASHES values, or None for an empty set
+    """
+    if not shingles:
+        return None
+
+    hashes = [_hash64(shingle.encode("utf-8")) for shingle in shingles]
+    return [min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def similarity(a: List[int], b: List[int]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_HASHES
+
+
+def _band_buckets(signature: List[int]) -> List[int]:
+    """One bucket id per LSH band (signed 64-bit, as SQLite stores integers)."""
+    buckets = []
+    for band in range(BANDS):
+        rows = array("Q", signature[band * ROWS:(band + 1) * ROWS]).tobytes()
+        buckets.append(int.from_bytes(hashlib.blake2b(rows, digest_size=8).digest(), "big", signed=True))
+    return buckets
+
+
+def _pack(signature: Optional[List[int]]) -> Optional[bytes]:
+    return array("Q", signature).tobytes() if signature else None
+
+
+def _unpack(blob: Optional[bytes]) -> Optional[List[int]]:
+    if not blob:
+        return None
+    signature = array("Q")
+    signature.frombytes(blob)
+    return signature.tolist()
+
+
+class NearDuplicateIndex:
+    """Persistent MinHash/LSH index of post titles and bodies."""
+
+    def __init__(self, db_path: Path = None, threshold: Optional[float] = None):
+        """
+        Open (and create if needed) the index.
+
+        Args:
+            db_path: Database file (defaults to .cache/near_duplicates.db)
+            threshold: Similarity at or above which content is a near
+                duplicate (defaults to DUPLICATE_THRESHOLD, see
+                config.get_duplicate_settings)
+        """
+        if db_path is None:
+            db_path = Path(__file__).parent / ".cache" / "near_duplicates.db"
+        if threshold is None:
+            threshold = get_duplicate_settings()["threshold"]
+
+        self.db_path = db_path
+        self.threshold = threshold
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def is_empty(self) -> bool:
+        """Whether nothing has been indexed yet."""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM signatures LIMIT 1").fetchone() is None
+
+    def add(self, path: str, title: str, body: str = "") -> None:
+        """
+        Index (or re-index) a post.
+
+        Args:
+            path: Content path, as stored in the content catalog
+            title: Post title (angle)
+            body: Post text
+        """
+        title_sig = minhash(title_shingles(title))
+        body_sig = minhash(body_shingles(body))
+
+        rows = []
+        for kind, signature in ((TITLE, title_sig), (BODY, body_sig)):
+            if signature:
+                rows.extend((kind, band, bucket, path) for band, bucket in enumerate(_band_buckets(signature)))
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM buckets WHERE path = ?", (path,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO signatures (path, title, title_sig, body_sig) VALUES (?, ?, ?, ?)",
+                (path, title, _pack(title_sig), _pack(body_sig))
+            )
+            self._conn.executemany(
+                "INSERT INTO buckets (kind, band, bucket, path) VALUES (?, ?, ?, ?)", rows
+            )
+
+    def remove(self, paths: List[str]) -> None:
+        """Drop posts from the index."""
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM buckets WHERE path = ?", [(path,) for path in paths])
+            self._conn.executemany("DELETE FROM signatures WHERE path = ?", [(path,) for path in paths])
+
+    def nearest(self, text: str, kind: str = TITLE, exclude: Optional[str] = None) -> Optional[Dict]:
+        """
+        Find the most similar indexed post among LSH candidates.
+
+        Args:
+            text: Angle/title (kind=TITLE) or post text (kind=BODY)
+            kind: Which signatures to compare against
+            exclude: Content path to ignore (e.g. the post itself)
+
+        Returns:
+            Dict with path, title and similarity, or None if no post shares
+            an LSH bucket with the query
+        """
+        shingles = title_shingles(text) if kind == TITLE else body_shingles(text)
+        signature = minhash(shingles)
+        if signature is None:
+            return None
+
+        column = "title_sig" if kind == TITLE else "body_sig"
+        with self._lock:
+            candidates = set()
+            for band, bucket in enumerate(_band_buckets(signature)):
+                candidates.update(
+                    row[0] for row in self._conn.execute(
+                        "SELECT path FROM buckets WHERE kind = ? AND band = ? AND bucket = ?",
+                        (kind, band, bucket)
+                    )
+                )
+            candidates.discard(exclude)
+
+            best = None
+            for path in candidates:
+                row = self._conn.execute(
+                    f"SELECT title, {column} FROM signatures WHERE path = ?", (path,)
+                ).fetchone()
+                other = _unpack(row[1]) if row else None
+                if other is None:
+                    continue
+                score = similarity(signature, other)
+                if best is None or score > best["similarity"]:
+                    best = {"path": path, "title": row[0], "similarity": score}
+
+        return best
+
+    def find_duplicate(self, text: str, kind: str = TITLE, exclude: Optional[str] = None) -> Optional[Dict]:
+        """Nearest post if its similarity reaches the threshold, else None."""
+        match = self.nearest(text, kind, exclude)
+        if match and match["similarity"] >= self.threshold:
+            return match
+        return None
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Observance Calendar
+
+Parses mental_health_observances.json once and answers "which observances
+overlap this window?" from a sorted interval index. Dates in the file are
+month/day strings without a year ("January 1-31", "March 10-16",
+"February 24 - March 2", "October 10"); each one is normalized to a
+(month, day) range when loaded and turned into concrete date intervals
+per year on first use, with ranges that run past December 31 ending in
+the following year.
+
+Usage:
+    python observance_calendar.py --week 2025-11-10              # observances for a week
+    python observance_calendar.py --week 2025-12-22 --lead-days 21
+"""
+
+import argparse
+import bisect
+import calendar
+import json
+import re
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+
+# "March 10", "March 10-16", "February 24 - March 2"
+_DATE_RANGE = re.compile(
+    r"^\s*([A-Za-z]+)\s+(\d{1,2})(?:\s*-\s*(?:([A-Za-z]+)\s+)?(\d{1,2}))?\s*$"
+)
+
+
+def parse_month_day_range(text: str) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """
+    Parse an observance date string into ((month, day), (month, day)).
+
+    Raises:
+        ValueError: If the string is not a month/day date or range
+    """
+    match = _DATE_RANGE.match(text or "")
+    if not match:
+        raise ValueError(f"Unrecognized observance date: {text!r}")
+
+    start_month_name, start_day, end_month_name, end_day = match.groups()
+    start_month = MONTHS.get(start_month_name.lower())
+    end_month = MONTHS.get(end_month_name.lower()) if end_month_name else start_month
+    if start_month is None or end_month is None:
+        raise ValueError(f"Unrecognized month in observance date: {text!r}")
+
+    start = (start_month, int(start_day))
+    end = (end_month, int(end_day)) if end_day else start
+    for month, day in (start, end):
+        if not 1 <= day <= 31:
+            raise ValueError(f"Invalid day in observance date: {text!r}")
+    return start, end
+
+
+def _on(year: int, month_day: Tuple[int, int]) -> date:
+    """The month/day in a given year (clamped to the month's length)."""
+    month, day = month_day
+    return date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+class Observance:
+    """One calendar entry with its yearly (month, day) range."""
+
+    def __init__(self, entry: Dict, date_text: str):
+        self.name = entry.get("name", "")
+        self.type = entry.get("type", "day")
+        self.date_text = date_text
+        self.start, self.end = parse_month_day_range(date_text)
+        self.focus_areas = list(entry.get("focus_areas") or [])
+        self.content_ideas = list(entry.get("content_ideas") or [])
+
+    def interval(self, year: int) -> Tuple[date, date]:
+        """Dates of the occurrence starting in ``year``."""
+        start = _on(year, self.start)
+        end_year = year + 1 if self.end < self.start else year
+        return start, _on(end_year, self.end)
+
+    def as_dict(self, start: date, end: date) -> Dict:
+        """Observance as returned by window queries."""
+        return {
+            "name": self.name,
+            "type": self.type,
+            "date": self.date_text,
+            "start_date": start,
+            "end_date": end,
+            "focus_areas": self.focus_areas,
+            "content_ideas": self.content_ideas,
+            "description": " - ".join(self.content_ideas or ["Mental health awareness"])
+        }
+
+
+class ObservanceCalendar:
+    """Observances with a per-year interval index sorted by start date."""
+
+    def __init__(self, data: Optional[Dict] = None):
+        """
+        Build the calendar from parsed observances JSON.
+
+        Args:
+            data: Contents of mental_health_observances.json ({"observances":
+                {month: {"month_observances": [...], "specific_dates": [...]}}})
+        """
+        self.observances: List[Observance] = []
+        self.skipped: List[str] = []
+
+        for month in ((data or {}).get("observances") or {}).values():
+            if not isinstance(month, dict):
+                continue
+            entries = [(entry, entry.get("dates")) for entry in month.get("month_observances") or []]
+            entries += [(entry, entry.get("date")) for entry in month.get("specific_dates") or []]
+            for entry, date_text in entries:
+                try:
+                    self.observances.append(Observance(entry, date_text))
+                except (ValueError, TypeError):
+                    self.skipped.append(entry.get("name") or str(date_text))
+
+        # Longest occurrence, so a window query knows how far back to look
+        self._max_span = max(
+            ((end - start).days for start, end in (obs.interval(2000) for obs in self.observances)),
+            default=0
+        )
+        self._years: Dict[int, Tuple[List[date], List[Tuple[date, date, Observance]]]] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> "ObservanceCalendar":
+        """Load the calendar from a JSON file (empty if the file doesn't exist)."""
+        if not path.exists():
+            return cls()
+        with open(path, 'r') as f:
+            return cls(json.load(f))
+
+    def _year_index(self, year: int) -> Tuple[List[date], List[Tuple[date, date, Observance]]]:
+        """Occurrences starting in ``year``, sorted by start date (built once per year)."""
+        index = self._years.get(year)
+        if index is None:
+            entries = sorted(
+                (obs.interval(year) + (obs,) for obs in self.observances),
+                key=lambda entry: (entry[0], entry[1])
+            )
+            index = ([entry[0] for entry in entries], entries)
+            self._years[year] = index
+        return index
+
+    def window(self, start, end) -> List[Dict]:
+        """
+        Observances overlapping a date window.
+
+        Args:
+            start: First day of the window (date or datetime)
+            end: Last day of the window (date or datetime)
+
+        Returns:
+            Observance dicts (name, type, date, start_date, end_date,
+            focus_areas, content_ideas, description), by start date
+        """
+        if isinstance(start, datetime):
+            start = start.date()
+        if isinstance(end, datetime):
+            end = end.date()
+
+        earliest = start - timedelta(days=self._max_span)
+        results = []
+        for year in range(earliest.year, end.year + 1):
+            starts, entries = self._year_index(year)
+            # Only occurrences starting in [start - longest span, end] can overlap
+            lo = bisect.bisect_left(starts, earliest)
+            hi = bisect.bisect_right(starts, end)
+            for obs_start, obs_end, obs in entries[lo:hi]:
+                if obs_end >= start:
+                    results.append(obs.as_dict(obs_start, obs_end))
+        return results
+
+    def upcoming(self, week_start, week_end, lead_time_days: int = 14) -> List[Dict]:
+        """Observances overlapping a week or the ``lead_time_days`` after it."""
+        return self.window(week_start, week_end + timedelta(days=lead_time_days))
+
+
+def main():
+    """CLI interface."""
+
+    parser = argparse.ArgumentParser(
+        description="List mental health observances for a week"
+    )
+    parser.add_argument("--week", required=True, help="Week start date (YYYY-MM-DD)")
+    parser.add_argument(
+        "--lead-days",
+        type=int,
+        default=14,
+        help="Also include observances this many days after the week (default: 14)"
+    )
+
+    args = parser.parse_args()
+
+    week_start = date.fromisoformat(args.week)
+    observances_calendar = ObservanceCalendar.load(Path(__file__).parent / "mental_health_observances.json")
+    observances = observances_calendar.upcoming(week_start, week_start + timedelta(days=6), args.lead_days)
+
+    print(f"📅 Observances for the week of {week_start:%B %d, %Y} (+{args.lead_days} days):")
+    if not observances:
+        print("  (none)")
+    for obs in observances:
+        dates = f"{obs['start_date']:%b %d}"
+        if obs['end_date'] != obs['start_date']:
+            dates += f" - {obs['end_date']:%b %d}"
+        print(f"  • {obs['name']} ({obs['type']}, {dates})")
+
+    if observances_calendar.skipped:
+        print(f"\n⚠️  Skipped {len(observances_calendar.skipped)} entry(ies) with unreadable dates: "
+              + ", ".join(observances_calendar.skipped))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+API Rate Limiter
+
+Shared token-bucket limiter and retry scheduler for Anthropic calls. Every
+generation call reserves one request and its estimated tokens from
+requests-per-minute and tokens-per-minute buckets before it is sent, and
+is retried with jittered exponential backoff when the API answers 429
+(rate limited), 529 (overloaded), another 5xx, or the connection drops
+(including part way through a streamed response).
+A retry-after header from the API pauses every caller sharing the limiter,
+not just the one that was throttled.
+
+Throttling delay, retries and errors are counted so each run can report
+how much time was spent waiting on limits.
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import anthropic
+import httpx
+
+from config import get_rate_limit_settings
+
+
+# Backoff for retries without a retry-after header: full jitter between 0
+# and min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt)
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+
+# Status codes worth retrying (529 = overloaded)
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+# Transport errors the SDK passes through unwrapped when a response body is
+# already being read (e.g. a stream cut off mid-way): dropped connections,
+# timeouts and a server closing the connection early
+RETRYABLE_TRANSPORT_ERRORS = (httpx.NetworkError, httpx.TimeoutException, httpx.RemoteProtocolError)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for rate limiting (about 4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether an API error is transient and the call should be retried."""
+    if isinstance(error, (anthropic.APIConnectionError,) + RETRYABLE_TRANSPORT_ERRORS):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code in RETRYABLE_STATUS_CODES or error.status_code >= 500
+    return False
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Delay requested by the API's retry-after headers, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        # retry-after may also be an HTTP date; fall back to backoff
+        pass
+    return None
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at rate_per_minute, holding one minute's worth."""
+
+    def __init__(self, rate_per_minute: float):
+        self.capacity = rate_per_minute
+        self.level = rate_per_minute
+        self.rate = rate_per_minute / 60.0
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """
+        Take amount from the bucket, letting it go negative.
+
+        Returns:
+            Seconds until the reservation is covered (0 if available now)
+        """
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        self.level -= min(amount, self.capacity)
+        return max(0.0, -self.level / self.rate)
+
+    def adjust(self, amount: float) -> None:
+        """Correct an earlier reservation (positive gives tokens back)."""
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimiter:
+    """Thread-safe request/token limiter with retrying calls and run stats."""
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_retries: Optional[int] = None
+    ):
+        """
+        Initialize the limiter.
+
+        Any setting left as None falls back to the .env / environment
+        configuration (see config.get_rate_limit_settings). A limit of 0
+        disables that bucket.
+
+        Args:
+            requests_per_minute: Requests allowed per minute
+            tokens_per_minute: Input + output tokens allowed per minute
+            max_retries: Retries for transient errors before giving up
+        """
+        settings = get_rate_limit_settings()
+
+        if requests_per_minute is None:
+            requests_per_minute = settings["requests_per_minute"]
+        if tokens_per_minute is None:
+            tokens_per_minute = settings["tokens_per_minute"]
+        if max_retries is None:
+            max_retries = settings["max_retries"]
+
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+
+        self._requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        self._stats = {
+            "requests": 0,
+            "throttled_requests": 0,
+            "throttle_seconds": 0.0,
+            "retries": 0,
+            "backoff_seconds": 0.0,
+            "failures": 0,
+            "errors": {}
+        }
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Wait until one request and ``tokens`` tokens are available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._paused_until - now)
+            if self._requests:
+                wait = max(wait, self._requests.reserve(1, now))
+            if self._tokens and tokens:
+                wait = max(wait, self._tokens.reserve(tokens, now))
+
+            self._stats["requests"] += 1
+            if wait > 0:
+                self._stats["throttled_requests"] += 1
+                self._stats["throttle_seconds"] += wait
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once a call's real usage is known."""
+        if self._tokens:
+            with self._lock:
+                self._tokens.adjust(estimated_tokens - actual_tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds`` (used for retry-after)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def call(self, func: Callable, estimated_tokens: int = 0):
+        """
+        Run an API call under the limits, retrying transient errors.
+
+        Args:
+            func: Zero-argument callable making the API call. It is called
+                again on retry, so it must be safe to repeat.
+            estimated_tokens: Tokens to reserve before each attempt; given
+                back when an attempt fails and corrected from the result's
+                ``usage`` when it has one
+
+        Returns:
+            Whatever func returns
+
+        Raises:
+            The last error, once it is not retryable or retries run out
+        """
+        attempt = 0
+        while True:
+            self.acquire(estimated_tokens)
+            try:
+                result = func()
+            except Exception as e:
+                # A failed attempt's tokens are reserved again by the next one
+                self.settle(estimated_tokens, 0)
+                self._record_error(e)
+                if not is_retryable(e) or attempt >= self.max_retries:
+                    with self._lock:
+                        self._stats["failures"] += 1
+                    raise
+
+                retry_after = retry_after_seconds(e)
+                if retry_after is not None:
+                    # The API told us when to come back - hold back everyone
+                    delay = retry_after + random.uniform(0, 1)
+                    self.pause(retry_after)
+                else:
+                    cap = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt)
+                    delay = random.uniform(0, cap)
+
+                with self._lock:
+                    self._stats["retries"] += 1
+                    self._stats["backoff_seconds"] += delay
+
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            usage = getattr(result, "usage", None)
+            if usage is not None:
+                actual = (getattr(usage, "input_tokens", 0) or 0) + (getattr(usage, "output_tokens", 0) or 0)
+                self.settle(estimated_tokens, actual)
+            return result
+
+    def _record_error(self, error: Exception) -> None:
+        label = str(getattr(error, "status_code", None) or type(error).__name__)
+        with self._lock:
+            self._stats["errors"][label] = self._stats["errors"].get(label, 0) + 1
+
+    def stats(self) -> Dict:
+        """Snapshot of the counters since this limiter was created."""
+        with self._lock:
+            snapshot = dict(self._stats)
+            snapshot["errors"] = dict(self._stats["errors"])
+        return snapshot
+
+    @staticmethod
+    def stats_delta(before: Dict, after: Dict) -> Dict:
+        """Counters accumulated between two stats() snapshots."""
+        delta = {key: after[key] - before[key] for key in after if key != "errors"}
+        delta["errors"] = {
+            label: count - before["errors"].get(label, 0)
+            for label, count in after["errors"].items()
+            if count - before["errors"].get(label, 0)
+        }
+        return delta
+
+    @staticmethod
+    def format_stats(stats: Dict) -> Optional[str]:
+        """One-line summary of throttling, or None if nothing was throttled or retried."""
+        if not (stats["throttled_requests"] or stats["retries"]):
+            return None
+
+        parts = []
+        if stats["throttled_requests"]:
+            parts.append(f"{stats['throttled_requests']} request(s) held {stats['throttle_seconds']:.1f}s by rate limits")
+        if stats["retries"]:
+            errors = ", ".join(f"{label} x{count}" for label, count in sorted(stats["errors"].items()))
+            parts.append(f"{stats['retries']} retry(ies) after {stats['backoff_seconds']:.1f}s backoff ({errors})")
+        return "; ".join(parts)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache
+
+On-disk cache for generation responses. Entries are keyed by a hash of
+the model, max_tokens, the exact prompt and the job the request is for
+(practice, week, batch and slot - see job_cache_scope in
+create_weekly_batch_v2), so retrying or resuming a week after a crash
+returns already-generated posts without another API call, while other
+weeks and practices sending the same prompt still get fresh responses.
+
+Layout:
+    .cache/responses/<first 2 hex chars>/<sha256>.json
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from config import get_cache_settings
+
+
+class ResponseCache:
+    """On-disk response cache with age- and size-based eviction."""
+
+    def __init__(
+        self,
+        cache_dir: Path = None,
+        max_age_days: Optional[float] = None,
+        max_size_mb: Optional[float] = None,
+        bypass: bool = False
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Cache folder (defaults to .cache/responses/)
+            max_age_days: Entries older than this are treated as misses
+            max_size_mb: Total cache size kept after prune()
+            bypass: Skip lookups (fresh responses are still stored)
+        """
+        settings = get_cache_settings()
+
+        if cache_dir is None:
+            cache_dir = Path(__file__).parent / ".cache" / "responses"
+
+        self.cache_dir = cache_dir
+        self.max_age_seconds = (max_age_days or settings["max_age_days"]) * 86400
+        self.max_size_bytes = int((max_size_mb or settings["max_size_mb"]) * 1024 * 1024)
+        self.bypass = bypass
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, max_tokens: int, prompt: str, **extra) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            model: Model name
+            max_tokens: Max tokens requested
+            prompt: Exact prompt text
+            **extra: Any other request fields that change the response
+
+        Returns:
+            Hex SHA-256 digest of the request fields
+        """
+        payload = {"model": model, "max_tokens": max_tokens, "prompt": prompt}
+        payload.update(extra)
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached response dict, or None on a miss, expiry or bypass
+        """
+        if self.bypass:
+            return None
+
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self._count(hit=False)
+            return None
+
+        if time.time() - entry.get("created", 0) > self.max_age_seconds:
+            entry_path.unlink(missing_ok=True)
+            self._count(hit=False)
+            return None
+
+        # Touch the entry so prune() evicts least recently used first
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        self._count(hit=True)
+        return entry.get("response")
+
+    def put(self, key: str, response: Dict) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from make_key()
+            response: JSON-serializable response dict
+        """
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+
+        entry = {"created": time.time(), "response": response}
+
+        # Write to a temp file and rename so readers never see partial entries
+        fd, tmp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp_name, entry_path)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+
+    def prune(self) -> int:
+        """
+        Evict entries not used within max_age_days, then least recently
+        used entries until the cache fits within max_size_mb.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.cache_dir.exists():
+            return 0
+
+        now = time.time()
+        entries = []
+        removed = 0
+
+        for entry_path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+
+            if now - stat.st_mtime > self.max_age_seconds:
+                entry_path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            entry_path.unlink(missing_ok=True)
+            total_size -= size
+            removed += 1
+
+        return removed
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Sharded Batch Runner
+
+Spreads (practice, week) units from a headless batch spec across a process
+pool. Each worker process has its own batch creator - its own API
+connection pool, concurrency budget and log files - and the total number
+of in-flight API calls across all workers stays under a global cap. The
+requests/min and tokens/min limits are split evenly across workers too, so
+together they stay within the account's rate limits.
+
+Usage:
+    python sharded_runner.py --spec batch_spec.json --workers 4 --max-concurrency 16 --rpm 50 --tpm 40000
+
+Output:
+    runs/<timestamp>/report.json      Aggregated per-unit report
+    runs/<timestamp>/logs/*.log       Console output of each unit
+"""
+
+import argparse
+import atexit
+import contextlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from batch_manifest import DONE, FAILED
+from config import get_rate_limit_settings
+from create_weekly_batch_v2 import (
+    InteractiveWeeklyBatchCreator,
+    expand_batch_jobs,
+    load_batch_spec,
+)
+from rate_limiter import RateLimiter
+from response_cache import ResponseCache
+from usage_ledger import USAGE_FIELDS, UsageLedger
+
+
+# Default global cap on in-flight API calls across all workers
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Per-process creator, built once by _init_worker
+_worker_creator: Optional[InteractiveWeeklyBatchCreator] = None
+
+
+def _init_worker(concurrency: int, no_cache: bool, rpm: float, tpm: float, run_id: str) -> None:
+    """Create this worker process's batch creator with its share of the limits."""
+    global _worker_creator
+
+    _worker_creator = InteractiveWeeklyBatchCreator(
+        max_concurrency=concurrency,
+        response_cache=ResponseCache(bypass=no_cache),
+        rate_limiter=RateLimiter(requests_per_minute=rpm, tokens_per_minute=tpm),
+        # Every worker records its calls under the same run
+        usage_ledger=UsageLedger(run_id=run_id)
+    )
+    atexit.register(_worker_creator.close)
+
+
+def plan_workers(workers: int, max_concurrency: int, job_count: int) -> Tuple[int, int]:
+    """
+    Number of worker processes to start and in-flight API calls per worker.
+
+    Workers are capped at max_concurrency (every worker needs at least one
+    call in flight) and at the number of jobs, so the calls of all workers
+    together never exceed max_concurrency.
+
+    Returns:
+        Tuple of (workers, per_worker_concurrency)
+    """
+    workers = max(1, min(workers, max_concurrency, job_count or 1))
+    return workers, max(1, max_concurrency // workers)
+
+
+def _unit_label(job: Dict) -> str:
+    """Short label for a (practice, week) unit."""
+    return f"{job['practice']}-{job['week_start']}" if job["practice"] else job["week_start"]
+
+
+def _run_unit(job: Dict, api_key: str, log_dir: Path) -> Dict:
+    """
+    Generate one (practice, week) unit inside a worker process.
+
+    Console output goes to the unit's log file so workers don't interleave.
+
+    Returns:
+        Unit result with status, counts, duration and any error
+    """
+    started = time.time()
+    log_file = log_dir / f"{_unit_label(job)}.log"
+    limiter_before = _worker_creator.rate_limiter.stats()
+
+    result = {
+        "practice": job["practice"],
+        "week_start": job["week_start"],
+        "theme": job["theme"],
+        "status": "failed",
+        "summary": None,
+        "posts_done": 0,
+        "posts_failed": 0,
+        "posts_unfilled": 0,
+        "blog_done": False,
+        "error": None,
+        "log": str(log_file),
+        "worker_pid": os.getpid()
+    }
+
+    with open(log_file, 'w') as log, contextlib.redirect_stdout(log):
+        try:
+            summary_file = _worker_creator.create_headless_batch(
+                week_start=job["week_start"],
+                theme=job["theme"],
+                style=job["style"],
+                api_key=api_key,
+                with_blog=job["with_blog"],
+                schedule=job["schedule"],
+                batches_path=job["batches_path"],
+                practice=job["practice"]
+            )
+            result["summary"] = str(summary_file) if summary_file else None
+        except Exception as e:
+            result["error"] = str(e)
+            print(f"❌ Error: {e}")
+
+    blog_failed = False
+    manifest = _worker_creator.load_week_manifest(
+        datetime.fromisoformat(job["week_start"]), job["batches_path"]
+    )
+    if manifest:
+        social = manifest.slots("social")
+        blog = manifest.get_slot("blog")
+        result["posts_done"] = sum(1 for slot in social if slot["state"] == DONE)
+        result["posts_failed"] = sum(1 for slot in social if slot["state"] == FAILED)
+        result["posts_unfilled"] = len(manifest.unfilled_slots)
+        result["blog_done"] = bool(blog and blog["state"] == DONE)
+        blog_failed = bool(blog and blog["state"] == FAILED)
+
+    if result["error"] is None:
+        incomplete = result["posts_failed"] or result["posts_unfilled"] or blog_failed
+        result["status"] = "partial" if incomplete else "complete"
+
+    ledger = _worker_creator.usage_ledger
+    week_folder = _worker_creator.get_week_folder(datetime.fromisoformat(job["week_start"]), job["batches_path"])
+    usage = ledger.totals(week=_worker_creator.catalog.relative_path(week_folder), run_id=ledger.run_id)
+    result["api_calls"] = usage[0]["calls"] if usage else 0
+    result["tokens"] = sum(usage[0][field] for field in USAGE_FIELDS) if usage else 0
+    result["cost_usd"] = round(usage[0]["cost_usd"], 6) if usage else 0.0
+
+    throttling = RateLimiter.stats_delta(limiter_before, _worker_creator.rate_limiter.stats())
+    result["throttle_seconds"] = round(throttling["throttle_seconds"], 1)
+    result["retries"] = throttling["retries"]
+    result["backoff_seconds"] = round(throttling["backoff_seconds"], 1)
+    result["api_errors"] = throttling["errors"]
+
+    result["duration_seconds"] = round(time.time() - started, 1)
+    return result
+
+
+def run_sharded(
+    jobs: List[Dict],
+    api_key: str,
+    workers: int,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    run_folder: Path = None,
+    no_cache: bool = False,
+    rpm: float = None,
+    tpm: float = None
+) -> Dict:
+    """
+    Run jobs across a process pool and write an aggregated report.
+
+    Args:
+        jobs: Jobs from expand_batch_jobs()
+        api_key: Anthropic API key
+        workers: Number of worker processes (fewer are started if there
+            are fewer jobs or max_concurrency is lower, see plan_workers)
+        max_concurrency: Global cap on in-flight API calls (split evenly
+            across workers)
+        run_folder: Folder for logs and report.json (defaults to runs/<timestamp>/)
+        no_cache: Bypass the response cache
+        rpm: Global requests per minute (default: ANTHROPIC_RPM), split across workers
+        tpm: Global tokens per minute (default: ANTHROPIC_TPM), split across workers
+
+    Returns:
+        Aggregated report dict
+    """
+    if run_folder is None:
+        run_folder = Path(__file__).parent / "runs" / datetime.now().strftime('%Y%m%d-%H%M%S')
+
+    log_dir = run_folder / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    workers, per_worker_concurrency = plan_workers(workers, max_concurrency, len(jobs))
+
+    settings = get_rate_limit_settings()
+    rpm = settings["requests_per_minute"] if rpm is None else rpm
+    tpm = settings["tokens_per_minute"] if tpm is None else tpm
+
+    print(f"\n🚀 Running {len(jobs)} unit(s) on {workers} worker(s) "
+          f"({per_worker_concurrency} API call(s) in flight, "
+          f"{rpm / workers:g} req/min and {tpm / workers:g} tokens/min per worker)")
+    print(f"   Logs: {log_dir}\n")
+
+    started = time.time()
+    results = []
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(per_worker_concurrency, no_cache, rpm / workers, tpm / workers, run_folder.name)
+    ) as executor:
+        futures = {executor.submit(_run_unit, job, api_key, log_dir): job for job in jobs}
+
+        for i, future in enumerate(as_completed(futures), 1):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # Worker process died before returning a result
+                result = {
+                    "practice": job["practice"],
+                    "week_start": job["week_start"],
+                    "theme": job["theme"],
+                    "status": "failed",
+                    "error": str(e)
+                }
+
+            results.append(result)
+
+            icon = {"complete": "✓", "partial": "⚠️ "}.get(result["status"], "❌")
+            duration = result.get("duration_seconds")
+            timing = f" ({duration}s)" if duration is not None else ""
+            print(f"[{i}/{len(jobs)}] {icon} {_unit_label(job)}: {result['theme']}{timing}")
+
+    results.sort(key=lambda r: (r["practice"] or "", r["week_start"]))
+
+    report = {
+        "started": datetime.fromtimestamp(started).isoformat(),
+        "duration_seconds": round(time.time() - started, 1),
+        "workers": workers,
+        "max_concurrency": max_concurrency,
+        "requests_per_minute": rpm,
+        "tokens_per_minute": tpm,
+        "units": len(results),
+        "complete": sum(1 for r in results if r["status"] == "complete"),
+        "partial": sum(1 for r in results if r["status"] == "partial"),
+        "failed": sum(1 for r in results if r["status"] == "failed"),
+        "posts_done": sum(r.get("posts_done", 0) for r in results),
+        "posts_failed": sum(r.get("posts_failed", 0) for r in results),
+        "posts_unfilled": sum(r.get("posts_unfilled", 0) for r in results),
+        "throttle_seconds": round(sum(r.get("throttle_seconds", 0) for r in results), 1),
+        "retries": sum(r.get("retries", 0) for r in results),
+        "api_calls": sum(r.get("api_calls", 0) for r in results),
+        "tokens": sum(r.get("tokens", 0) for r in results),
+        "cost_usd": round(sum(r.get("cost_usd", 0) for r in results), 6),
+        "results": results
+    }
+
+    report_file = run_folder / "report.json"
+    with open(report_file, 'w') as f:
+        json.dump(report, f, indent=2, default=str)
+
+    print("\n" + "="*80)
+    print("SHARDED RUN COMPLETE")
+    print("="*80)
+    print(f"\n  Units: {report['complete']} complete, {report['partial']} partial, {report['failed']} failed")
+    print(f"  Posts: {report['posts_done']} created, {report['posts_failed']} failed")
+    if report["posts_unfilled"]:
+        print(f"  ⚠️  {report['posts_unfilled']} scheduled post(s) skipped - their themes ran out of unused angles")
+    print(f"  Time:  {report['duration_seconds']}s")
+    print(f"  Cost:  ${report['cost_usd']:.4f} ({report['api_calls']} call(s), {report['tokens']:,} tokens)")
+    if report["throttle_seconds"] or report["retries"]:
+        print(f"  Throttling: {report['throttle_seconds']}s held by rate limits, {report['retries']} retry(ies)")
+    print(f"\n📋 Report: {report_file}")
+    if report["partial"] or report["failed"]:
+        print("   Re-run the same spec to regenerate only what is missing")
+
+    return report
+
+
+def main():
+    """CLI interface."""
+
+    parser = argparse.ArgumentParser(
+        description="Generate many (practice, week) batches across a process pool"
+    )
+
+    parser.add_argument(
+        "--spec",
+        type=Path,
+        required=True,
+        help="JSON/YAML batch spec (see create_weekly_batch_v2.load_batch_spec)"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 2,
+        help="Number of worker processes, at most --max-concurrency (default: CPU count)"
+    )
+
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Global cap on in-flight API calls (default: {DEFAULT_MAX_CONCURRENCY})"
+    )
+
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        default=None,
+        help="Global requests per minute, split across workers (default: ANTHROPIC_RPM or 50)"
+    )
+
+    parser.add_argument(
+        "--tpm",
+        type=float,
+        default=None,
+        help="Global tokens per minute, split across workers (default: ANTHROPIC_TPM or 40000)"
+    )
+
+    parser.add_argument(
+        "--run-folder",
+        type=Path,
+        help="Folder for logs and report.json (default: runs/<timestamp>/)"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the response cache"
+    )
+
+    args = parser.parse_args()
+
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        print("❌ Error: ANTHROPIC_API_KEY not found in environment")
+        sys.exit(1)
+
+    try:
+        jobs = expand_batch_jobs(load_batch_spec(args.spec))
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    report = run_sharded(
+        jobs,
+        api_key,
+        workers=args.workers,
+        max_concurrency=args.max_concurrency,
+        run_folder=args.run_folder,
+        no_cache=args.no_cache,
+        rpm=args.rpm,
+        tpm=args.tpm
+    )
+
+    if report["failed"] or report["partial"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
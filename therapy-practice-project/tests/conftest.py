@@ -0,0 +1,99 @@
+"""
+Shared fixtures: a creator wired to throwaway stores under tmp_path and
+an API double, so tests never touch .cache/ or the network.
+"""
+
+import itertools
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def fake_usage(input_tokens: int = 100, output_tokens: int = 50) -> SimpleNamespace:
+    """Usage object as the SDK returns it."""
+    return SimpleNamespace(
+        input_tokens=input_tokens, output_tokens=output_tokens,
+        cache_creation_input_tokens=0, cache_read_input_tokens=0
+    )
+
+
+class CountingMessages:
+    """Messages API double whose every response is unique."""
+
+    def __init__(self):
+        self.calls = 0
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def create(self, **request):
+        with self._lock:
+            self.calls += 1
+            n = next(self._counter)
+        text = f"Response {n}: {request['messages'][0]['content'][:40]}\n\n#Response{n}"
+        return SimpleNamespace(content=[SimpleNamespace(type="text", text=text)], usage=fake_usage())
+
+
+class FakeClientProvider:
+    """Client provider handing out one client backed by a messages double."""
+
+    def __init__(self, messages):
+        self.client = SimpleNamespace(messages=messages)
+
+    def get_client(self, api_key):
+        return self.client
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def make_creator(tmp_path):
+    """
+    Factory for creators storing everything under tmp_path.
+
+    Takes the messages double (CountingMessages by default) and any
+    InteractiveWeeklyBatchCreator options; angles are the fixed templates
+    and posts plain text unless overridden.
+    """
+    # The creator talks to the API through the anthropic SDK
+    pytest.importorskip("anthropic")
+
+    from angle_pool import AnglePool
+    from content_catalog import ContentCatalog
+    from create_weekly_batch_v2 import InteractiveWeeklyBatchCreator
+    from near_duplicates import NearDuplicateIndex
+    from response_cache import ResponseCache
+    from usage_ledger import UsageLedger
+
+    cache = tmp_path / ".cache"
+    creators = []
+
+    def make(messages=None, **options):
+        options = dict({"fixed_angles": True, "structured_posts": False}, **options)
+        creator = InteractiveWeeklyBatchCreator(
+            library_path=tmp_path / "library",
+            client_provider=FakeClientProvider(messages or CountingMessages()),
+            response_cache=ResponseCache(cache_dir=cache / "responses"),
+            catalog=ContentCatalog(db_path=cache / "content_catalog.db", root=tmp_path),
+            near_duplicates=NearDuplicateIndex(db_path=cache / "near_duplicates.db"),
+            angle_pool=AnglePool(db_path=cache / "angle_pools.db"),
+            usage_ledger=UsageLedger(db_path=cache / "usage_ledger.db"),
+            **options
+        )
+        creators.append(creator)
+        return creator
+
+    yield make
+    for creator in creators:
+        creator.close()
+
+
+@pytest.fixture
+def creator(make_creator):
+    """Creator backed by CountingMessages."""
+    return make_creator(max_concurrency=2)
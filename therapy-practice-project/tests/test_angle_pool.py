@@ -0,0 +1,48 @@
+"""
+Angle parsing: only lines that can be post titles make it into a pool,
+never markdown headings or lines the model copied from the prompt.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from angle_pool import parse_angles
+
+INSTRUCTIONS = """Suggest 12 distinct angles for social media posts about: Sleep
+
+Rules:
+- One angle per line, no numbering, no explanations
+- At most 80 characters each
+- HIPAA compliant (no diagnosis, no treatment advice)"""
+
+
+def test_list_markers_and_quotes_are_stripped():
+    text = '1. Why your brain needs a wind-down routine\n- "Myths about sleeping in"\n• **Screens and sleep**'
+    assert parse_angles(text) == [
+        "Why your brain needs a wind-down routine",
+        "Myths about sleeping in",
+        "Screens and sleep",
+    ]
+
+
+def test_markdown_headings_are_skipped():
+    text = "# Sleep angles for this week\n## Tips\nWhy your brain needs a wind-down routine\n### Myths"
+    assert parse_angles(text) == ["Why your brain needs a wind-down routine"]
+
+
+def test_lines_echoing_the_instructions_are_skipped():
+    text = (
+        "Suggest 12 distinct angles for social media posts about: Sleep\n"
+        "One angle per line, no numbering, no explanations\n"
+        "-  at most 80 characters each\n"
+        "Why your brain needs a wind-down routine\n"
+        "HIPAA compliant (no diagnosis, no treatment advice)"
+    )
+    assert parse_angles(text, INSTRUCTIONS) == ["Why your brain needs a wind-down routine"]
+
+
+def test_explanations_and_short_lines_are_skipped():
+    text = "Here are some angles:\nOk\nWhy your brain needs a wind-down routine"
+    assert parse_angles(text) == ["Why your brain needs a wind-down routine"]
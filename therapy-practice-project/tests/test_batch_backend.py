@@ -0,0 +1,82 @@
+"""
+Message Batches backend: slots of a batch whose results could not be
+fetched stay in-flight for the next run instead of being paid for again
+with direct calls.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+# The backend talks to the API through the anthropic SDK
+pytest.importorskip("anthropic")
+
+from batch_backend import MessageBatchBackend
+from batch_manifest import IN_FLIGHT
+from conftest import CountingMessages, fake_usage
+from create_weekly_batch_v2 import DEFAULT_STYLE
+
+SCHEDULE = [
+    {"day": "Monday", "platform": "Instagram"},
+    {"day": "Wednesday", "platform": "Facebook"},
+]
+
+
+class FakeBatches:
+    """Message Batches double; retrieve and results fail while ``down`` is set."""
+
+    def __init__(self):
+        self.down = True
+        self.created = []
+
+    def create(self, requests):
+        self.created.append(requests)
+        return SimpleNamespace(id=f"msgbatch_{len(self.created)}")
+
+    def retrieve(self, batch_id):
+        if self.down:
+            raise ConnectionError("batch API unreachable")
+        counts = SimpleNamespace(processing=0, succeeded=len(self.created[0]), errored=0)
+        return SimpleNamespace(processing_status="ended", request_counts=counts)
+
+    def results(self, batch_id):
+        if self.down:
+            raise ConnectionError("batch API unreachable")
+        for request in self.created[int(batch_id.split("_")[1]) - 1]:
+            message = SimpleNamespace(
+                content=[SimpleNamespace(type="text", text=f"Batch reply for {request['custom_id']}")],
+                usage=fake_usage(), model=request["params"]["model"]
+            )
+            yield SimpleNamespace(
+                custom_id=request["custom_id"],
+                result=SimpleNamespace(type="succeeded", message=message)
+            )
+
+
+def test_unreachable_batch_is_left_in_flight_for_the_next_run(make_creator, tmp_path):
+    messages = CountingMessages()
+    messages.batches = FakeBatches()
+    creator = make_creator(messages)
+    backend = MessageBatchBackend(creator, "test", poll_interval=0)
+    job = {
+        "practice": None, "week_start": "2025-11-10", "theme": "Sleep", "style": dict(DEFAULT_STYLE),
+        "with_blog": True, "schedule": SCHEDULE, "batches_path": tmp_path / "batches"
+    }
+
+    [result] = backend.run([job])
+
+    assert "msgbatch_1" in result["error"]
+    assert messages.calls == 0
+    manifest = creator.prepare_headless_manifest(
+        job["week_start"], job["theme"], job["style"], True, SCHEDULE, job["batches_path"]
+    )
+    assert {slot["state"] for slot in manifest.slots() if slot["kind"] != "summary"} == {IN_FLIGHT}
+    assert not (tmp_path / "batches" / "2025-week-46").exists()
+
+    messages.batches.down = False
+    [result] = backend.run([job])
+
+    assert result["error"] is None
+    assert len(messages.batches.created) == 1
+    assert messages.calls == 0
+    assert (tmp_path / "batches" / "2025-week-46").is_dir()
@@ -0,0 +1,62 @@
+"""
+Batch manifest checkpoints: a reloaded manifest resumes with only the
+slots that aren't finished.
+"""
+
+from batch_manifest import DONE, FAILED, IN_FLIGHT, PENDING, BatchManifest
+
+SCHEDULE = [
+    {"day": "Monday", "date": "2025-11-10", "platform": "Instagram"},
+    {"day": "Tuesday", "date": "2025-11-11", "platform": "Facebook"},
+]
+
+
+def make_manifest(week_folder, with_blog=True) -> BatchManifest:
+    return BatchManifest.create(
+        week_folder, "2025-11-10", "Sleep", "headless", {"tone": "warm"},
+        ["Why sleep matters", "Screens and sleep"], SCHEDULE, with_blog
+    )
+
+
+def test_create_records_every_slot_pending(tmp_path):
+    manifest = make_manifest(tmp_path)
+
+    assert [slot["id"] for slot in manifest.slots()] == ["social-1", "social-2", "blog", "summary"]
+    assert {slot["state"] for slot in manifest.slots()} == {PENDING}
+    assert manifest.get_slot("social-2")["angle"] == "Screens and sleep"
+
+
+def test_reload_keeps_slot_progress(tmp_path):
+    manifest = make_manifest(tmp_path)
+    post = tmp_path / "instagram" / "post.md"
+    post.parent.mkdir()
+    post.write_text("Post")
+    manifest.set_state("social-1", DONE, post)
+    manifest.set_state("social-2", IN_FLIGHT, message_batch_id="msgbatch_1")
+    manifest.set_state("blog", FAILED)
+
+    reloaded = BatchManifest.load(tmp_path)
+
+    assert reloaded.theme == "Sleep" and reloaded.with_blog
+    assert reloaded.is_done(reloaded.get_slot("social-1"))
+    assert reloaded.output_path(reloaded.get_slot("social-1")) == post
+    assert reloaded.get_slot("social-2")["message_batch_id"] == "msgbatch_1"
+    assert [slot["id"] for slot in reloaded.slots() if not reloaded.is_done(slot)] == [
+        "social-2", "blog", "summary"
+    ]
+
+
+def test_done_slot_with_missing_output_is_redone(tmp_path):
+    manifest = make_manifest(tmp_path, with_blog=False)
+    post = tmp_path / "post.md"
+    post.write_text("Post")
+    manifest.set_state("social-1", DONE, post)
+    post.unlink()
+
+    assert not BatchManifest.load(tmp_path).is_done(manifest.get_slot("social-1"))
+
+
+def test_unreadable_manifest_loads_as_none(tmp_path):
+    assert BatchManifest.load(tmp_path) is None
+    (tmp_path / "batch_manifest.json").write_text("{not json")
+    assert BatchManifest.load(tmp_path) is None
@@ -0,0 +1,76 @@
+"""
+Batch spec expansion: every (practice, week) job gets its own week
+folder, so practices never stage into or publish over each other.
+"""
+
+from datetime import datetime
+
+import pytest
+
+# The creator talks to the API through the anthropic SDK
+pytest.importorskip("anthropic")
+
+from create_weekly_batch_v2 import expand_batch_jobs
+
+WEEKS = [{"week": "2025-11-10", "theme": "Sleep"}, {"week": "2025-11-17", "theme": "Stress"}]
+
+
+def test_named_practices_default_to_their_own_folder(tmp_path):
+    spec = {"practices": [{"name": "Hendersonville Counseling"}, {"name": "Asheville"}], "weeks": WEEKS}
+
+    jobs = expand_batch_jobs(spec, base_path=tmp_path)
+
+    assert [(job["practice"], job["week_start"]) for job in jobs] == [
+        ("Hendersonville Counseling", "2025-11-10"), ("Hendersonville Counseling", "2025-11-17"),
+        ("Asheville", "2025-11-10"), ("Asheville", "2025-11-17"),
+    ]
+    assert {job["batches_path"] for job in jobs} == {
+        tmp_path / "weekly-batches" / "hendersonville-counseling",
+        tmp_path / "weekly-batches" / "asheville",
+    }
+
+
+def test_output_dir_is_relative_to_base_path(tmp_path):
+    jobs = expand_batch_jobs({"practices": [{"name": "a", "output_dir": "out/a"}], "weeks": WEEKS}, tmp_path)
+    assert {job["batches_path"] for job in jobs} == {tmp_path / "out" / "a"}
+
+
+def test_spec_without_practices_uses_default_folder(tmp_path):
+    jobs = expand_batch_jobs({"weeks": WEEKS}, tmp_path)
+    assert [job["batches_path"] for job in jobs] == [None, None]
+
+
+@pytest.mark.parametrize("practices", [
+    [{"name": "a", "output_dir": "shared"}, {"name": "b", "output_dir": "shared"}],
+    [{"name": "a"}, {"name": "A"}],
+])
+def test_practices_sharing_a_week_folder_are_rejected(tmp_path, practices):
+    with pytest.raises(ValueError, match="give each practice its own output_dir"):
+        expand_batch_jobs({"practices": practices, "weeks": WEEKS}, tmp_path)
+
+
+def test_same_week_listed_twice_is_rejected(tmp_path):
+    weeks = [{"week": "2025-11-10", "theme": "Sleep"}, {"week": "2025-11-12", "theme": "Stress"}]
+    with pytest.raises(ValueError, match="2025-11-12"):
+        expand_batch_jobs({"weeks": weeks}, tmp_path)
+
+
+def test_two_practices_publish_separate_weeks(make_creator, tmp_path):
+    spec = {
+        "defaults": {"schedule": [{"day": "Monday", "platform": "Instagram"}]},
+        "practices": [{"name": "a"}, {"name": "b"}],
+        "weeks": WEEKS[:1]
+    }
+    jobs = expand_batch_jobs(spec, base_path=tmp_path)
+    creator = make_creator()
+
+    results = creator.run_headless_jobs(jobs, api_key="test")
+
+    assert [result["error"] for result in results] == [None, None]
+    for job in jobs:
+        week_folder = creator.get_week_folder(datetime(2025, 11, 10), job["batches_path"])
+        manifest = creator.load_week_manifest(datetime(2025, 11, 10), job["batches_path"])
+        assert week_folder.is_dir() and manifest is not None
+        assert all(manifest.is_done(slot) for slot in manifest.slots())
+        # Nothing left staged, and only this practice's week in its folder
+        assert [p.name for p in week_folder.parent.iterdir()] == [week_folder.name]
@@ -0,0 +1,66 @@
+"""
+Prompt cache breakpoints: only system prefixes long enough for the API
+to cache get one, and the local stand-in server reports cache use the
+same way.
+"""
+
+from conftest import CountingMessages
+from local_batch_server import MIN_CACHEABLE_TOKENS, canned_message
+
+
+class RecordingMessages(CountingMessages):
+    """Messages double keeping every request it was sent."""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def create(self, **request):
+        self.requests.append(request)
+        return super().create(**request)
+
+
+def test_social_posts_skip_the_breakpoint_blog_keeps_it(make_creator):
+    from create_weekly_batch_v2 import DEFAULT_STYLE, MIN_CACHEABLE_TOKENS as CREATOR_MINIMUM
+    from rate_limiter import estimate_tokens
+
+    messages = RecordingMessages()
+    creator = make_creator(messages)
+    style = dict(DEFAULT_STYLE)
+
+    creator.create_social_post("Sleep tips", "Sleep", "Instagram", style, "test")
+    social_system = messages.requests[0]["system"][0]
+
+    assert estimate_tokens(social_system["text"]) < CREATOR_MINIMUM
+    assert "cache_control" not in social_system
+    assert "cache_control" in creator._build_request("Blog", 100, creator.build_blog_system(style))["system"][0]
+
+
+def test_stand_in_server_ignores_short_prefixes():
+    params = {
+        "messages": [{"role": "user", "content": "Post"}],
+        "system": [{"type": "text", "text": "Short", "cache_control": {"type": "ephemeral"}}]
+    }
+    seen = set()
+
+    usage = canned_message(params, seen)["usage"]
+
+    assert usage["cache_creation_input_tokens"] == usage["cache_read_input_tokens"] == 0
+    assert not seen
+
+
+def test_stand_in_server_caches_long_prefixes():
+    text = "x" * (MIN_CACHEABLE_TOKENS * 4)
+    params = {
+        "messages": [{"role": "user", "content": "Post"}],
+        "system": [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+    }
+    seen = set()
+
+    first = canned_message(params, seen)["usage"]
+    second = canned_message(params, seen)["usage"]
+
+    assert first["cache_creation_input_tokens"] >= MIN_CACHEABLE_TOKENS
+    assert first["cache_read_input_tokens"] == 0
+    assert second["cache_read_input_tokens"] == first["cache_creation_input_tokens"]
+    assert second["cache_creation_input_tokens"] == 0
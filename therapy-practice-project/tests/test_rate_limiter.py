@@ -0,0 +1,66 @@
+"""
+Rate limiter token accounting: retries of one call reserve its tokens
+once, not once per attempt.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# is_retryable checks anthropic's error types
+pytest.importorskip("anthropic")
+
+import httpx
+import rate_limiter
+from rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "is_retryable", lambda error: True)
+    monkeypatch.setattr(rate_limiter.time, "sleep", lambda seconds: None)
+    return RateLimiter(requests_per_minute=0, tokens_per_minute=10_000, max_retries=3)
+
+
+def flaky_call(failures: int, usage=None):
+    """Callable failing ``failures`` times before returning a result with usage."""
+    state = {"calls": 0}
+
+    def call():
+        state["calls"] += 1
+        if state["calls"] <= failures:
+            raise ConnectionError("dropped")
+        return SimpleNamespace(usage=usage)
+
+    return call
+
+
+def test_retried_call_reserves_its_tokens_once(limiter):
+    usage = SimpleNamespace(input_tokens=1_500, output_tokens=500)
+    limiter.call(flaky_call(2, usage), estimated_tokens=3_000)
+
+    assert limiter.stats()["retries"] == 2
+    assert limiter._tokens.level == pytest.approx(10_000 - 2_000, abs=5)
+
+
+def test_failed_call_gives_its_tokens_back(limiter):
+    with pytest.raises(ConnectionError):
+        limiter.call(flaky_call(10), estimated_tokens=3_000)
+
+    assert limiter.stats()["failures"] == 1
+    assert limiter._tokens.level == pytest.approx(10_000, abs=5)
+
+
+@pytest.mark.parametrize("error, retryable", [
+    (httpx.RemoteProtocolError("peer closed connection"), True),
+    (httpx.ReadError("connection reset"), True),
+    (httpx.ReadTimeout("timed out"), True),
+    (httpx.UnsupportedProtocol("no scheme"), False),
+    (ValueError("bad request body"), False),
+])
+def test_mid_stream_transport_errors_are_retryable(error, retryable):
+    assert rate_limiter.is_retryable(error) is retryable
@@ -0,0 +1,68 @@
+"""
+Response cache scoping: a cached response is only reused by a retry of
+the same manifest slot, never by another week or practice that happens to
+send the same prompt.
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# The creator talks to the API through the anthropic SDK
+pytest.importorskip("anthropic")
+
+from create_weekly_batch_v2 import DEFAULT_STYLE
+
+
+def _week_texts(batches_path: Path, week_start: str, creator) -> dict:
+    """Generated post and blog text of a published week, by manifest slot."""
+    manifest = creator.load_week_manifest(datetime.fromisoformat(week_start), batches_path)
+    texts = {}
+    for slot in manifest.slots():
+        if slot["kind"] == "social":
+            texts[slot["id"]] = manifest.output_path(slot).read_text()
+        elif slot["kind"] == "blog":
+            texts[slot["id"]] = "".join(p.read_text() for p in sorted(manifest.output_path(slot).glob("*.md")))
+    return texts
+
+
+def test_same_theme_weeks_get_fresh_responses(creator, tmp_path):
+    batches = tmp_path / "batches"
+    schedule = [{"day": "Monday", "platform": "Instagram"}, {"day": "Tuesday", "platform": "Facebook"}]
+
+    for week_start in ("2025-11-10", "2025-11-17"):
+        creator.create_headless_batch(
+            week_start, "Sleep Health", dict(DEFAULT_STYLE), api_key="test",
+            with_blog=True, schedule=schedule, batches_path=batches
+        )
+
+    first = _week_texts(batches, "2025-11-10", creator)
+    second = _week_texts(batches, "2025-11-17", creator)
+
+    assert first.keys() == second.keys() and "blog" in first
+    for slot_id in first:
+        assert first[slot_id] != second[slot_id], f"{slot_id} reused the other week's response"
+
+    # Every post and blog of both weeks came from its own API call
+    assert creator.client_provider.client.messages.calls == 2 * (len(schedule) + 1)
+
+
+def test_retry_of_same_slot_is_served_from_cache(creator, tmp_path):
+    batches = tmp_path / "batches"
+    creator.create_headless_batch(
+        "2025-11-10", "Sleep Health", dict(DEFAULT_STYLE), api_key="test", batches_path=batches
+    )
+    manifest = creator.load_week_manifest(datetime(2025, 11, 10), batches)
+    messages = creator.client_provider.client.messages
+    calls = messages.calls
+
+    scope = creator.job_cache_scope(manifest, "social-1")
+    prompt = creator.build_social_prompt(manifest.get_slot("social-1")["angle"], "Sleep Health", "Instagram")
+    first = creator._generate(prompt, 100, "test", cache_scope=scope)
+    again = creator._generate(prompt, 100, "test", cache_scope=scope)
+    other_slot = creator._generate(prompt, 100, "test", cache_scope=dict(scope, slot="social-2"))
+
+    assert again["text"] == first["text"] and again["usage"]["cached"]
+    assert other_slot["text"] != first["text"]
+    assert messages.calls == calls + 2
@@ -0,0 +1,30 @@
+"""
+Sharded runner planning: the workers' in-flight calls together stay
+within the global concurrency cap.
+"""
+
+import pytest
+
+# Workers build creators, which talk to the API through the anthropic SDK
+pytest.importorskip("anthropic")
+
+from sharded_runner import plan_workers
+
+
+@pytest.mark.parametrize("workers, max_concurrency, job_count, expected", [
+    (16, 4, 100, (4, 1)),
+    (4, 16, 100, (4, 4)),
+    (4, 9, 100, (4, 2)),
+    (8, 16, 3, (3, 5)),
+    (8, 16, 0, (1, 16)),
+    (0, 16, 10, (1, 16)),
+])
+def test_plan_workers(workers, max_concurrency, job_count, expected):
+    assert plan_workers(workers, max_concurrency, job_count) == expected
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3, 7, 16, 64])
+@pytest.mark.parametrize("max_concurrency", [1, 2, 4, 9, 16])
+def test_workers_never_exceed_global_cap(workers, max_concurrency):
+    planned, per_worker = plan_workers(workers, max_concurrency, 100)
+    assert planned * per_worker <= max_concurrency
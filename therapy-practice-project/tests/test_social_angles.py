@@ -0,0 +1,75 @@
+"""
+Angle drawing: reservations are per practice, a pool that runs dry is
+recorded in the manifest, and near duplicates are only filtered in block
+mode.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+# The creator talks to the API through the anthropic SDK
+pytest.importorskip("anthropic")
+
+from conftest import CountingMessages, fake_usage
+from create_weekly_batch_v2 import DEFAULT_STYLE, FIXED_ANGLE_TEMPLATES
+
+POOL = [
+    "Sleep tips for busy parents",
+    "Why your brain needs a wind-down routine",
+    "Myths about catching up on sleep",
+]
+
+
+class AngleMessages(CountingMessages):
+    """Messages double answering angle pool prompts with POOL."""
+
+    def create(self, **request):
+        if request["messages"][0]["content"].startswith("Suggest "):
+            text = "\n".join(POOL)
+            return SimpleNamespace(content=[SimpleNamespace(type="text", text=text)], usage=fake_usage())
+        return super().create(**request)
+
+
+def test_practices_draw_angles_independently(make_creator):
+    creator = make_creator(AngleMessages(), fixed_angles=False, duplicate_angles="off")
+
+    first = creator.generate_social_angles("Sleep", 3, "test", practice="a")
+    other_practice = creator.generate_social_angles("Sleep", 3, "test", practice="b")
+    same_practice = creator.generate_social_angles("Sleep", 3, "test", practice="a")
+
+    assert first == other_practice == POOL
+    assert not set(first) & set(same_practice)
+    assert same_practice == [t.format(theme="Sleep") for t in FIXED_ANGLE_TEMPLATES[:3]]
+
+
+@pytest.mark.parametrize("archive_format", [None, "tar", "zip"])
+def test_pool_running_dry_is_recorded_in_manifest(make_creator, tmp_path, archive_format):
+    creator = make_creator(AngleMessages(), fixed_angles=False, duplicate_angles="off",
+                           archive_format=archive_format)
+    schedule = [{"day": "Monday", "platform": "Instagram"}] * 15
+
+    creator.create_headless_batch(
+        "2025-11-10", "Sleep", dict(DEFAULT_STYLE), api_key="test",
+        schedule=schedule, batches_path=tmp_path / "batches"
+    )
+
+    manifest = creator.load_week_manifest(datetime(2025, 11, 10), tmp_path / "batches")
+    filled = len(POOL) + len(FIXED_ANGLE_TEMPLATES)
+    assert len(manifest.slots("social")) == filled
+    assert len(manifest.unfilled_slots) == 15 - filled
+    assert manifest.unfilled_slots[0]["day"] == "Monday"
+
+
+@pytest.mark.parametrize("mode, expected", [
+    ("flag", POOL),
+    ("block", POOL[1:]),
+])
+def test_near_duplicates_are_only_filtered_in_block_mode(make_creator, mode, expected):
+    creator = make_creator(AngleMessages(), fixed_angles=False, duplicate_angles=mode)
+    creator.near_duplicates.add("library/old-post.md", "Sleep tips for busy parents!")
+
+    angles = creator.generate_social_angles("Sleep", 3, "test")
+
+    assert angles[:len(expected)] == expected
@@ -0,0 +1,94 @@
+"""
+Streamed blog usage: a post that took several streams (a dropped stream
+and its retry) is recorded with the usage of all of them, not just the
+last one.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+# The creator talks to the API through the anthropic SDK
+pytest.importorskip("anthropic")
+
+import rate_limiter
+from conftest import fake_usage
+from create_weekly_batch_v2 import DEFAULT_STYLE
+
+CHUNK = "Sleep is built on routine. "
+
+
+class DroppingStream:
+    """Stream double sending a few chunks, then dropping or finishing."""
+
+    def __init__(self, drop: bool):
+        self.drop = drop
+        self.current_message_snapshot = SimpleNamespace(usage=fake_usage(1_000, 1))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    @property
+    def text_stream(self):
+        for _ in range(4):
+            yield CHUNK
+        if self.drop:
+            raise ConnectionError("stream dropped")
+
+    def get_final_message(self):
+        return SimpleNamespace(usage=fake_usage(1_200, 300), content=[])
+
+
+class StreamingMessages:
+    """Messages API double whose first ``drops`` streams drop part way."""
+
+    def __init__(self, drops: int):
+        self.drops = drops
+        self.streams = 0
+
+    def stream(self, **request):
+        self.streams += 1
+        return DroppingStream(drop=self.streams <= self.drops)
+
+
+@pytest.fixture(autouse=True)
+def retry_immediately(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "is_retryable", lambda error: True)
+    monkeypatch.setattr(rate_limiter.time, "sleep", lambda seconds: None)
+
+
+def test_retried_stream_usage_is_summed(make_creator, tmp_path):
+    creator = make_creator(StreamingMessages(drops=1), stream_blog=True)
+    week_folder = tmp_path / "week"
+    week_folder.mkdir()
+
+    blog_folder = creator.stream_blog_post("Sleep Health", dict(DEFAULT_STYLE), "test", week_folder)
+
+    assert creator.client_provider.client.messages.streams == 2
+    # The retry continued the dropped stream's text
+    assert "".join(p.read_text() for p in blog_folder.glob("*.md")).count(CHUNK.strip()) == 8
+
+    dropped_output = rate_limiter.estimate_tokens(CHUNK * 4)
+    usage = creator.usage_stats()
+    assert usage["input_tokens"] == 1_000 + 1_200
+    assert usage["output_tokens"] == dropped_output + 300
+
+    totals = creator.usage_ledger.run_totals()
+    assert totals["calls"] == 1
+    assert totals["input_tokens"] == 1_000 + 1_200
+
+
+def test_failed_stream_usage_is_still_recorded(make_creator, tmp_path):
+    creator = make_creator(StreamingMessages(drops=10), stream_blog=True)
+    creator.rate_limiter.max_retries = 1
+    week_folder = tmp_path / "week"
+    week_folder.mkdir()
+
+    with pytest.raises(ConnectionError):
+        creator.stream_blog_post("Sleep Health", dict(DEFAULT_STYLE), "test", week_folder)
+
+    assert creator.usage_stats()["input_tokens"] == 2 * 1_000
+    assert creator.usage_ledger.run_totals()["input_tokens"] == 2 * 1_000
@@ -0,0 +1,101 @@
+"""
+Staged week publishing: a week only appears once it is complete, a
+crashed run's staging folder is picked up again, and archived weeks are
+unpacked for re-runs.
+"""
+
+import pytest
+
+from week_writer import WeekWriter, published_weeks
+
+
+def test_week_is_published_on_commit(tmp_path):
+    writer = WeekWriter(tmp_path / "2025-week-46")
+    staging = writer.begin()
+    (staging / "post.md").write_text("New")
+
+    assert staging.name == ".2025-week-46.staging"
+    assert not writer.week_folder.exists()
+
+    assert writer.commit() == writer.week_folder
+    assert (writer.week_folder / "post.md").read_text() == "New"
+    assert [p.name for p in tmp_path.iterdir()] == ["2025-week-46"]
+
+
+def test_republishing_replaces_the_week(tmp_path):
+    writer = WeekWriter(tmp_path / "2025-week-46")
+    (writer.begin() / "post.md").write_text("Old")
+    writer.commit()
+
+    staging = writer.begin()
+    assert (staging / "post.md").read_text() == "Old"
+    (staging / "post.md").write_text("New")
+    writer.commit()
+
+    assert (writer.week_folder / "post.md").read_text() == "New"
+    assert [p.name for p in tmp_path.iterdir()] == ["2025-week-46"]
+
+
+def test_crashed_staging_folder_is_reused(tmp_path):
+    writer = WeekWriter(tmp_path / "2025-week-46")
+    (writer.begin() / "post-1.md").write_text("Saved before the crash")
+
+    staging = WeekWriter(tmp_path / "2025-week-46").begin()
+    assert (staging / "post-1.md").read_text() == "Saved before the crash"
+
+
+def test_crash_between_renames_is_recovered(tmp_path):
+    writer = WeekWriter(tmp_path / "2025-week-46")
+    (writer.begin() / "post.md").write_text("Old")
+    writer.commit()
+    (writer.begin() / "post.md").write_text("New")
+
+    # Old week moved aside, staging not yet renamed into place
+    writer.week_folder.rename(writer._old_folder)
+    WeekWriter(tmp_path / "2025-week-46").begin()
+
+    assert (writer.week_folder / "post.md").read_text() == "New"
+    assert not writer._old_folder.exists()
+
+
+@pytest.mark.parametrize("archive_format", ["tar", "zip"])
+def test_archived_week_is_unpacked_for_reruns(tmp_path, archive_format):
+    writer = WeekWriter(tmp_path / "2025-week-46", archive_format)
+    (writer.begin() / "post.md").write_text("Archived")
+
+    assert writer.commit() == writer.archive_path
+    assert not writer.staging_folder.exists() and not writer.week_folder.exists()
+
+    staging = WeekWriter(tmp_path / "2025-week-46", archive_format).begin()
+    assert (staging / "post.md").read_text() == "Archived"
+
+
+@pytest.mark.parametrize("archive_format", ["tar", "zip"])
+def test_archived_week_is_read_without_unpacking(tmp_path, archive_format):
+    writer = WeekWriter(tmp_path / "2025-week-46", archive_format)
+    staging = writer.begin()
+    (staging / "images").mkdir()
+    (staging / "images" / "post.png").write_bytes(b"png")
+    (staging / "post.md").write_text("Archived")
+    writer.commit()
+
+    published = WeekWriter.for_published(writer.archive_path)
+    assert published.week_folder == writer.week_folder
+    assert published.published_files() == ["images/post.png", "post.md"]
+    assert published.read_published("post.md") == b"Archived"
+    assert published.read_published("missing.md") is None
+    assert not writer.staging_folder.exists()
+
+
+def test_published_weeks_lists_archives_and_skips_staging(tmp_path):
+    (WeekWriter(tmp_path / "2025-week-47").begin() / "post.md").write_text("Staged")
+    folder = WeekWriter(tmp_path / "2025-week-46")
+    (folder.begin() / "post.md").write_text("Published")
+    folder.commit()
+    archived = WeekWriter(tmp_path / "2025-week-45", "zip")
+    (archived.begin() / "post.md").write_text("Archived")
+    archived.commit()
+    (tmp_path / ".2025-week-44.old").mkdir()
+    (tmp_path / "notes.txt").write_text("Not a week")
+
+    assert [path.name for path in published_weeks(tmp_path)] == ["2025-week-45.zip", "2025-week-46"]
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Usage Ledger
+
+Token usage, latency and estimated cost of every generation call, so spend
+can be rolled up per post, per week, per practice and per run. Each call
+is one row tagged with the run it was made in; calls answered from the
+response cache cost nothing and are not recorded.
+
+Location:
+    .cache/usage_ledger.db   (the only record of past spend - keep it if
+                              cost history matters)
+
+Usage:
+    python usage_ledger.py                 # totals per practice
+    python usage_ledger.py --by week       # totals per week folder
+    python usage_ledger.py --by run
+"""
+
+import argparse
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS calls (
+    id                           INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id                       TEXT NOT NULL,
+    recorded                     TEXT NOT NULL,
+    practice                     TEXT,
+    week                         TEXT,
+    kind                         TEXT NOT NULL,
+    path                         TEXT,
+    model                        TEXT,
+    batch                        INTEGER NOT NULL DEFAULT 0,
+    input_tokens                 INTEGER NOT NULL DEFAULT 0,
+    output_tokens                INTEGER NOT NULL DEFAULT 0,
+    cache_creation_input_tokens  INTEGER NOT NULL DEFAULT 0,
+    cache_read_input_tokens      INTEGER NOT NULL DEFAULT 0,
+    latency_seconds              REAL,
+    cost_usd                     REAL
+);
+CREATE INDEX IF NOT EXISTS idx_calls_week ON calls (week);
+CREATE INDEX IF NOT EXISTS idx_calls_practice ON calls (practice);
+CREATE INDEX IF NOT EXISTS idx_calls_run ON calls (run_id);
+"""
+
+# Token counts reported in a response's usage
+USAGE_FIELDS = [
+    "input_tokens", "output_tokens", "cache_creation_input_tokens", "cache_read_input_tokens"
+]
+
+# USD per million tokens (input, output, cache write, cache read); update
+# when pricing changes. Calls to models not listed have no cost estimate.
+MODEL_PRICES = {
+    "claude-sonnet-4-20250514": {
+        "input_tokens": 3.00,
+        "output_tokens": 15.00,
+        "cache_creation_input_tokens": 3.75,
+        "cache_read_input_tokens": 0.30
+    }
+}
+
+# Message Batches API calls are billed at half price
+BATCH_DISCOUNT = 0.5
+
+# Columns totals() can group by
+GROUPINGS = {"practice": "practice", "week": "week", "run": "run_id", "kind": "kind"}
+
+# Shown for calls without a practice (default weekly-batches/, or angle pools
+# shared by every practice) or without a week (angle pools)
+UNGROUPED_LABELS = {"practice": "(default/shared)", "week": "(no week)"}
+
+
+def estimate_cost(usage: Dict, model: str, batch: bool = False) -> Optional[float]:
+    """Estimated USD cost of a call's token usage (None for models without prices)."""
+    prices = MODEL_PRICES.get(model)
+    if prices is None:
+        return None
+    cost = sum(usage.get(field, 0) * prices[field] for field in USAGE_FIELDS) / 1_000_000
+    return round(cost * (BATCH_DISCOUNT if batch else 1), 6)
+
+
+def call_usage(usage, model: str, latency_seconds: Optional[float] = None, batch: bool = False) -> Dict:
+    """
+    Usage record for one API call (as stored in _meta.json files).
+
+    Args:
+        usage: The response's usage object
+        model: Model the call was made to
+        latency_seconds: Time the call took (None for batch results)
+        batch: Whether the call went through the Message Batches API
+    """
+    record = {field: int(getattr(usage, field, 0) or 0) for field in USAGE_FIELDS}
+    record.update({
+        "model": model,
+        "batch": batch,
+        "latency_seconds": round(latency_seconds, 3) if latency_seconds is not None else None,
+        "cost_usd": estimate_cost(record, model, batch)
+    })
+    return record
+
+
+def format_totals(totals: Dict) -> str:
+    """One-line call/token/cost summary for a totals() row."""
+    tokens = sum(totals[field] for field in USAGE_FIELDS)
+    text = f"{totals['calls']} call(s), {tokens:,} tokens ({totals['output_tokens']:,} output), ${totals['cost_usd']:.4f}"
+    if totals.get("avg_latency_seconds"):
+        text += f", {totals['avg_latency_seconds']:.1f}s avg"
+    return text
+
+
+class UsageLedger:
+    """Thread-safe SQLite ledger of generation calls."""
+
+    def __init__(self, db_path: Path = None, run_id: Optional[str] = None):
+        """
+        Open (and create if needed) the ledger.
+
+        Args:
+            db_path: Database file (defaults to .cache/usage_ledger.db)
+            run_id: Id calls of this run are tagged with (a new one by default)
+        """
+        if db_path is None:
+            db_path = Path(__file__).parent / ".cache" / "usage_ledger.db"
+
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.run_id = run_id or f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+
+        # Shared by worker threads; the timeout covers sharded runs
+        self._conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def record(
+        self,
+        usage: Dict,
+        kind: str,
+        practice: Optional[str] = None,
+        week: Optional[str] = None,
+        path: Optional[str] = None
+    ) -> None:
+        """
+        Add one call to the ledger.
+
+        Args:
+            usage: Usage record from call_usage()
+            kind: What the call generated ('social', 'blog', 'angles')
+            practice: Practice the content is for
+            week: Week folder (as stored in the content catalog)
+            path: Generated file or folder (as stored in the content catalog)
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT INTO calls (run_id, recorded, practice, week, kind, path, model, batch, "
+                f"{', '.join(USAGE_FIELDS)}, latency_seconds, cost_usd) "
+                f"VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.run_id, datetime.now().isoformat(), practice, week, kind, path,
+                 usage.get("model"), int(bool(usage.get("batch"))),
+                 *(usage.get(field, 0) for field in USAGE_FIELDS),
+                 usage.get("latency_seconds"), usage.get("cost_usd"))
+            )
+
+    def totals(
+        self,
+        by: Optional[str] = None,
+        week: Optional[str] = None,
+        run_id: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Call count, token sums, cost and average latency.
+
+        Args:
+            by: Group by 'practice', 'week', 'run' or 'kind' (one overall row if None)
+            week: Only calls for this week folder
+            run_id: Only calls made in this run
+
+        Returns:
+            Rows with the grouping column (if any), calls, token fields,
+            cost_usd and avg_latency_seconds, most expensive first
+        """
+        column = GROUPINGS[by] if by else None
+        clauses, params = [], []
+        if week:
+            clauses.append("week = ?")
+            params.append(week)
+        if run_id:
+            clauses.append("run_id = ?")
+            params.append(run_id)
+
+        query = (
+            f"SELECT {column + ' AS ' + by + ', ' if column else ''}COUNT(*) AS calls, "
+            + ", ".join(f"COALESCE(SUM({field}), 0) AS {field}" for field in USAGE_FIELDS)
+            + ", COALESCE(SUM(cost_usd), 0) AS cost_usd, AVG(latency_seconds) AS avg_latency_seconds FROM calls"
+        )
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        if column:
+            query += f" GROUP BY {column} ORDER BY cost_usd DESC"
+
+        with self._lock:
+            rows = [dict(row) for row in self._conn.execute(query, params).fetchall()]
+        return [row for row in rows if row["calls"]]
+
+    def run_totals(self) -> Optional[Dict]:
+        """Totals for this run's calls, or None if it made none."""
+        rows = self.totals(run_id=self.run_id)
+        return rows[0] if rows else None
+
+
+def main():
+    """CLI interface."""
+
+    parser = argparse.ArgumentParser(description="Show generation token usage and cost")
+    parser.add_argument("--by", choices=list(GROUPINGS), default="practice", help="Group totals by (default: practice)")
+    parser.add_argument("--week", help="Only this week folder (e.g. weekly-batches/2025-week-46)")
+
+    args = parser.parse_args()
+
+    ledger = UsageLedger()
+    try:
+        overall = ledger.totals(week=args.week)
+        if not overall:
+            print("No generation calls recorded yet")
+            return
+
+        print(f"💵 Generation usage by {args.by}:")
+        for row in ledger.totals(by=args.by, week=args.week):
+            print(f"  {row[args.by] or UNGROUPED_LABELS.get(args.by, '(none)')}: {format_totals(row)}")
+        print(f"\n  Total: {format_totals(overall[0])}")
+    finally:
+        ledger.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Staged Week Writer
+
+A week's batch is written into a hidden staging folder next to its final
+location (weekly-batches/.2025-week-46.staging/) and only moved into place
+once everything is saved. Every staged file is fsynced in one pass at the
+end, then the folder is renamed to weekly-batches/2025-week-46, so readers
+never see a half-written week and a crash leaves the previous version of
+the week untouched. A crashed run's staging folder (and its batch
+manifest) is picked up again by the next run of the same week.
+
+Instead of a folder, a week can be published as a single archive
+(2025-week-46.tar.gz or 2025-week-46.zip) for shipping batches elsewhere.
+Re-running an archived week unpacks the archive into staging first, so
+only missing posts are regenerated.
+"""
+
+import os
+import shutil
+import tarfile
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import List, Optional
+
+# Archive formats and their file suffixes
+ARCHIVE_FORMATS = {
+    "tar": ".tar.gz",
+    "zip": ".zip"
+}
+
+STAGING_SUFFIX = ".staging"
+OLD_SUFFIX = ".old"
+
+
+def published_weeks(batches_folder: Path) -> List[Path]:
+    """
+    Published weeks in a batches folder, sorted by week name.
+
+    Week folders and week archives are listed; hidden staging, old and
+    temporary entries of an unfinished publish are skipped.
+
+    Returns:
+        Week folders and archive files
+    """
+    weeks = []
+    for path in batches_folder.iterdir():
+        if path.name.startswith("."):
+            continue
+        if path.is_dir() or (path.is_file() and path.name.endswith(tuple(ARCHIVE_FORMATS.values()))):
+            weeks.append(path)
+    return sorted(weeks, key=lambda path: WeekWriter.for_published(path).week_folder.name)
+
+
+def _fsync_path(path: Path, directory: bool = False) -> None:
+    """fsync a file or directory (directories are skipped where unsupported)."""
+    try:
+        fd = os.open(path, os.O_RDONLY | (getattr(os, "O_DIRECTORY", 0) if directory else 0))
+    except OSError:
+        if directory:
+            return
+        raise
+    try:
+        os.fsync(fd)
+    except OSError:
+        if not directory:
+            raise
+    finally:
+        os.close(fd)
+
+
+class WeekWriter:
+    """Stages one week folder and publishes it atomically (or as an archive)."""
+
+    def __init__(self, week_folder: Path, archive_format: Optional[str] = None):
+        """
+        Initialize the writer.
+
+        Args:
+            week_folder: Final week folder (e.g. weekly-batches/2025-week-46)
+            archive_format: Publish as a 'tar' (.tar.gz) or 'zip' archive
+                instead of a folder
+        """
+        if archive_format is not None and archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(
+                f"Unknown archive format '{archive_format}' (choose from {', '.join(ARCHIVE_FORMATS)})"
+            )
+
+        self.week_folder = week_folder
+        self.archive_format = archive_format
+        self.staging_folder = week_folder.parent / f".{week_folder.name}{STAGING_SUFFIX}"
+        self._old_folder = week_folder.parent / f".{week_folder.name}{OLD_SUFFIX}"
+
+    @classmethod
+    def for_published(cls, path: Path) -> 'WeekWriter':
+        """Writer for a published week folder or archive (see published_weeks)."""
+        for archive_format, suffix in ARCHIVE_FORMATS.items():
+            if path.name.endswith(suffix) and not path.is_dir():
+                return cls(path.parent / path.name[:-len(suffix)], archive_format)
+        return cls(path)
+
+    @property
+    def archive_path(self) -> Optional[Path]:
+        """Archive the week is published as, or None in folder mode."""
+        if self.archive_format is None:
+            return None
+        return self.week_folder.parent / f"{self.week_folder.name}{ARCHIVE_FORMATS[self.archive_format]}"
+
+    @property
+    def output_path(self) -> Path:
+        """Where the published week ends up (folder or archive)."""
+        return self.archive_path or self.week_folder
+
+    def begin(self) -> Path:
+        """
+        Prepare the staging folder.
+
+        A staging folder left by a crashed run is reused as is. Otherwise it
+        starts as a copy of the published week (folder or archive), if any.
+
+        Returns:
+            Staging folder to write the week into
+        """
+        self._recover()
+
+        if not self.staging_folder.exists():
+            if self.week_folder.is_dir():
+                shutil.copytree(self.week_folder, self.staging_folder)
+            elif self.archive_path and self.archive_path.exists():
+                self._unpack_archive()
+            else:
+                self.staging_folder.mkdir(parents=True)
+
+        return self.staging_folder
+
+    def final_path(self, path: Path) -> Path:
+        """Path a staged file will have once the week is published as a folder."""
+        try:
+            return self.week_folder / Path(path).relative_to(self.staging_folder)
+        except ValueError:
+            return Path(path)
+
+    def commit(self) -> Path:
+        """
+        Flush the staged week to disk and publish it.
+
+        Returns:
+            Published week folder or archive
+        """
+        self._fsync_staging()
+
+        if self.archive_format:
+            self._write_archive()
+            shutil.rmtree(self.staging_folder)
+            return self.archive_path
+
+        if self.week_folder.exists():
+            os.rename(self.week_folder, self._old_folder)
+        os.rename(self.staging_folder, self.week_folder)
+        _fsync_path(self.week_folder.parent, directory=True)
+
+        if self._old_folder.exists():
+            shutil.rmtree(self._old_folder)
+        return self.week_folder
+
+    def published_files(self) -> List[str]:
+        """Files of the published week (folder or archive) as relative POSIX paths."""
+        if self.archive_path is None:
+            if not self.week_folder.is_dir():
+                return []
+            return sorted(path.relative_to(self.week_folder).as_posix()
+                          for path in self.week_folder.rglob("*") if path.is_file())
+
+        if not self.archive_path.exists():
+            return []
+        prefix = f"{self.week_folder.name}/"
+        if self.archive_format == "tar":
+            with tarfile.open(self.archive_path, "r:gz") as archive:
+                names = [member.name for member in archive.getmembers() if member.isfile()]
+        else:
+            with zipfile.ZipFile(self.archive_path) as archive:
+                names = [name for name in archive.namelist() if not name.endswith("/")]
+        return sorted(name[len(prefix):] for name in names if name.startswith(prefix))
+
+    def read_published(self, name: str) -> Optional[bytes]:
+        """
+        Read one file of the published week without unpacking an archive.
+
+        Args:
+            name: Path relative to the week folder (e.g. batch_manifest.json)
+
+        Returns:
+            File contents, or None if the week or file does not exist
+        """
+        if self.archive_path is None:
+            try:
+                return (self.week_folder / name).read_bytes()
+            except OSError:
+                return None
+
+        member = f"{self.week_folder.name}/{name}"
+        try:
+            if self.archive_format == "tar":
+                with tarfile.open(self.archive_path, "r:gz") as archive:
+                    extracted = archive.extractfile(member)
+                    return extracted.read() if extracted else None
+            with zipfile.ZipFile(self.archive_path) as archive:
+                return archive.read(member)
+        except (OSError, KeyError, tarfile.TarError, zipfile.BadZipFile):
+            return None
+
+    def _recover(self) -> None:
+        """Finish a folder swap that a crash interrupted."""
+        if not self._old_folder.exists():
+            return
+
+        if not self.week_folder.exists():
+            # Crashed between the two renames: staging is the complete new week
+            if self.staging_folder.exists():
+                os.rename(self.staging_folder, self.week_folder)
+            else:
+                os.rename(self._old_folder, self.week_folder)
+                return
+        shutil.rmtree(self._old_folder)
+
+    def _fsync_staging(self) -> None:
+        """fsync every staged file and folder in one pass."""
+        for folder, _, files in os.walk(self.staging_folder):
+            for name in files:
+                _fsync_path(Path(folder) / name)
+            _fsync_path(Path(folder), directory=True)
+
+    def _write_archive(self) -> None:
+        """Write the staging folder to the archive (atomically replacing an old one)."""
+        fd, tmp_name = tempfile.mkstemp(dir=self.week_folder.parent, prefix=f".{self.week_folder.name}", suffix=".tmp")
+        os.close(fd)
+        try:
+            if self.archive_format == "tar":
+                with tarfile.open(tmp_name, "w:gz") as archive:
+                    archive.add(self.staging_folder, arcname=self.week_folder.name)
+            else:
+                with zipfile.ZipFile(tmp_name, "w", zipfile.ZIP_DEFLATED) as archive:
+                    for folder, _, files in os.walk(self.staging_folder):
+                        for name in sorted(files):
+                            path = Path(folder) / name
+                            arcname = Path(self.week_folder.name) / path.relative_to(self.staging_folder)
+                            archive.write(path, arcname.as_posix())
+            _fsync_path(Path(tmp_name))
+            os.replace(tmp_name, self.archive_path)
+            _fsync_path(self.week_folder.parent, directory=True)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _unpack_archive(self) -> None:
+        """Unpack the published archive into the staging folder."""
+        unpack_folder = Path(tempfile.mkdtemp(dir=self.week_folder.parent, prefix=f".{self.week_folder.name}"))
+        try:
+            if self.archive_format == "tar":
+                with tarfile.open(self.archive_path, "r:gz") as archive:
+                    if hasattr(tarfile, "data_filter"):
+                        archive.extractall(unpack_folder, filter="data")
+                    else:
+                        archive.extractall(unpack_folder)
+            else:
+                with zipfile.ZipFile(self.archive_path) as archive:
+                    archive.extractall(unpack_folder)
+
+            unpacked = unpack_folder / self.week_folder.name
+            if unpacked.is_dir():
+                os.rename(unpacked, self.staging_folder)
+            else:
+                self.staging_folder.mkdir(parents=True)
+        finally:
+            shutil.rmtree(unpack_folder, ignore_errors=True)